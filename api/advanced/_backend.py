@@ -0,0 +1,33 @@
+"""
+Array backend selection for the advanced analytics modules
+Optional CuPy (GPU) path shared by indicators and multi-asset analysis
+"""
+
+try:
+    import cupy as cp
+    # CuPy imports without a GPU; the device query fails instead
+    HAS_CUPY = cp.cuda.runtime.getDeviceCount() > 0
+except Exception:
+    cp = None
+    HAS_CUPY = False
+
+# Below this input size the host-device copies cost more than the GPU saves
+GPU_MIN_BYTES = 1 << 20
+
+
+def use_cupy(backend: str, nbytes: int) -> bool:
+    """
+    Resolve a backend argument to whether the CuPy path should run
+
+    backend is "numpy", "cupy" (requires CuPy and a CUDA device) or
+    "auto", which picks the GPU for inputs larger than GPU_MIN_BYTES.
+    """
+    if backend == "numpy":
+        return False
+    if backend == "cupy":
+        if not HAS_CUPY:
+            raise ValueError("backend='cupy' requires CuPy and a CUDA device")
+        return True
+    if backend == "auto":
+        return HAS_CUPY and nbytes > GPU_MIN_BYTES
+    raise ValueError(f"Unknown backend: {backend}")
@@ -3,10 +3,25 @@ Custom Technical Indicators Framework
 Extensible system for technical indicators with TA-Lib integration
 """
 import numpy as np
-from typing import Dict, Any, List, Optional, Callable
+from typing import Dict, Any, List, Optional, Callable, Tuple
 from dataclasses import dataclass
 from enum import Enum
 import logging
+import math
+
+try:
+    import numba
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+try:
+    import bottleneck as bn
+    HAS_BOTTLENECK = True
+except ImportError:
+    HAS_BOTTLENECK = False
+
+from ._backend import HAS_CUPY, cp, use_cupy
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +45,386 @@ class IndicatorMetadata:
     outputs: List[str]
 
 
+def _as_float_array(values, dtype=np.float64) -> np.ndarray:
+    """Contiguous float view of an input series (copies only when needed)"""
+    return np.ascontiguousarray(values, dtype=dtype)
+
+
+def _float_dtype(dtype) -> np.dtype:
+    """Validate an indicator precision; only float32 and float64 are supported"""
+    dtype = np.dtype(dtype)
+    if dtype not in (np.float32, np.float64):
+        raise ValueError(f"Unsupported indicator dtype: {dtype} (use float32 or float64)")
+    return dtype
+
+
+# Loop kernels writing into a preallocated output; compiled with Numba when
+# available, plain Python otherwise
+
+def _sma_kernel(close, period, out):
+    # The running sum holds finite values only; a window with a NaN/inf is
+    # summed directly, so it stays NaN/inf without poisoning later windows
+    n = close.shape[0]
+    window_sum = 0.0
+    bad = 0
+    for i in range(n):
+        if np.isfinite(close[i]):
+            window_sum += close[i]
+        else:
+            bad += 1
+        if i >= period:
+            if np.isfinite(close[i - period]):
+                window_sum -= close[i - period]
+            else:
+                bad -= 1
+        if i < period - 1:
+            out[i] = np.nan
+        elif bad > 0:
+            direct = 0.0
+            for j in range(i - period + 1, i + 1):
+                direct += close[j]
+            out[i] = direct / period
+        else:
+            out[i] = window_sum / period
+
+
+def _ema_kernel(close, alpha, out):
+    n = close.shape[0]
+    if n == 0:
+        return
+    ema = close[0]
+    out[0] = ema
+    for i in range(1, n):
+        ema = alpha * close[i] + (1 - alpha) * ema
+        out[i] = ema
+
+
+def _rsi_window_direct(close, i, period):
+    # RSI of the window ending at delta i, summed from scratch
+    gain_sum = 0.0
+    loss_sum = 0.0
+    for j in range(i - period + 1, i + 1):
+        delta = close[j] - close[j - 1]
+        if delta > 0:
+            gain_sum += delta
+        elif delta < 0:
+            loss_sum -= delta
+    avg_gain = gain_sum / period
+    avg_loss = loss_sum / period
+    rs = avg_gain / (avg_loss if avg_loss != 0 else 1e-10)
+    return 100 - (100 / (1 + rs))
+
+
+def _rsi_kernel(close, period, out):
+    # Simple (not Wilder) averages of the last `period` gains and losses.
+    # Nonzero counts keep an all-flat side exactly zero despite running-sum
+    # drift. NaN deltas count as neither gain nor loss; infinite ones stay out
+    # of the running sums and their windows are summed directly instead
+    n = close.shape[0]
+    gain_sum = 0.0
+    loss_sum = 0.0
+    gain_count = 0
+    loss_count = 0
+    bad = 0
+    for i in range(min(period, n)):
+        out[i] = np.nan
+    for i in range(1, n):
+        delta = close[i] - close[i - 1]
+        if np.isinf(delta):
+            bad += 1
+        elif delta > 0:
+            gain_sum += delta
+            gain_count += 1
+        elif delta < 0:
+            loss_sum -= delta
+            loss_count += 1
+        if i > period:
+            old = close[i - period] - close[i - period - 1]
+            if np.isinf(old):
+                bad -= 1
+            elif old > 0:
+                gain_sum -= old
+                gain_count -= 1
+            elif old < 0:
+                loss_sum += old
+                loss_count -= 1
+        if i >= period:
+            if bad > 0:
+                out[i] = _rsi_window_direct(close, i, period)
+                continue
+            avg_gain = gain_sum / period if gain_count > 0 else 0.0
+            avg_loss = loss_sum / period if loss_count > 0 else 0.0
+            rs = avg_gain / (avg_loss if avg_loss != 0 else 1e-10)
+            out[i] = 100 - (100 / (1 + rs))
+
+
+def _rolling_std_kernel(close, period, out):
+    # Population std of each full window; two passes per window for accuracy
+    n = close.shape[0]
+    for i in range(min(period - 1, n)):
+        out[i] = 0.0
+    for i in range(period - 1, n):
+        mean = 0.0
+        for j in range(i - period + 1, i + 1):
+            mean += close[j]
+        mean /= period
+        sq = 0.0
+        for j in range(i - period + 1, i + 1):
+            d = close[j] - mean
+            sq += d * d
+        out[i] = np.sqrt(sq / period)
+
+
+def _atr_kernel(high, low, close, period, out):
+    n = close.shape[0]
+    tr = np.empty(n)
+    tr[0] = high[0] - low[0]
+    for i in range(1, n):
+        hl = high[i] - low[i]
+        hc = abs(high[i] - close[i - 1])
+        lc = abs(low[i] - close[i - 1])
+        tr[i] = max(hl, hc, lc)
+    
+    # Seed with the mean of the first window, then Wilder-style smoothing
+    for i in range(period):
+        out[i] = np.nan
+    seed = 0.0
+    for i in range(period):
+        seed += tr[i]
+    out[period - 1] = seed / period
+    alpha = 1 / period
+    for i in range(period, n):
+        out[i] = alpha * tr[i] + (1 - alpha) * out[i - 1]
+
+
+def _fused_sma_ema_rsi_kernel(close, sma_period, ema_alpha, rsi_period, out_sma, out_ema, out_rsi):
+    # _sma_kernel, _ema_kernel and _rsi_kernel in one pass over close
+    n = close.shape[0]
+    window_sum = 0.0
+    bad = 0
+    ema = 0.0
+    gain_sum = 0.0
+    loss_sum = 0.0
+    gain_count = 0
+    loss_count = 0
+    rsi_bad = 0
+    for i in range(n):
+        x = close[i]
+        
+        if np.isfinite(x):
+            window_sum += x
+        else:
+            bad += 1
+        if i >= sma_period:
+            if np.isfinite(close[i - sma_period]):
+                window_sum -= close[i - sma_period]
+            else:
+                bad -= 1
+        if i < sma_period - 1:
+            out_sma[i] = np.nan
+        elif bad > 0:
+            direct = 0.0
+            for j in range(i - sma_period + 1, i + 1):
+                direct += close[j]
+            out_sma[i] = direct / sma_period
+        else:
+            out_sma[i] = window_sum / sma_period
+        
+        ema = x if i == 0 else ema_alpha * x + (1 - ema_alpha) * ema
+        out_ema[i] = ema
+        
+        if i < rsi_period:
+            out_rsi[i] = np.nan
+        if i == 0:
+            continue
+        delta = x - close[i - 1]
+        if np.isinf(delta):
+            rsi_bad += 1
+        elif delta > 0:
+            gain_sum += delta
+            gain_count += 1
+        elif delta < 0:
+            loss_sum -= delta
+            loss_count += 1
+        if i > rsi_period:
+            old = close[i - rsi_period] - close[i - rsi_period - 1]
+            if np.isinf(old):
+                rsi_bad -= 1
+            elif old > 0:
+                gain_sum -= old
+                gain_count -= 1
+            elif old < 0:
+                loss_sum += old
+                loss_count -= 1
+        if i >= rsi_period and rsi_bad > 0:
+            out_rsi[i] = _rsi_window_direct(close, i, rsi_period)
+        elif i >= rsi_period:
+            avg_gain = gain_sum / rsi_period if gain_count > 0 else 0.0
+            avg_loss = loss_sum / rsi_period if loss_count > 0 else 0.0
+            rs = avg_gain / (avg_loss if avg_loss != 0 else 1e-10)
+            out_rsi[i] = 100 - (100 / (1 + rs))
+
+
+if HAS_NUMBA:
+    # NaN/inf-safe fast-math flags (price series are unvalidated floats).
+    # No on-disk cache: this module is imported as both api.advanced.indicators
+    # and advanced.indicators, and a cache written under one name fails to
+    # load under the other; the warm-up below covers the first-call cost
+    _FASTMATH = {"reassoc", "contract", "arcp", "nsz", "afn"}
+    _sma_kernel = numba.njit(fastmath=_FASTMATH)(_sma_kernel)
+    _ema_kernel = numba.njit(fastmath=_FASTMATH)(_ema_kernel)
+    _rsi_window_direct = numba.njit(fastmath=_FASTMATH)(_rsi_window_direct)
+    _rsi_kernel = numba.njit(fastmath=_FASTMATH)(_rsi_kernel)
+    _rolling_std_kernel = numba.njit(fastmath=_FASTMATH)(_rolling_std_kernel)
+    _atr_kernel = numba.njit(fastmath=_FASTMATH)(_atr_kernel)
+    _fused_sma_ema_rsi_kernel = numba.njit(fastmath=_FASTMATH)(_fused_sma_ema_rsi_kernel)
+    # Compile at import rather than on the first indicator call
+    _warm = np.linspace(100.0, 115.0, 16)
+    _warm_out = np.empty(16)
+    _sma_kernel(_warm, 5, _warm_out)
+    _ema_kernel(_warm, 0.5, _warm_out)
+    _rsi_kernel(_warm, 5, _warm_out)
+    _rolling_std_kernel(_warm, 5, _warm_out)
+    _atr_kernel(_warm + 1.0, _warm - 1.0, _warm, 5, _warm_out)
+    _fused_sma_ema_rsi_kernel(_warm, 5, 0.5, 5, _warm_out, np.empty(16), np.empty(16))
+    del _warm, _warm_out
+
+
+def _rolling_mean(close: np.ndarray, period: int) -> np.ndarray:
+    """Mean of each full window, NaN before the first one"""
+    if (
+        HAS_BOTTLENECK
+        and close.dtype == np.float64
+        and period <= len(close)
+        and not np.isinf(close).any()
+    ):
+        # O(n) moving window in C; windows touching a NaN stay NaN. Its
+        # running sum has the input's precision, so float32 goes to the
+        # kernel, which accumulates in float64; an inf would poison the sum
+        # for the rest of the series, so that goes to the kernel too
+        return bn.move_mean(close, window=period, min_count=period)
+    out = np.empty(len(close), dtype=close.dtype)
+    _sma_kernel(close, period, out)
+    return out
+
+
+def _rolling_std(close: np.ndarray, period: int) -> np.ndarray:
+    """
+    Population std of each full window
+    
+    Kept on the two-pass kernel: bottleneck's move_std updates running sums
+    of squares, which loses about 1e-8 relative precision on price-level data.
+    """
+    out = np.empty(len(close), dtype=close.dtype)
+    _rolling_std_kernel(close, period, out)
+    return out
+
+
+def _rolling_mean_std_cupy(close: np.ndarray, period: int, with_std: bool = False):
+    """
+    Rolling mean (and std) on the GPU, NaN before the first full window
+    
+    Reduces over a strided window view rather than a running sum, so the
+    values agree with the CPU kernels to rounding.
+    """
+    mean = np.full(len(close), np.nan, dtype=close.dtype)
+    std = np.full(len(close), np.nan, dtype=close.dtype) if with_std else None
+    if period <= len(close):
+        windows = cp.lib.stride_tricks.sliding_window_view(cp.asarray(close), period)
+        mean[period - 1:] = cp.asnumpy(windows.mean(axis=1))
+        if with_std:
+            std[period - 1:] = cp.asnumpy(windows.std(axis=1))
+    return mean, std
+
+
+# Typed entry points: one indicator on bare arrays, without the registry,
+# an indicator instance or a data dict
+
+def calculate_sma(close, period: int = 20, dtype=np.float64, backend: str = "auto") -> np.ndarray:
+    """Simple Moving Average, NaN before the first full window"""
+    close = _as_float_array(close, _float_dtype(dtype))
+    if use_cupy(backend, close.nbytes):
+        return _rolling_mean_std_cupy(close, period)[0]
+    return _rolling_mean(close, period)
+
+
+def calculate_ema(close, period: int = 20, dtype=np.float64) -> np.ndarray:
+    """Exponential Moving Average seeded with the first close"""
+    close = _as_float_array(close, _float_dtype(dtype))
+    ema = np.empty(len(close), dtype=close.dtype)
+    _ema_kernel(close, 2 / (period + 1), ema)
+    return ema
+
+
+def calculate_rsi(close, period: int = 14, dtype=np.float64) -> np.ndarray:
+    """Relative Strength Index, NaN before the first full window"""
+    close = _as_float_array(close, _float_dtype(dtype))
+    rsi = np.empty(len(close), dtype=close.dtype)
+    _rsi_kernel(close, period, rsi)
+    return rsi
+
+
+def calculate_macd(
+    close,
+    fast_period: int = 12,
+    slow_period: int = 26,
+    signal_period: int = 9,
+    dtype=np.float64
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """MACD line, signal line and histogram"""
+    close = _as_float_array(close, _float_dtype(dtype))
+    
+    # Calculate fast and slow EMAs
+    fast_ema = np.empty(len(close), dtype=close.dtype)
+    slow_ema = np.empty(len(close), dtype=close.dtype)
+    _ema_kernel(close, 2 / (fast_period + 1), fast_ema)
+    _ema_kernel(close, 2 / (slow_period + 1), slow_ema)
+    
+    # MACD line
+    macd_line = fast_ema - slow_ema
+    
+    # Signal line (EMA of MACD)
+    signal_line = np.empty(len(close), dtype=close.dtype)
+    _ema_kernel(macd_line, 2 / (signal_period + 1), signal_line)
+    
+    return macd_line, signal_line, macd_line - signal_line
+
+
+def calculate_bbands(
+    close,
+    period: int = 20,
+    std_dev: float = 2.0,
+    dtype=np.float64,
+    backend: str = "auto"
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Upper, middle and lower Bollinger Bands"""
+    close = _as_float_array(close, _float_dtype(dtype))
+    
+    # Middle band (SMA) and rolling standard deviation
+    if use_cupy(backend, close.nbytes):
+        sma, std = _rolling_mean_std_cupy(close, period, with_std=True)
+    else:
+        sma = _rolling_mean(close, period)
+        std = _rolling_std(close, period)
+    
+    return sma + (std_dev * std), sma, sma - (std_dev * std)
+
+
+def calculate_atr(high, low, close, period: int = 14, dtype=np.float64) -> np.ndarray:
+    """Average True Range, NaN before the first full window"""
+    dtype = _float_dtype(dtype)
+    high = _as_float_array(high, dtype)
+    low = _as_float_array(low, dtype)
+    close = _as_float_array(close, dtype)
+    if len(close) < period:
+        raise ValueError(f"ATR needs at least {period} bars")
+    
+    # True Range, then its exponential average
+    atr = np.empty(len(close), dtype=dtype)
+    _atr_kernel(high, low, close, period, atr)
+    return atr
+
+
 class BaseIndicator:
     """Base class for all technical indicators"""
     
@@ -38,6 +433,9 @@ class BaseIndicator:
         self.category = category
         self.description = description
         self.parameters = {}
+        # Working and output precision; float32 halves memory traffic for
+        # callers whose tolerances allow it
+        self.dtype = np.dtype(np.float64)
     
     def calculate(self, data: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
         """
@@ -60,7 +458,7 @@ class BaseIndicator:
 class MovingAverage(BaseIndicator):
     """Simple Moving Average indicator"""
     
-    def __init__(self, period: int = 20):
+    def __init__(self, period: int = 20, dtype=np.float64, backend: str = "auto"):
         super().__init__(
             name="SMA",
             category=IndicatorCategory.TREND,
@@ -68,26 +466,22 @@ class MovingAverage(BaseIndicator):
         )
         self.period = period
         self.parameters = {"period": period}
+        self.dtype = _float_dtype(dtype)
+        self.backend = backend
     
     def calculate(self, data: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
         """Calculate SMA"""
         if not self.validate_data(data):
             raise ValueError("Invalid data: 'close' required")
         
-        close = data['close']
-        sma = np.convolve(close, np.ones(self.period)/self.period, mode='valid')
-        
-        # Pad with NaN for initial period
-        result = np.full(len(close), np.nan)
-        result[self.period-1:] = sma
-        
-        return {"sma": result}
+        # NaN for the initial period
+        return {"sma": calculate_sma(data['close'], self.period, self.dtype, self.backend)}
 
 
 class ExponentialMovingAverage(BaseIndicator):
     """Exponential Moving Average indicator"""
     
-    def __init__(self, period: int = 20):
+    def __init__(self, period: int = 20, dtype=np.float64):
         super().__init__(
             name="EMA",
             category=IndicatorCategory.TREND,
@@ -95,28 +489,20 @@ class ExponentialMovingAverage(BaseIndicator):
         )
         self.period = period
         self.parameters = {"period": period}
+        self.dtype = _float_dtype(dtype)
     
     def calculate(self, data: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
         """Calculate EMA"""
         if not self.validate_data(data):
             raise ValueError("Invalid data: 'close' required")
         
-        close = data['close']
-        alpha = 2 / (self.period + 1)
-        
-        ema = np.zeros(len(close))
-        ema[0] = close[0]
-        
-        for i in range(1, len(close)):
-            ema[i] = alpha * close[i] + (1 - alpha) * ema[i-1]
-        
-        return {"ema": ema}
+        return {"ema": calculate_ema(data['close'], self.period, self.dtype)}
 
 
 class RSI(BaseIndicator):
     """Relative Strength Index indicator"""
     
-    def __init__(self, period: int = 14):
+    def __init__(self, period: int = 14, dtype=np.float64):
         super().__init__(
             name="RSI",
             category=IndicatorCategory.MOMENTUM,
@@ -124,37 +510,21 @@ class RSI(BaseIndicator):
         )
         self.period = period
         self.parameters = {"period": period}
+        self.dtype = _float_dtype(dtype)
     
     def calculate(self, data: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
         """Calculate RSI"""
         if not self.validate_data(data):
             raise ValueError("Invalid data: 'close' required")
         
-        close = data['close']
-        deltas = np.diff(close)
-        
-        gains = np.where(deltas > 0, deltas, 0)
-        losses = np.where(deltas < 0, -deltas, 0)
-        
-        # Calculate average gains and losses
-        avg_gain = np.convolve(gains, np.ones(self.period)/self.period, mode='valid')
-        avg_loss = np.convolve(losses, np.ones(self.period)/self.period, mode='valid')
-        
-        # Calculate RS and RSI
-        rs = avg_gain / np.where(avg_loss == 0, 1e-10, avg_loss)
-        rsi = 100 - (100 / (1 + rs))
-        
-        # Pad with NaN
-        result = np.full(len(close), np.nan)
-        result[self.period:] = rsi
-        
-        return {"rsi": result}
+        # Average gains and losses over each window, NaN before the first
+        return {"rsi": calculate_rsi(data['close'], self.period, self.dtype)}
 
 
 class MACD(BaseIndicator):
     """Moving Average Convergence Divergence indicator"""
     
-    def __init__(self, fast_period: int = 12, slow_period: int = 26, signal_period: int = 9):
+    def __init__(self, fast_period: int = 12, slow_period: int = 26, signal_period: int = 9, dtype=np.float64):
         super().__init__(
             name="MACD",
             category=IndicatorCategory.MOMENTUM,
@@ -168,27 +538,16 @@ class MACD(BaseIndicator):
             "slow_period": slow_period,
             "signal_period": signal_period
         }
+        self.dtype = _float_dtype(dtype)
     
     def calculate(self, data: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
         """Calculate MACD"""
         if not self.validate_data(data):
             raise ValueError("Invalid data: 'close' required")
         
-        close = data['close']
-        
-        # Calculate fast and slow EMAs
-        fast_ema = ExponentialMovingAverage(self.fast_period).calculate(data)["ema"]
-        slow_ema = ExponentialMovingAverage(self.slow_period).calculate(data)["ema"]
-        
-        # MACD line
-        macd_line = fast_ema - slow_ema
-        
-        # Signal line (EMA of MACD)
-        signal_ema = ExponentialMovingAverage(self.signal_period)
-        signal_line = signal_ema.calculate({"close": macd_line})["ema"]
-        
-        # Histogram
-        histogram = macd_line - signal_line
+        macd_line, signal_line, histogram = calculate_macd(
+            data['close'], self.fast_period, self.slow_period, self.signal_period, self.dtype
+        )
         
         return {
             "macd": macd_line,
@@ -200,7 +559,7 @@ class MACD(BaseIndicator):
 class BollingerBands(BaseIndicator):
     """Bollinger Bands indicator"""
     
-    def __init__(self, period: int = 20, std_dev: float = 2.0):
+    def __init__(self, period: int = 20, std_dev: float = 2.0, dtype=np.float64, backend: str = "auto"):
         super().__init__(
             name="BBands",
             category=IndicatorCategory.VOLATILITY,
@@ -209,25 +568,15 @@ class BollingerBands(BaseIndicator):
         self.period = period
         self.std_dev = std_dev
         self.parameters = {"period": period, "std_dev": std_dev}
+        self.dtype = _float_dtype(dtype)
+        self.backend = backend
     
     def calculate(self, data: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
         """Calculate Bollinger Bands"""
         if not self.validate_data(data):
             raise ValueError("Invalid data: 'close' required")
         
-        close = data['close']
-        
-        # Middle band (SMA)
-        sma = MovingAverage(self.period).calculate(data)["sma"]
-        
-        # Calculate rolling standard deviation
-        std = np.zeros(len(close))
-        for i in range(self.period - 1, len(close)):
-            std[i] = np.std(close[i - self.period + 1:i + 1])
-        
-        # Upper and lower bands
-        upper = sma + (self.std_dev * std)
-        lower = sma - (self.std_dev * std)
+        upper, sma, lower = calculate_bbands(data['close'], self.period, self.std_dev, self.dtype, self.backend)
         
         return {
             "upper": upper,
@@ -239,7 +588,7 @@ class BollingerBands(BaseIndicator):
 class ATR(BaseIndicator):
     """Average True Range indicator"""
     
-    def __init__(self, period: int = 14):
+    def __init__(self, period: int = 14, dtype=np.float64):
         super().__init__(
             name="ATR",
             category=IndicatorCategory.VOLATILITY,
@@ -247,6 +596,7 @@ class ATR(BaseIndicator):
         )
         self.period = period
         self.parameters = {"period": period}
+        self.dtype = _float_dtype(dtype)
     
     def calculate(self, data: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
         """Calculate ATR"""
@@ -254,28 +604,8 @@ class ATR(BaseIndicator):
         if not all(field in data for field in required):
             raise ValueError("Invalid data: 'high', 'low', 'close' required")
         
-        high = data['high']
-        low = data['low']
-        close = data['close']
-        
-        # True Range calculation
-        tr = np.zeros(len(close))
-        tr[0] = high[0] - low[0]
-        
-        for i in range(1, len(close)):
-            hl = high[i] - low[i]
-            hc = abs(high[i] - close[i-1])
-            lc = abs(low[i] - close[i-1])
-            tr[i] = max(hl, hc, lc)
-        
-        # Average True Range (EMA of TR)
-        atr = np.zeros(len(tr))
-        atr[:self.period] = np.nan
-        atr[self.period-1] = np.mean(tr[:self.period])
-        
-        alpha = 1 / self.period
-        for i in range(self.period, len(tr)):
-            atr[i] = alpha * tr[i] + (1 - alpha) * atr[i-1]
+        # True Range, then its exponential average (NaN before the first window)
+        atr = calculate_atr(data['high'], data['low'], data['close'], self.period, self.dtype)
         
         return {"atr": atr}
 
@@ -303,35 +633,316 @@ class CustomIndicator(BaseIndicator):
         return self.calculate_fn(data)
 
 
+# Streaming indicators: O(1) state updated one tick at a time, producing the
+# same values as the bulk indicators at each index (NaN during warmup)
+
+class StreamingSMA:
+    """Simple moving average updated per tick"""
+    
+    def __init__(self, period: int = 20):
+        self.period = period
+        self._ring = [0.0] * period
+        self._head = 0
+        self._count = 0
+        # Sum of the finite values in the window and count of the others,
+        # so a NaN/inf tick only affects the windows that contain it
+        self._sum = 0.0
+        self._bad = 0
+    
+    def update(self, x: float) -> float:
+        """Add one close and return the current SMA"""
+        x = float(x)
+        old = self._ring[self._head]
+        if math.isfinite(old):
+            self._sum -= old
+        else:
+            self._bad -= 1
+        if math.isfinite(x):
+            self._sum += x
+        else:
+            self._bad += 1
+        self._ring[self._head] = x
+        self._head = (self._head + 1) % self.period
+        self._count += 1
+        if self._count < self.period:
+            return math.nan
+        if self._bad:
+            return sum(self._ring) / self.period
+        return self._sum / self.period
+
+
+class StreamingEMA:
+    """Exponential moving average updated per tick, seeded with the first close"""
+    
+    def __init__(self, period: int = 20):
+        self.period = period
+        self.alpha = 2 / (period + 1)
+        self._ema: Optional[float] = None
+    
+    def update(self, x: float) -> float:
+        """Add one close and return the current EMA"""
+        x = float(x)
+        if self._ema is None:
+            self._ema = x
+        else:
+            self._ema = self.alpha * x + (1 - self.alpha) * self._ema
+        return self._ema
+
+
+class StreamingRSI:
+    """RSI over simple averages of the last `period` gains and losses, per tick"""
+    
+    def __init__(self, period: int = 14):
+        self.period = period
+        self._deltas = [0.0] * period
+        self._head = 0
+        self._prev: Optional[float] = None
+        self._count = 0
+        self._gain_sum = 0.0
+        self._loss_sum = 0.0
+        self._gain_count = 0
+        self._loss_count = 0
+        # Infinite deltas in the ring; while any are present the window is
+        # summed directly so they never enter the running sums
+        self._bad = 0
+    
+    def update(self, x: float) -> float:
+        """Add one close and return the current RSI"""
+        x = float(x)
+        prev, self._prev = self._prev, x
+        if prev is None:
+            return math.nan
+        
+        delta = x - prev
+        old = self._deltas[self._head]
+        self._deltas[self._head] = delta
+        self._head = (self._head + 1) % self.period
+        self._count += 1
+        
+        if math.isinf(delta):
+            self._bad += 1
+        elif delta > 0:
+            self._gain_sum += delta
+            self._gain_count += 1
+        elif delta < 0:
+            self._loss_sum -= delta
+            self._loss_count += 1
+        if self._count > self.period:
+            if math.isinf(old):
+                self._bad -= 1
+            elif old > 0:
+                self._gain_sum -= old
+                self._gain_count -= 1
+            elif old < 0:
+                self._loss_sum += old
+                self._loss_count -= 1
+        
+        if self._count < self.period:
+            return math.nan
+        if self._bad:
+            avg_gain = sum(d for d in self._deltas if d > 0) / self.period
+            avg_loss = -sum(d for d in self._deltas if d < 0) / self.period
+        else:
+            avg_gain = self._gain_sum / self.period if self._gain_count > 0 else 0.0
+            avg_loss = self._loss_sum / self.period if self._loss_count > 0 else 0.0
+        rs = avg_gain / (avg_loss if avg_loss != 0 else 1e-10)
+        return 100 - (100 / (1 + rs))
+
+
+class StreamingBollingerBands:
+    """Bollinger Bands per tick; window mean and variance by sliding Welford updates"""
+    
+    def __init__(self, period: int = 20, std_dev: float = 2.0):
+        self.period = period
+        self.std_dev = std_dev
+        self._ring = [0.0] * period
+        self._head = 0
+        self._count = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        # Non-finite values in the window; while any are present the Welford
+        # state is left stale and rebuilt from the ring once they leave
+        self._bad = 0
+        self._stale = False
+    
+    def update(self, x: float) -> Tuple[float, float, float]:
+        """Add one close and return (upper, middle, lower)"""
+        x = float(x)
+        old = self._ring[self._head]
+        self._ring[self._head] = x
+        self._head = (self._head + 1) % self.period
+        self._count += 1
+        self._bad += (not math.isfinite(x)) - (not math.isfinite(old))
+        
+        if self._bad:
+            self._stale = True
+        elif self._stale:
+            self._rebuild()
+        elif self._count <= self.period:
+            # Growing window: ordinary Welford step
+            delta = x - self._mean
+            self._mean += delta / self._count
+            self._m2 += delta * (x - self._mean)
+        else:
+            # Full window: replace the oldest value
+            prev_mean = self._mean
+            self._mean += (x - old) / self.period
+            self._m2 += (x - old) * (x - self._mean + old - prev_mean)
+        
+        if self._count < self.period:
+            return math.nan, math.nan, math.nan
+        if self._bad:
+            # Same as the bulk bands: NaN/inf middle, NaN width
+            middle = sum(self._ring) / self.period
+            return math.nan, middle, math.nan
+        width = self.std_dev * math.sqrt(max(self._m2, 0.0) / self.period)
+        return self._mean + width, self._mean, self._mean - width
+    
+    def _rebuild(self):
+        """Recompute mean and M2 of the filled slots with two passes"""
+        values = self._ring[:min(self._count, self.period)]
+        self._mean = sum(values) / len(values)
+        self._m2 = sum((v - self._mean) ** 2 for v in values)
+        self._stale = False
+
+
+class StreamingATR:
+    """Average True Range per tick"""
+    
+    def __init__(self, period: int = 14):
+        self.period = period
+        self.alpha = 1 / period
+        self._prev_close: Optional[float] = None
+        self._count = 0
+        self._seed = 0.0
+        self._atr = math.nan
+    
+    def update(self, high: float, low: float, close: float) -> float:
+        """Add one bar and return the current ATR"""
+        high, low, close = float(high), float(low), float(close)
+        if self._prev_close is None:
+            tr = high - low
+        else:
+            tr = max(high - low, abs(high - self._prev_close), abs(low - self._prev_close))
+        self._prev_close = close
+        self._count += 1
+        
+        if self._count < self.period:
+            self._seed += tr
+        elif self._count == self.period:
+            self._atr = (self._seed + tr) / self.period
+        else:
+            self._atr = self.alpha * tr + (1 - self.alpha) * self._atr
+        return self._atr
+
+
+# Calculators: (data, **params) -> outputs, bound per key at registration so
+# calculate_indicator is one dict lookup and a direct call. The built-ins go
+# straight to the typed functions without building an indicator instance.
+
+def _require_close(data: Dict[str, np.ndarray]) -> np.ndarray:
+    if 'close' not in data:
+        raise ValueError("Invalid data: 'close' required")
+    return data['close']
+
+
+def _sma_calculator(data, period: int = 20, dtype=np.float64, backend: str = "auto"):
+    return {"sma": calculate_sma(_require_close(data), period, dtype, backend)}
+
+
+def _ema_calculator(data, period: int = 20, dtype=np.float64):
+    return {"ema": calculate_ema(_require_close(data), period, dtype)}
+
+
+def _rsi_calculator(data, period: int = 14, dtype=np.float64):
+    return {"rsi": calculate_rsi(_require_close(data), period, dtype)}
+
+
+def _macd_calculator(data, fast_period: int = 12, slow_period: int = 26, signal_period: int = 9, dtype=np.float64):
+    macd_line, signal_line, histogram = calculate_macd(
+        _require_close(data), fast_period, slow_period, signal_period, dtype
+    )
+    return {"macd": macd_line, "signal": signal_line, "histogram": histogram}
+
+
+def _bbands_calculator(data, period: int = 20, std_dev: float = 2.0, dtype=np.float64, backend: str = "auto"):
+    upper, middle, lower = calculate_bbands(_require_close(data), period, std_dev, dtype, backend)
+    return {"upper": upper, "middle": middle, "lower": lower}
+
+
+def _atr_calculator(data, period: int = 14, dtype=np.float64):
+    if not all(field in data for field in ('high', 'low', 'close')):
+        raise ValueError("Invalid data: 'high', 'low', 'close' required")
+    return {"atr": calculate_atr(data['high'], data['low'], data['close'], period, dtype)}
+
+
+def _instance_calculator(indicator_factory: Callable) -> Callable:
+    """Calculator that builds an indicator from the params on each call"""
+    def calculate(data, **params):
+        return indicator_factory(**params).calculate(data)
+    return calculate
+
+
 class IndicatorRegistry:
     """Registry for managing indicators"""
     
     def __init__(self):
         self.indicators: Dict[str, BaseIndicator] = {}
+        self.calculators: Dict[str, Callable] = {}
+        self.streaming: Dict[str, type] = {}
         self._register_builtin_indicators()
     
     def _register_builtin_indicators(self):
         """Register built-in indicators"""
-        self.register("sma", MovingAverage)
-        self.register("ema", ExponentialMovingAverage)
-        self.register("rsi", RSI)
-        self.register("macd", MACD)
-        self.register("bbands", BollingerBands)
-        self.register("atr", ATR)
-    
-    def register(self, key: str, indicator_class: type):
-        """Register an indicator class"""
+        self.register("sma", MovingAverage, _sma_calculator)
+        self.register("ema", ExponentialMovingAverage, _ema_calculator)
+        self.register("rsi", RSI, _rsi_calculator)
+        self.register("macd", MACD, _macd_calculator)
+        self.register("bbands", BollingerBands, _bbands_calculator)
+        self.register("atr", ATR, _atr_calculator)
+        self.register_streaming("sma", StreamingSMA)
+        self.register_streaming("ema", StreamingEMA)
+        self.register_streaming("rsi", StreamingRSI)
+        self.register_streaming("bbands", StreamingBollingerBands)
+        self.register_streaming("atr", StreamingATR)
+    
+    def register(self, key: str, indicator_class: type, calculator: Optional[Callable] = None):
+        """
+        Register an indicator class
+        
+        calculator, if given, must return the same outputs as
+        indicator_class(**params).calculate(data) for calculate(data, **params).
+        """
         self.indicators[key] = indicator_class
+        self.calculators[key] = calculator or _instance_calculator(indicator_class)
         logger.info(f"Registered indicator: {key}")
     
+    def register_streaming(self, key: str, indicator_class: type):
+        """Register a per-tick indicator class"""
+        self.streaming[key] = indicator_class
+        logger.info(f"Registered streaming indicator: {key}")
+    
     def register_custom(self, name: str, calculate_fn: Callable, description: str = ""):
         """Register a custom indicator function"""
         indicator = CustomIndicator(name, calculate_fn, description)
         self.indicators[name.lower()] = lambda **kwargs: indicator
+        self.calculators[name.lower()] = lambda data, **kwargs: indicator.calculate(data)
         logger.info(f"Registered custom indicator: {name}")
     
-    def get(self, key: str, **kwargs) -> BaseIndicator:
-        """Get an indicator instance"""
+    def get(self, key: str, mode: str = "batch", **kwargs) -> Any:
+        """
+        Get an indicator instance
+        
+        mode="batch" returns a BaseIndicator for whole series; mode="stream"
+        returns a per-tick indicator with an update() method.
+        """
+        if mode == "stream":
+            if key not in self.streaming:
+                raise ValueError(f"Unknown streaming indicator: {key}")
+            return self.streaming[key](**kwargs)
+        if mode != "batch":
+            raise ValueError(f"Unknown indicator mode: {mode}")
+        
         if key not in self.indicators:
             raise ValueError(f"Unknown indicator: {key}")
         
@@ -370,8 +981,11 @@ def calculate_indicator(
     Returns:
         Dictionary with indicator outputs
     """
-    indicator = indicator_registry.get(indicator_name.lower(), **params)
-    return indicator.calculate(data)
+    key = indicator_name.lower()
+    calculator = indicator_registry.calculators.get(key)
+    if calculator is None:
+        raise ValueError(f"Unknown indicator: {key}")
+    return calculator(data, **params)
 
 
 def calculate_multiple_indicators(
@@ -389,6 +1003,10 @@ def calculate_multiple_indicators(
     Returns:
         Dictionary mapping indicator names to their outputs
     """
+    fused = _calculate_fused_sma_ema_rsi(indicator_specs, data)
+    if fused is not None:
+        return fused
+    
     results = {}
     
     for spec in indicator_specs:
@@ -403,3 +1021,51 @@ def calculate_multiple_indicators(
             results[name] = {"error": str(e)}
     
     return results
+
+
+def _calculate_fused_sma_ema_rsi(
+    indicator_specs: List[Dict[str, Any]],
+    data: Dict[str, np.ndarray]
+) -> Optional[Dict[str, Dict[str, np.ndarray]]]:
+    """
+    SMA + EMA + RSI on the same close series in a single pass
+    
+    Returns None unless the specs are exactly those three built-in
+    indicators with at most a valid integer period each.
+    """
+    if len(indicator_specs) != 3 or 'close' not in data:
+        return None
+    
+    periods = {}
+    for spec in indicator_specs:
+        name = spec.get("name")
+        params = spec.get("params", {})
+        indicator_class = _FUSED_INDICATORS.get(name)
+        if (
+            indicator_class is None
+            or name in periods
+            or indicator_registry.indicators.get(name) is not indicator_class
+            or not set(params) <= {"period"}
+        ):
+            return None
+        period = params.get("period", _DEFAULT_PERIODS[name])
+        if not isinstance(period, int) or isinstance(period, bool) or period < 1:
+            return None
+        periods[name] = period
+    
+    close = _as_float_array(data['close'])
+    n = len(close)
+    if n == 0:
+        return None
+    
+    sma, ema, rsi = np.empty(n), np.empty(n), np.empty(n)
+    _fused_sma_ema_rsi_kernel(
+        close, periods["sma"], 2 / (periods["ema"] + 1), periods["rsi"], sma, ema, rsi
+    )
+    outputs = {"sma": {"sma": sma}, "ema": {"ema": ema}, "rsi": {"rsi": rsi}}
+    return {spec["name"]: outputs[spec["name"]] for spec in indicator_specs}
+
+
+# Indicators the fused single-pass kernel can stand in for
+_FUSED_INDICATORS = {"sma": MovingAverage, "ema": ExponentialMovingAverage, "rsi": RSI}
+_DEFAULT_PERIODS = {"sma": 20, "ema": 20, "rsi": 14}
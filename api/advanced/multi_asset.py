@@ -3,11 +3,21 @@ Multi-Asset Support Framework
 Support for stocks, futures, options, crypto with asset-specific models
 """
 import numpy as np
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Mapping, Optional, Tuple, Callable
 from dataclasses import dataclass
 from enum import Enum
 from datetime import datetime
+from types import MappingProxyType
 import logging
+import operator
+
+try:
+    import numba
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+from ._backend import HAS_CUPY, cp, use_cupy
 
 logger = logging.getLogger(__name__)
 
@@ -107,30 +117,41 @@ class OptionPricer(AssetPricer):
         Returns:
             Dictionary with price, delta, gamma, theta, vega, rho
         """
-        from scipy.stats import norm
+        from scipy.special import ndtr
+        
+        # Shared terms, each evaluated once
+        sqrt_t = np.sqrt(time_to_expiry)
+        vol_sqrt_t = volatility * sqrt_t
+        discount = np.exp(-risk_free_rate * time_to_expiry)
         
         # Calculate d1 and d2
-        d1 = (np.log(spot / strike) + (risk_free_rate + 0.5 * volatility**2) * time_to_expiry) / (volatility * np.sqrt(time_to_expiry))
-        d2 = d1 - volatility * np.sqrt(time_to_expiry)
+        d1 = (np.log(spot / strike) + (risk_free_rate + 0.5 * volatility**2) * time_to_expiry) / vol_sqrt_t
+        d2 = d1 - vol_sqrt_t
+        
+        # Standard normal density at d1, used by theta, gamma and vega
+        pdf_d1 = np.exp(-0.5 * d1 * d1) / np.sqrt(2 * np.pi)
+        decay = -spot * pdf_d1 * volatility / (2 * sqrt_t)
         
         if option_type.lower() == "call":
             # Call option
-            price = spot * norm.cdf(d1) - strike * np.exp(-risk_free_rate * time_to_expiry) * norm.cdf(d2)
-            delta = norm.cdf(d1)
-            theta = (-spot * norm.pdf(d1) * volatility / (2 * np.sqrt(time_to_expiry)) 
-                    - risk_free_rate * strike * np.exp(-risk_free_rate * time_to_expiry) * norm.cdf(d2))
-            rho = strike * time_to_expiry * np.exp(-risk_free_rate * time_to_expiry) * norm.cdf(d2)
+            cdf_d1 = ndtr(d1)
+            cdf_d2 = ndtr(d2)
+            price = spot * cdf_d1 - strike * discount * cdf_d2
+            delta = cdf_d1
+            theta = decay - risk_free_rate * strike * discount * cdf_d2
+            rho = strike * time_to_expiry * discount * cdf_d2
         else:
-            # Put option
-            price = strike * np.exp(-risk_free_rate * time_to_expiry) * norm.cdf(-d2) - spot * norm.cdf(-d1)
-            delta = -norm.cdf(-d1)
-            theta = (-spot * norm.pdf(d1) * volatility / (2 * np.sqrt(time_to_expiry)) 
-                    + risk_free_rate * strike * np.exp(-risk_free_rate * time_to_expiry) * norm.cdf(-d2))
-            rho = -strike * time_to_expiry * np.exp(-risk_free_rate * time_to_expiry) * norm.cdf(-d2)
+            # Put option; N(-d) directly rather than 1 - N(d) to keep tail precision
+            cdf_neg_d1 = ndtr(-d1)
+            cdf_neg_d2 = ndtr(-d2)
+            price = strike * discount * cdf_neg_d2 - spot * cdf_neg_d1
+            delta = -cdf_neg_d1
+            theta = decay + risk_free_rate * strike * discount * cdf_neg_d2
+            rho = -strike * time_to_expiry * discount * cdf_neg_d2
         
         # Greeks common to both call and put
-        gamma = norm.pdf(d1) / (spot * volatility * np.sqrt(time_to_expiry))
-        vega = spot * norm.pdf(d1) * np.sqrt(time_to_expiry)
+        gamma = pdf_d1 / (spot * vol_sqrt_t)
+        vega = spot * pdf_d1 * sqrt_t
         
         return {
             "price": price,
@@ -140,6 +161,61 @@ class OptionPricer(AssetPricer):
             "vega": vega / 100,    # Per 1% volatility
             "rho": rho / 100       # Per 1% rate change
         }
+    
+    def black_scholes_batch(
+        self,
+        spot,
+        strikes: np.ndarray,
+        time_to_expiry,
+        volatility,
+        risk_free_rate,
+        option_types: np.ndarray
+    ) -> Dict[str, np.ndarray]:
+        """
+        Black-Scholes price and Greeks for many contracts at once
+        
+        Inputs broadcast against each other; option_types is a boolean
+        array, True for calls and False for puts. Returns the same keys and
+        scaling as black_scholes, with array values.
+        """
+        from scipy.special import ndtr
+        
+        spot = np.asarray(spot, dtype=np.float64)
+        strikes = np.asarray(strikes, dtype=np.float64)
+        time_to_expiry = np.asarray(time_to_expiry, dtype=np.float64)
+        volatility = np.asarray(volatility, dtype=np.float64)
+        risk_free_rate = np.asarray(risk_free_rate, dtype=np.float64)
+        
+        sqrt_t = np.sqrt(time_to_expiry)
+        vol_sqrt_t = volatility * sqrt_t
+        discount = np.exp(-risk_free_rate * time_to_expiry)
+        
+        d1 = (np.log(spot / strikes) + (risk_free_rate + 0.5 * volatility**2) * time_to_expiry) / vol_sqrt_t
+        d2 = d1 - vol_sqrt_t
+        pdf_d1 = np.exp(-0.5 * d1 * d1) / np.sqrt(2 * np.pi)
+        decay = -spot * pdf_d1 * volatility / (2 * sqrt_t)
+        
+        # +1 for calls, -1 for puts: N(sign * d) covers both without
+        # evaluating the other side's CDFs
+        sign = np.where(option_types, 1.0, -1.0)
+        cdf_d1 = ndtr(sign * d1)
+        cdf_d2 = ndtr(sign * d2)
+        
+        price = sign * (spot * cdf_d1 - strikes * discount * cdf_d2)
+        delta = sign * cdf_d1
+        theta = decay - sign * risk_free_rate * strikes * discount * cdf_d2
+        rho = sign * strikes * time_to_expiry * discount * cdf_d2
+        gamma = pdf_d1 / (spot * vol_sqrt_t)
+        vega = spot * pdf_d1 * sqrt_t
+        
+        return {
+            "price": price,
+            "delta": delta,
+            "gamma": gamma,
+            "theta": theta / 365,
+            "vega": vega / 100,
+            "rho": rho / 100
+        }
 
 
 class CryptoPricer(AssetPricer):
@@ -166,22 +242,36 @@ class CrossAssetAnalyzer:
     
     def calculate_correlation_matrix(
         self,
-        returns: Dict[str, np.ndarray]
+        returns: Dict[str, np.ndarray],
+        backend: str = "auto"
     ) -> np.ndarray:
-        """Calculate correlation matrix across assets"""
-        symbols = list(returns.keys())
-        n = len(symbols)
+        """
+        Calculate correlation matrix across assets
         
-        corr_matrix = np.zeros((n, n))
+        Rows are z-scored once and every pair is computed in a single
+        matrix product instead of one corrcoef call per pair. z @ z.T is a
+        symmetric rank-k update in BLAS, so the result is exactly symmetric.
         
-        for i, symbol1 in enumerate(symbols):
-            for j, symbol2 in enumerate(symbols):
-                if i == j:
-                    corr_matrix[i, j] = 1.0
-                else:
-                    corr = np.corrcoef(returns[symbol1], returns[symbol2])[0, 1]
-                    corr_matrix[i, j] = corr
+        backend is "numpy", "cupy" (GPU, needs CuPy and a device) or "auto",
+        which uses the GPU for panels larger than _backend.GPU_MIN_BYTES.
+        """
+        if not returns:
+            return np.zeros((0, 0))
+        
+        # (n_assets, T) panel; a constant series gives NaN off the diagonal
+        panel = np.stack([np.asarray(r, dtype=np.float64) for r in returns.values()])
+        xp = cp if use_cupy(backend, panel.nbytes) else np
+        with np.errstate(divide='ignore', invalid='ignore'):
+            z = xp.asarray(panel)
+            z = z - z.mean(axis=1, keepdims=True)
+            z /= z.std(axis=1, keepdims=True)
+            corr_matrix = (z @ z.T) / panel.shape[1]
+        if xp is not np:
+            corr_matrix = cp.asnumpy(corr_matrix)
         
+        # Rounding can push perfect correlations just past +/-1
+        np.clip(corr_matrix, -1.0, 1.0, out=corr_matrix)
+        np.fill_diagonal(corr_matrix, 1.0)
         return corr_matrix
     
     def calculate_beta_to_market(
@@ -227,6 +317,78 @@ class CrossAssetAnalyzer:
         return sorted(cointegrated_pairs, key=lambda x: x[2])
 
 
+def _tuple_getter(keys: List[str]) -> Callable[[Dict[str, float]], tuple]:
+    """itemgetter over keys that always returns a tuple, even for 0 or 1 keys"""
+    if len(keys) > 1:
+        return operator.itemgetter(*keys)
+    if len(keys) == 1:
+        key = keys[0]
+        return lambda mapping: (mapping[key],)
+    return lambda mapping: ()
+
+
+def _quantile_position(n: int, q: float) -> float:
+    """Fractional order-statistic index of quantile q, as np.percentile computes it"""
+    q = np.true_divide(q * 100, 100)
+    return n * q + (1 + q * -1) - 1
+
+
+def _lerp(low, high, t):
+    """Linear interpolation in the form np.percentile uses"""
+    diff = high - low
+    return np.where(t >= 0.5, high - diff * (1 - t), low + diff * t)
+
+
+def _lower_quantile(returns: np.ndarray, q: float):
+    """
+    Quantile q along the last axis using a partial sort
+    
+    Same linear interpolation as np.percentile, but only the two order
+    statistics around the quantile are placed, in O(n) rather than a full sort.
+    Like np.percentile, a series containing NaN gives NaN; np.partition
+    alone would sort the NaN to the end and return a finite quantile.
+    """
+    n = returns.shape[-1]
+    position = _quantile_position(n, q)
+    low = min(max(int(np.floor(position)), 0), n - 1)
+    high = min(low + 1, n - 1)
+    part = np.partition(returns, [low, high], axis=-1)
+    quantile = _lerp(part[..., low], part[..., high], position - low)
+    return np.where(np.isnan(part).any(axis=-1), np.nan, quantile)[()]
+
+
+def _quantile_rows_kernel(returns, position, out):
+    """Per-row quantile at a fractional order-statistic index (see _lower_quantile)"""
+    n_rows, n = returns.shape
+    low = min(max(int(np.floor(position)), 0), n - 1)
+    high = min(low + 1, n - 1)
+    t = position - low
+    for i in numba.prange(n_rows):
+        if np.isnan(returns[i]).any():
+            out[i] = np.nan
+            continue
+        part = np.partition(returns[i].copy(), high)
+        b = part[high]
+        a = b
+        if low < high:
+            a = part[0]
+            for j in range(1, high):
+                if part[j] > a:
+                    a = part[j]
+        diff = b - a
+        if t >= 0.5:
+            out[i] = b - diff * (1 - t)
+        else:
+            out[i] = a + diff * t
+
+
+if HAS_NUMBA:
+    # No fastmath: the result must match the NumPy path exactly. No on-disk
+    # cache either, as the module is imported under two package names
+    _quantile_rows_kernel = numba.njit(parallel=True)(_quantile_rows_kernel)
+    _quantile_rows_kernel(np.linspace(-1.0, 1.0, 32).reshape(2, 16), 3.5, np.empty(2))
+
+
 class AssetRiskModel:
     """Risk model for different asset classes"""
     
@@ -237,21 +399,40 @@ class AssetRiskModel:
         confidence: float = 0.95
     ) -> float:
         """Calculate VaR with asset-class specific adjustments"""
-        base_var = np.percentile(returns, (1 - confidence) * 100)
-        
-        # Asset-class specific risk multipliers
-        multipliers = {
-            AssetClass.STOCK: 1.0,
-            AssetClass.FUTURE: 1.5,
-            AssetClass.OPTION: 2.0,
-            AssetClass.CRYPTO: 2.5,
-            AssetClass.FX: 1.2,
-            AssetClass.COMMODITY: 1.3
-        }
+        base_var = _lower_quantile(np.asarray(returns, dtype=np.float64), 1 - confidence)
         
-        multiplier = multipliers.get(asset_class, 1.0)
+        # Asset-class specific risk multiplier, looked up by class index
+        class_id = _CLASS_INDEX.get(asset_class)
+        multiplier = _VAR_MULTIPLIERS[class_id] if class_id is not None else 1.0
         return base_var * multiplier
     
+    @staticmethod
+    def calculate_var_batch(
+        asset_classes: List[AssetClass],
+        returns: np.ndarray,
+        confidence: float = 0.95
+    ) -> np.ndarray:
+        """
+        Asset-class adjusted VaR for many assets at once
+        
+        returns is (n_assets, n_samples), one row per entry of asset_classes;
+        each value matches calculate_var_by_asset_class on that row.
+        """
+        returns = np.ascontiguousarray(returns, dtype=np.float64)
+        if returns.ndim != 2 or len(returns) != len(asset_classes):
+            raise ValueError("returns must be (n_assets, n_samples) with one row per asset class")
+        
+        multipliers = np.array([
+            _VAR_MULTIPLIERS[_CLASS_INDEX[c]] if c in _CLASS_INDEX else 1.0
+            for c in asset_classes
+        ])
+        if HAS_NUMBA and returns.shape[1] > 0:
+            base_var = np.empty(len(returns))
+            _quantile_rows_kernel(returns, _quantile_position(returns.shape[1], 1 - confidence), base_var)
+        else:
+            base_var = _lower_quantile(returns, 1 - confidence)
+        return base_var * multipliers
+    
     @staticmethod
     def calculate_margin_requirement(
         asset_class: AssetClass,
@@ -259,17 +440,9 @@ class AssetRiskModel:
         volatility: float
     ) -> float:
         """Calculate margin requirement based on asset class"""
-        # Base margin rates
-        base_rates = {
-            AssetClass.STOCK: 0.50,      # 50% for stocks
-            AssetClass.FUTURE: 0.10,     # 10% for futures
-            AssetClass.OPTION: 1.00,     # 100% for options (cash secured)
-            AssetClass.CRYPTO: 0.75,     # 75% for crypto
-            AssetClass.FX: 0.02,         # 2% for FX
-            AssetClass.COMMODITY: 0.15   # 15% for commodities
-        }
-        
-        base_rate = base_rates.get(asset_class, 0.50)
+        # Base margin rate, looked up by class index
+        class_id = _CLASS_INDEX.get(asset_class)
+        base_rate = _MARGIN_RATES[class_id] if class_id is not None else 0.50
         
         # Adjust for volatility
         vol_adjustment = 1.0 + (volatility - 0.20) * 2.0  # Adjust around 20% vol baseline
@@ -279,11 +452,44 @@ class AssetRiskModel:
 
 
 class MultiAssetPortfolio:
-    """Portfolio management across multiple asset classes"""
+    """
+    Portfolio management across multiple asset classes
+    
+    Positions are held column-wise: parallel arrays of size, entry price,
+    contract size and asset-class index, one slot per symbol.
+    """
     
     def __init__(self, assets: List[AssetMetadata]):
         self.assets = {asset.symbol: asset for asset in assets}
-        self.positions: Dict[str, Dict[str, Any]] = {}
+        self._symbols: List[str] = []
+        self._symbol_idx: Dict[str, int] = {}
+        self._entry_times: List[datetime] = []
+        self._size = np.empty(0)
+        self._entry_px = np.empty(0)
+        self._contract_size = np.empty(0)
+        self._class_id = np.empty(0, dtype=np.intp)
+        # Price lookup over the current symbols and the last array it built
+        self._price_getter = None
+        self._last_quotes = None
+        self._last_px = None
+    
+    @property
+    def positions(self) -> Mapping[str, Mapping[str, Any]]:
+        """
+        Positions keyed by symbol, as a read-only snapshot of the arrays
+        
+        Use add_position, update_position and remove_position to change
+        positions; assigning into the snapshot raises TypeError.
+        """
+        return MappingProxyType({
+            symbol: MappingProxyType({
+                "size": float(self._size[i]),
+                "entry_price": float(self._entry_px[i]),
+                "entry_time": self._entry_times[i],
+                "asset": self.assets[symbol]
+            })
+            for i, symbol in enumerate(self._symbols)
+        })
     
     def add_position(
         self,
@@ -292,89 +498,178 @@ class MultiAssetPortfolio:
         entry_price: float,
         entry_time: datetime
     ):
-        """Add a position"""
+        """Add a position, replacing any existing position in the symbol"""
         if symbol not in self.assets:
             raise ValueError(f"Unknown asset: {symbol}")
         
-        self.positions[symbol] = {
-            "size": size,
-            "entry_price": entry_price,
-            "entry_time": entry_time,
-            "asset": self.assets[symbol]
+        i = self._symbol_idx.get(symbol)
+        if i is None:
+            i = len(self._symbols)
+            if i == len(self._size):
+                self._grow(max(4, 2 * i))
+            self._symbol_idx[symbol] = i
+            self._symbols.append(symbol)
+            self._entry_times.append(entry_time)
+            self._price_getter = None
+        else:
+            self._entry_times[i] = entry_time
+        
+        asset = self.assets[symbol]
+        self._size[i] = size
+        self._entry_px[i] = entry_price
+        self._contract_size[i] = asset.contract_size
+        self._class_id[i] = _CLASS_INDEX[asset.asset_class]
+    
+    def add_positions_batch(
+        self,
+        positions: List[Tuple[str, float, float]],
+        entry_time: Optional[datetime] = None
+    ):
+        """
+        Add (symbol, size, entry_price) positions sharing one entry time
+        
+        Equivalent to calling add_position for each item in order (a later
+        item replaces an earlier one in the same symbol), with the arrays
+        grown at most once. Nothing is added if any symbol is unknown.
+        """
+        latest = {symbol: (size, entry_price) for symbol, size, entry_price in positions}
+        unknown = [symbol for symbol in latest if symbol not in self.assets]
+        if unknown:
+            raise ValueError(f"Unknown asset: {unknown[0]}")
+        if not latest:
+            return
+        if entry_time is None:
+            entry_time = datetime.now()
+        
+        new_symbols = [symbol for symbol in latest if symbol not in self._symbol_idx]
+        n = len(self._symbols)
+        if n + len(new_symbols) > len(self._size):
+            self._grow(max(4, 2 * n, n + len(new_symbols)))
+        for i, symbol in enumerate(new_symbols, start=n):
+            self._symbol_idx[symbol] = i
+        self._symbols.extend(new_symbols)
+        self._entry_times.extend([entry_time] * len(new_symbols))
+        if new_symbols:
+            self._price_getter = None
+        
+        slots = np.fromiter((self._symbol_idx[symbol] for symbol in latest), dtype=np.intp, count=len(latest))
+        for i in slots.tolist():
+            self._entry_times[i] = entry_time
+        values = np.array(list(latest.values()), dtype=np.float64)
+        assets = [self.assets[symbol] for symbol in latest]
+        self._size[slots] = values[:, 0]
+        self._entry_px[slots] = values[:, 1]
+        self._contract_size[slots] = [asset.contract_size for asset in assets]
+        self._class_id[slots] = [_CLASS_INDEX[asset.asset_class] for asset in assets]
+    
+    def update_position(
+        self,
+        symbol: str,
+        size: Optional[float] = None,
+        entry_price: Optional[float] = None,
+        entry_time: Optional[datetime] = None
+    ):
+        """Change the given fields of an existing position"""
+        i = self._symbol_idx.get(symbol)
+        if i is None:
+            raise ValueError(f"No position in {symbol}")
+        
+        if size is not None:
+            self._size[i] = size
+        if entry_price is not None:
+            self._entry_px[i] = entry_price
+        if entry_time is not None:
+            self._entry_times[i] = entry_time
+    
+    def remove_position(self, symbol: str):
+        """Close out a position, keeping the order of the remaining ones"""
+        i = self._symbol_idx.pop(symbol, None)
+        if i is None:
+            raise ValueError(f"No position in {symbol}")
+        
+        n = len(self._symbols)
+        for arr in (self._size, self._entry_px, self._contract_size, self._class_id):
+            arr[i:n - 1] = arr[i + 1:n]
+        del self._symbols[i]
+        del self._entry_times[i]
+        for j in range(i, n - 1):
+            self._symbol_idx[self._symbols[j]] = j
+        self._price_getter = None
+    
+    def _grow(self, capacity: int):
+        """Resize the position arrays, keeping existing slots"""
+        self._size = np.resize(self._size, capacity)
+        self._entry_px = np.resize(self._entry_px, capacity)
+        self._contract_size = np.resize(self._contract_size, capacity)
+        self._class_id = np.resize(self._class_id, capacity)
+    
+    def _current_prices(self, current_prices: Dict[str, float]) -> np.ndarray:
+        """
+        Current price per slot, falling back to the entry price
+        
+        When every symbol is quoted, the prices are fetched in one
+        itemgetter call and the array is reused while the quotes are
+        unchanged, e.g. for value then P&L against the same prices.
+        """
+        if self._price_getter is None:
+            self._price_getter = _tuple_getter(self._symbols)
+            self._last_quotes = self._last_px = None
+        try:
+            quotes = self._price_getter(current_prices)
+        except KeyError:
+            quotes = None
+        if quotes is not None:
+            if quotes != self._last_quotes:
+                self._last_px = np.array(quotes, dtype=np.float64)
+                self._last_quotes = quotes
+            return self._last_px
+        
+        n = len(self._symbols)
+        return np.fromiter(
+            (current_prices.get(symbol, entry) for symbol, entry in zip(self._symbols, self._entry_px[:n].tolist())),
+            dtype=np.float64,
+            count=n
+        )
+    
+    def _by_class(self, values: np.ndarray) -> Dict[str, float]:
+        """Sum per-position values by asset class, in order of first appearance"""
+        class_ids = self._class_id[:len(self._symbols)]
+        totals = np.bincount(class_ids, weights=values, minlength=len(_CLASS_ORDER))
+        _, first = np.unique(class_ids, return_index=True)
+        return {
+            _CLASS_NAMES[class_ids[j]]: float(totals[class_ids[j]])
+            for j in np.sort(first)
         }
     
     def calculate_portfolio_value(self, current_prices: Dict[str, float]) -> float:
         """Calculate total portfolio value"""
-        total_value = 0.0
-        
-        for symbol, position in self.positions.items():
-            asset = position["asset"]
-            pricer = self._get_pricer(asset)
-            
-            current_price = current_prices.get(symbol, position["entry_price"])
-            value = pricer.calculate_value(position["size"], current_price)
-            total_value += value
-        
-        return total_value
+        n = len(self._symbols)
+        px = self._current_prices(current_prices)
+        # NumPy sums pairwise, so error grows with log(n) rather than n
+        # when position values span several orders of magnitude
+        return float(np.sum(self._size[:n] * px * self._contract_size[:n]))
     
     def calculate_portfolio_pnl(self, current_prices: Dict[str, float]) -> Dict[str, Any]:
         """Calculate portfolio P&L breakdown"""
-        total_pnl = 0.0
-        pnl_by_asset = {}
-        pnl_by_class = {}
-        
-        for symbol, position in self.positions.items():
-            asset = position["asset"]
-            pricer = self._get_pricer(asset)
-            
-            current_price = current_prices.get(symbol, position["entry_price"])
-            pnl = pricer.calculate_pnl(
-                position["size"],
-                position["entry_price"],
-                current_price
-            )
-            
-            pnl_by_asset[symbol] = pnl
-            total_pnl += pnl
-            
-            # Aggregate by asset class
-            asset_class = asset.asset_class.value
-            pnl_by_class[asset_class] = pnl_by_class.get(asset_class, 0.0) + pnl
+        n = len(self._symbols)
+        px = self._current_prices(current_prices)
+        pnl = self._size[:n] * (px - self._entry_px[:n]) * self._contract_size[:n]
         
         return {
-            "total_pnl": total_pnl,
-            "pnl_by_asset": pnl_by_asset,
-            "pnl_by_class": pnl_by_class
+            "total_pnl": float(np.sum(pnl)),
+            "pnl_by_asset": dict(zip(self._symbols, pnl.tolist())),
+            "pnl_by_class": self._by_class(pnl)
         }
     
     def _get_pricer(self, asset: AssetMetadata) -> AssetPricer:
         """Get appropriate pricer for asset class"""
-        if asset.asset_class == AssetClass.STOCK:
-            return StockPricer(asset)
-        elif asset.asset_class == AssetClass.FUTURE:
-            return FuturePricer(asset)
-        elif asset.asset_class == AssetClass.OPTION:
-            return OptionPricer(asset)
-        elif asset.asset_class == AssetClass.CRYPTO:
-            return CryptoPricer(asset)
-        else:
-            return AssetPricer(asset)
+        return _PRICER_BY_CLASS.get(asset.asset_class, AssetPricer)(asset)
     
     def get_exposure_by_class(self, current_prices: Dict[str, float]) -> Dict[str, float]:
         """Get exposure breakdown by asset class"""
-        exposure = {}
-        
-        for symbol, position in self.positions.items():
-            asset = position["asset"]
-            pricer = self._get_pricer(asset)
-            
-            current_price = current_prices.get(symbol, position["entry_price"])
-            value = pricer.calculate_value(position["size"], current_price)
-            
-            asset_class = asset.asset_class.value
-            exposure[asset_class] = exposure.get(asset_class, 0.0) + value
-        
-        return exposure
+        n = len(self._symbols)
+        px = self._current_prices(current_prices)
+        return self._by_class(self._size[:n] * px * self._contract_size[:n])
 
 
 # Example asset definitions
@@ -410,3 +705,43 @@ EXAMPLE_ASSETS = [
         tick_size=0.01
     )
 ]
+
+# Asset-class index used by the portfolio's class_id column and the
+# per-class tables below; AssetClass keeps its string values for the API
+_CLASS_ORDER = tuple(AssetClass)
+_CLASS_INDEX = {asset_class: i for i, asset_class in enumerate(_CLASS_ORDER)}
+_CLASS_NAMES = tuple(asset_class.value for asset_class in _CLASS_ORDER)
+
+
+def _by_class_table(values: Dict[AssetClass, Any]) -> tuple:
+    """Order a per-class mapping by class index"""
+    return tuple(values[asset_class] for asset_class in _CLASS_ORDER)
+
+
+# VaR multipliers per asset class
+_VAR_MULTIPLIERS = _by_class_table({
+    AssetClass.STOCK: 1.0,
+    AssetClass.FUTURE: 1.5,
+    AssetClass.OPTION: 2.0,
+    AssetClass.CRYPTO: 2.5,
+    AssetClass.FX: 1.2,
+    AssetClass.COMMODITY: 1.3
+})
+
+# Base margin rates per asset class
+_MARGIN_RATES = _by_class_table({
+    AssetClass.STOCK: 0.50,      # 50% for stocks
+    AssetClass.FUTURE: 0.10,     # 10% for futures
+    AssetClass.OPTION: 1.00,     # 100% for options (cash secured)
+    AssetClass.CRYPTO: 0.75,     # 75% for crypto
+    AssetClass.FX: 0.02,         # 2% for FX
+    AssetClass.COMMODITY: 0.15   # 15% for commodities
+})
+
+# Pricer class per asset class; others use the base AssetPricer
+_PRICER_BY_CLASS = {
+    AssetClass.STOCK: StockPricer,
+    AssetClass.FUTURE: FuturePricer,
+    AssetClass.OPTION: OptionPricer,
+    AssetClass.CRYPTO: CryptoPricer
+}
@@ -101,7 +101,8 @@ async def score_determinism(
                 details={"runs_provided": len(request.runs), "runs_required": 2}
             )
         
-        # Score determinism
+        # Score determinism (bulk callers with raw dicts should use
+        # DeterminismScoringService.from_payload to reuse the compiled validator)
         result = DeterminismScoringService.score_determinism(request)
         
         # Create canonical response
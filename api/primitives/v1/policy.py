@@ -9,10 +9,10 @@ from services.policy_checking import (
     PolicyCheckingService
 )
 from security.auth import get_authenticated_user
-from schemas.primitives import create_canonical_response
+from schemas.primitives import PrimitiveJSONResponse, create_canonical_response
 from config import FeatureFlags
 
-router = APIRouter(prefix="/policy", tags=["policy"])
+router = APIRouter(prefix="/policy", tags=["policy"], default_response_class=PrimitiveJSONResponse)
 
 
 @router.post("/check", response_model=dict)
@@ -46,7 +46,7 @@ async def check_policy(
     
     # Build canonical response
     response = create_canonical_response(
-        data=response_data.dict(),
+        data=response_data.model_dump(),
         links={
             "self": f"/api/primitives/v1/policy/check",
             "docs": "/api/primitives/v1/docs#policy-checking",
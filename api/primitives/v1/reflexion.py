@@ -11,8 +11,13 @@ from services.reflexion_feedback import (
     ReflexionSuggestResponse
 )
 from security.auth import get_current_user_or_api_key, FeatureFlags, get_feature_flags
+from schemas.primitives import PrimitiveJSONResponse
 
-router = APIRouter(prefix="/reflexion", tags=["Reflexion Primitive"])
+router = APIRouter(
+    prefix="/reflexion",
+    tags=["Reflexion Primitive"],
+    default_response_class=PrimitiveJSONResponse
+)
 
 
 @router.post("/suggest", response_model=Dict[str, Any])
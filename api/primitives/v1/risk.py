@@ -9,10 +9,10 @@ from services.risk_validation import (
     RiskValidationService
 )
 from security.auth import get_authenticated_user
-from schemas.primitives import create_canonical_response
+from schemas.primitives import PrimitiveJSONResponse, create_canonical_response
 from config import FeatureFlags
 
-router = APIRouter(prefix="/risk", tags=["risk"])
+router = APIRouter(prefix="/risk", tags=["risk"], default_response_class=PrimitiveJSONResponse)
 
 
 @router.post("/validate", response_model=dict)
@@ -46,7 +46,7 @@ async def validate_risk(
     
     # Build canonical response
     response = create_canonical_response(
-        data=response_data.dict(),
+        data=response_data.model_dump(),
         links={
             "self": f"/api/primitives/v1/risk/validate",
             "docs": "/api/primitives/v1/docs#risk-validation",
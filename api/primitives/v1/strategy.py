@@ -1,10 +1,20 @@
 """
 Strategy verification primitive endpoint.
 """
-from fastapi import APIRouter, Depends, HTTPException
+import json
+
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
 from typing import Dict, Any
 from datetime import datetime
 
+try:
+    import fastjsonschema
+    HAS_FASTJSONSCHEMA = True
+except ImportError:
+    HAS_FASTJSONSCHEMA = False
+
 from services.strategy_verification import (
     StrategyVerificationService,
     StrategyVerifyRequest,
@@ -14,10 +24,56 @@ from security.auth import get_current_user_or_api_key, FeatureFlags, get_feature
 
 router = APIRouter(prefix="/strategy", tags=["Strategy Primitive"])
 
+# Request schema compiled once; None when fastjsonschema is unavailable
+_REQ_SCHEMA_VALIDATOR = (
+    fastjsonschema.compile(StrategyVerifyRequest.model_json_schema()) if HAS_FASTJSONSCHEMA else None
+)
+
 
-@router.post("/verify", response_model=Dict[str, Any])
+def _parse_verify_request(body: bytes) -> StrategyVerifyRequest:
+    """
+    Parse and validate a verify request body.
+    
+    Bodies accepted by the compiled schema skip pydantic validation. Anything
+    else goes through model_validate_json so the 422 carries pydantic's error
+    details.
+    """
+    if _REQ_SCHEMA_VALIDATOR is not None:
+        try:
+            data = json.loads(body)
+            _REQ_SCHEMA_VALIDATOR(data)
+        except ValueError:
+            # Malformed JSON or schema violation (JsonSchemaException is a ValueError)
+            pass
+        else:
+            return StrategyVerifyRequest.model_construct(
+                strategy_id=data["strategy_id"],
+                strategy_type=data["strategy_type"],
+                parameters=data["parameters"],
+                context=data.get("context")
+            )
+    
+    try:
+        return StrategyVerifyRequest.model_validate_json(body)
+    except ValidationError as e:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in e.errors()]
+        )
+
+
+@router.post(
+    "/verify",
+    response_model=Dict[str, Any],
+    # The body is parsed by hand below, so its schema is declared here
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": StrategyVerifyRequest.model_json_schema()}}
+        }
+    }
+)
 async def verify_strategy(
-    request: StrategyVerifyRequest,
+    request: Request,
     user=Depends(get_current_user_or_api_key),
     feature_flags: FeatureFlags = Depends(get_feature_flags)
 ):
@@ -32,6 +88,8 @@ async def verify_strategy(
     - Business logic rules
     - Risk management consistency
     """
+    payload = _parse_verify_request(await request.body())
+    
     # Check if strategy primitive is enabled
     try:
         feature_flags.check_primitive_enabled("strategy")
@@ -40,10 +98,10 @@ async def verify_strategy(
     
     # Verify strategy
     result = StrategyVerificationService.verify_strategy(
-        strategy_id=request.strategy_id,
-        strategy_type=request.strategy_type,
-        parameters=request.parameters,
-        context=request.context
+        strategy_id=payload.strategy_id,
+        strategy_type=payload.strategy_type,
+        parameters=payload.parameters,
+        context=payload.context
     )
     
     # Canonical response envelope
@@ -52,17 +110,7 @@ async def verify_strategy(
             "strategy_id": result.strategy_id,
             "valid": result.valid,
             "validation_score": result.validation_score,
-            "checks": [
-                {
-                    "check_name": check.check_name,
-                    "passed": check.passed,
-                    "severity": check.severity,
-                    "message": check.message,
-                    "actual_value": check.actual_value,
-                    "expected_range": check.expected_range
-                }
-                for check in result.checks
-            ],
+            "checks": result.checks,
             "issues": result.issues,
             "warnings": result.warnings,
             "summary": result.summary
@@ -8,11 +8,22 @@ All primitive endpoints use a standardized response format:
 
 This ensures consistent client experience across all primitives.
 """
+from fastapi.responses import JSONResponse, ORJSONResponse
 from pydantic import BaseModel, Field
 from typing import Any, Dict, Optional
 from datetime import datetime
 from uuid import UUID, uuid4
 
+try:
+    import orjson  # noqa: F401
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+# Response class for primitive endpoints; orjson serializes in C when installed
+PrimitiveJSONResponse = ORJSONResponse if HAS_ORJSON else JSONResponse
+
 
 class ResponseMeta(BaseModel):
     """
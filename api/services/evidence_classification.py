@@ -3,9 +3,25 @@ Evidence classification service for primitive API.
 """
 from typing import Dict, Any, Optional
 from pydantic import BaseModel, Field
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from enum import Enum
 
+import numpy as np
+
+try:
+    import ciso8601
+    HAS_CISO8601 = True
+except ImportError:
+    HAS_CISO8601 = False
+
+
+def _parse_timestamp(timestamp: str) -> datetime:
+    """Parse an ISO 8601 timestamp, using the C parser when available."""
+    if HAS_CISO8601:
+        return ciso8601.parse_datetime(timestamp)
+    return datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+
 
 class EvidenceType(str, Enum):
     """Types of evidence."""
@@ -28,6 +44,142 @@ class EvidenceClassification(str, Enum):
     VALID = "valid"
 
 
+# Gate-check status code classes (2 bits each)
+_STATUS_OK = 0
+_STATUS_CONTRACT_FAILURE = 1
+_STATUS_SERVER_ERROR = 2
+_STATUS_OTHER = 3
+
+# Representative status code for each class, used to build the decision table
+_STATUS_CLASS_SAMPLES = {
+    _STATUS_OK: 200,
+    _STATUS_CONTRACT_FAILURE: 404,
+    _STATUS_SERVER_ERROR: 500,
+    _STATUS_OTHER: 301,
+}
+
+
+def _status_class(code: int) -> int:
+    """Map an HTTP status code to its gate-check class."""
+    if code == 200:
+        return _STATUS_OK
+    if code == 404 or code == 422:
+        return _STATUS_CONTRACT_FAILURE
+    if code >= 500:
+        return _STATUS_SERVER_ERROR
+    return _STATUS_OTHER
+
+
+def _decide_gate_check(dev: int, crv: int, product: int) -> tuple[EvidenceClassification, float]:
+    """Gate-check classification matching parse_acceptance_evidence_metadata."""
+    if dev == 200 and crv == 200 and product == 200:
+        return EvidenceClassification.CONTRACT_VALID_SUCCESS, 1.0
+    elif dev == 200 and crv in {404, 422} and product in {404, 422}:
+        return EvidenceClassification.CONTRACT_VALID_FAILURE, 0.9
+    elif any(code >= 500 for code in (dev, crv, product)) or dev == 0:
+        return EvidenceClassification.CONTRACT_INVALID_FAILURE, 0.7
+    else:
+        return EvidenceClassification.MIXED, 0.6
+
+
+# Decision table keyed by packed (dev, crv, product) status classes
+_GATE_TABLE: Dict[int, tuple[EvidenceClassification, float]] = {
+    (dev_class << 4) | (crv_class << 2) | product_class: _decide_gate_check(
+        _STATUS_CLASS_SAMPLES[dev_class],
+        _STATUS_CLASS_SAMPLES[crv_class],
+        _STATUS_CLASS_SAMPLES[product_class],
+    )
+    for dev_class in _STATUS_CLASS_SAMPLES
+    for crv_class in _STATUS_CLASS_SAMPLES
+    for product_class in _STATUS_CLASS_SAMPLES
+}
+
+
+# Gate-check outcomes indexed by _classify_gate_codes results
+_GATE_STATUS_FIELDS = ("dev_status", "crv_status", "product_status")
+_GATE_OUTCOMES = (
+    (EvidenceClassification.CONTRACT_VALID_SUCCESS, 1.0),
+    (EvidenceClassification.CONTRACT_VALID_FAILURE, 0.9),
+    (EvidenceClassification.CONTRACT_INVALID_FAILURE, 0.7),
+    (EvidenceClassification.MIXED, 0.6),
+)
+
+
+def _classify_gate_codes(codes: np.ndarray) -> np.ndarray:
+    """Vectorized _decide_gate_check over an (M, 3) array of status codes."""
+    dev = codes[:, 0]
+    crv = codes[:, 1]
+    product = codes[:, 2]
+    contract_failures = [404, 422]
+    
+    success = (codes == 200).all(axis=1)
+    valid_failure = (dev == 200) & np.isin(crv, contract_failures) & np.isin(product, contract_failures)
+    invalid_failure = (codes >= 500).any(axis=1) | (dev == 0)
+    return np.select([success, valid_failure, invalid_failure], [0, 1, 2], default=3)
+
+
+# Required data fields per evidence type
+_REQUIRED_BACKTEST = ("sharpe_ratio", "max_drawdown", "total_return", "num_trades")
+_REQUIRED_PRODUCTION = ("uptime", "error_rate", "latency_p95")
+
+
+@dataclass(slots=True)
+class _QualityIndicators:
+    """Fixed quality-indicator flags; unset (None) flags are not reported."""
+    
+    def as_dict(self) -> Dict[str, bool]:
+        """Materialize the flags that were evaluated, in declaration order."""
+        indicators = {}
+        for name in self.__slots__:
+            value = getattr(self, name)
+            if value is not None:
+                indicators[name] = value
+        return indicators
+
+
+@dataclass(slots=True)
+class _GateCheckQuality(_QualityIndicators):
+    has_dev_status: bool = False
+    has_crv_status: bool = False
+    has_product_status: bool = False
+    has_environment: bool = False
+
+
+@dataclass(slots=True)
+class _BacktestQuality(_QualityIndicators):
+    # has_* flags first, in _REQUIRED_BACKTEST order
+    has_sharpe_ratio: bool = False
+    has_max_drawdown: bool = False
+    has_total_return: bool = False
+    has_num_trades: bool = False
+    sharpe_positive: Optional[bool] = None
+    drawdown_acceptable: Optional[bool] = None
+    sufficient_trades: Optional[bool] = None
+
+
+@dataclass(slots=True)
+class _ValidationQuality(_QualityIndicators):
+    has_status: bool = False
+    completed: Optional[bool] = None
+    has_metrics: Optional[bool] = None
+
+
+@dataclass(slots=True)
+class _AcceptanceTestQuality(_QualityIndicators):
+    has_result: bool = False
+    all_tests_passed: Optional[bool] = None
+
+
+@dataclass(slots=True)
+class _ProductionMetricsQuality(_QualityIndicators):
+    # has_* flags first, in _REQUIRED_PRODUCTION order
+    has_uptime: bool = False
+    has_error_rate: bool = False
+    has_latency_p95: bool = False
+    high_uptime: Optional[bool] = None
+    low_error_rate: Optional[bool] = None
+
+
 class EvidenceClassifyRequest(BaseModel):
     """Request for evidence classification."""
     evidence_id: str
@@ -83,7 +235,8 @@ class EvidenceClassificationService:
         evidence_type: EvidenceType,
         data: Dict[str, Any],
         timestamp: Optional[str] = None,
-        max_age_hours: int = 24
+        max_age_hours: int = 24,
+        now: Optional[datetime] = None
     ) -> EvidenceClassifyResponse:
         """
         Classify evidence based on type, freshness, and content.
@@ -94,22 +247,91 @@ class EvidenceClassificationService:
         - Validation: Based on completion status and results
         - Stale: If evidence exceeds max_age_hours
         - Incomplete: If required fields are missing
+        
+        ``now`` may be supplied to share one reference time across a batch.
         """
-        warnings = []
+        if now is None:
+            now = datetime.now(timezone.utc)
+        
+        # Classify based on evidence type
         missing_fields = []
-        quality_indicators = {}
+        classifier = _EVIDENCE_CLASSIFIERS.get(evidence_type)
+        classified = classifier(data, missing_fields) if classifier is not None else None
+        
+        return EvidenceClassificationService._build_response(
+            evidence_id, evidence_type, classified, missing_fields, timestamp, max_age_hours, now
+        )
+    
+    @staticmethod
+    def classify_evidence_batch(
+        requests: list[EvidenceClassifyRequest]
+    ) -> list[EvidenceClassifyResponse]:
+        """
+        Classify several evidence items against a single reference time.
+        
+        Complete gate checks are classified together with vectorized
+        status-code comparisons; other items use the per-type classifiers.
+        """
+        now = datetime.now(timezone.utc)
+        
+        gate_indices = [
+            index for index, request in enumerate(requests)
+            if request.evidence_type == EvidenceType.GATE_CHECK
+            and all(request.data.get(field) is not None for field in _GATE_STATUS_FIELDS)
+        ]
+        gate_results = {}
+        if gate_indices:
+            codes = np.array(
+                [[int(requests[index].data[field] or 0) for field in _GATE_STATUS_FIELDS] for index in gate_indices],
+                dtype=np.int64
+            )
+            for index, outcome in zip(gate_indices, _classify_gate_codes(codes).tolist()):
+                quality = _GateCheckQuality(True, True, True, "environment" in requests[index].data)
+                gate_results[index] = (*_GATE_OUTCOMES[outcome], quality)
+        
+        responses = []
+        for index, request in enumerate(requests):
+            missing_fields = []
+            classified = gate_results.get(index)
+            if classified is None:
+                classifier = _EVIDENCE_CLASSIFIERS.get(request.evidence_type)
+                if classifier is not None:
+                    classified = classifier(request.data, missing_fields)
+            responses.append(EvidenceClassificationService._build_response(
+                request.evidence_id,
+                request.evidence_type,
+                classified,
+                missing_fields,
+                request.timestamp,
+                request.max_age_hours,
+                now
+            ))
+        return responses
+    
+    @staticmethod
+    def _build_response(
+        evidence_id: str,
+        evidence_type: EvidenceType,
+        classified: Optional[tuple[EvidenceClassification, float, _QualityIndicators]],
+        missing_fields: list[str],
+        timestamp: Optional[str],
+        max_age_hours: int,
+        now: datetime
+    ) -> EvidenceClassifyResponse:
+        """Apply freshness, completeness and recommendations to a classification result."""
+        now_iso = now.isoformat()
+        warnings = []
         
         # Parse timestamp and check freshness
         evidence_ts = None
         if timestamp:
             try:
-                evidence_ts = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+                evidence_ts = _parse_timestamp(timestamp)
                 if evidence_ts.tzinfo is None:
                     evidence_ts = evidence_ts.replace(tzinfo=timezone.utc)
             except Exception:
                 warnings.append("Invalid timestamp format")
         
-        now = datetime.now(timezone.utc)
         is_fresh = True
         age_hours = None
         
@@ -122,27 +344,13 @@ class EvidenceClassificationService:
         else:
             warnings.append("No timestamp provided - cannot verify freshness")
         
-        # Classify based on evidence type
-        classification = None
-        confidence = 1.0
         recommendations = []
         
-        if evidence_type == EvidenceType.GATE_CHECK:
-            classification, conf = EvidenceClassificationService._classify_gate_check(data, quality_indicators, missing_fields)
-            confidence = conf
-        elif evidence_type == EvidenceType.BACKTEST:
-            classification, conf = EvidenceClassificationService._classify_backtest(data, quality_indicators, missing_fields)
-            confidence = conf
-        elif evidence_type == EvidenceType.VALIDATION:
-            classification, conf = EvidenceClassificationService._classify_validation(data, quality_indicators, missing_fields)
-            confidence = conf
-        elif evidence_type == EvidenceType.ACCEPTANCE_TEST:
-            classification, conf = EvidenceClassificationService._classify_acceptance_test(data, quality_indicators, missing_fields)
-            confidence = conf
-        elif evidence_type == EvidenceType.PRODUCTION_METRICS:
-            classification, conf = EvidenceClassificationService._classify_production_metrics(data, quality_indicators, missing_fields)
-            confidence = conf
+        if classified is not None:
+            classification, confidence, quality = classified
+            quality_indicators = quality.as_dict()
         else:
+            quality_indicators = {}
             classification = EvidenceClassification.INCOMPLETE
             confidence = 0.5
             warnings.append(f"Unknown evidence type: {evidence_type}")
@@ -159,8 +367,8 @@ class EvidenceClassificationService:
         
         # Calculate completeness score
         total_quality = len(quality_indicators)
-        passed_quality = sum(1 for v in quality_indicators.values() if v)
-        completeness_score = (passed_quality / total_quality * 100) if total_quality > 0 else 0
+        passed_quality = sum(quality_indicators.values())  # values are all bool
+        completeness_score = (passed_quality / total_quality * 100) if total_quality > 0 else 0.0
         
         # Generate recommendations
         if classification == EvidenceClassification.CONTRACT_VALID_FAILURE:
@@ -182,11 +390,12 @@ class EvidenceClassificationService:
         else:
             summary += f"(stale, {age_hours:.1f}h old)"
         
-        return EvidenceClassifyResponse(
+        # Fields are built internally, so skip re-validation
+        return EvidenceClassifyResponse.model_construct(
             evidence_id=evidence_id,
             classification=classification,
             confidence=confidence,
-            details=EvidenceDetails(
+            details=EvidenceDetails.model_construct(
                 is_fresh=is_fresh,
                 age_hours=age_hours,
                 completeness_score=completeness_score,
@@ -196,20 +405,22 @@ class EvidenceClassificationService:
             ),
             summary=summary,
             recommendations=recommendations,
-            timestamp=datetime.utcnow().isoformat()
+            timestamp=now_iso
         )
     
     @staticmethod
-    def _classify_gate_check(data: Dict[str, Any], quality_indicators: Dict[str, bool], missing_fields: list[str]) -> tuple[EvidenceClassification, float]:
+    def _classify_gate_check(data: Dict[str, Any], missing_fields: list[str]) -> tuple[EvidenceClassification, float, _GateCheckQuality]:
         """Classify gate check evidence based on status codes."""
         dev_status = data.get("dev_status")
         crv_status = data.get("crv_status")
         product_status = data.get("product_status")
         
-        quality_indicators["has_dev_status"] = dev_status is not None
-        quality_indicators["has_crv_status"] = crv_status is not None
-        quality_indicators["has_product_status"] = product_status is not None
-        quality_indicators["has_environment"] = "environment" in data
+        quality = _GateCheckQuality(
+            has_dev_status=dev_status is not None,
+            has_crv_status=crv_status is not None,
+            has_product_status=product_status is not None,
+            has_environment="environment" in data
+        )
         
         if dev_status is None:
             missing_fields.append("dev_status")
@@ -219,109 +430,110 @@ class EvidenceClassificationService:
             missing_fields.append("product_status")
         
         if missing_fields:
-            return EvidenceClassification.INCOMPLETE, 0.3
+            return EvidenceClassification.INCOMPLETE, 0.3, quality
         
         # Convert to int for comparison
         dev = int(dev_status or 0)
         crv = int(crv_status or 0)
         product = int(product_status or 0)
         
-        # Classification logic matching parse_acceptance_evidence_metadata
-        if dev == 200 and crv == 200 and product == 200:
-            return EvidenceClassification.CONTRACT_VALID_SUCCESS, 1.0
-        elif dev == 200 and crv in {404, 422} and product in {404, 422}:
-            return EvidenceClassification.CONTRACT_VALID_FAILURE, 0.9
-        elif any(code >= 500 for code in (dev, crv, product)) or dev == 0:
-            return EvidenceClassification.CONTRACT_INVALID_FAILURE, 0.7
-        else:
-            return EvidenceClassification.MIXED, 0.6
+        # A missing/zero dev status is always a contract violation
+        if dev == 0:
+            return EvidenceClassification.CONTRACT_INVALID_FAILURE, 0.7, quality
+        
+        key = (_status_class(dev) << 4) | (_status_class(crv) << 2) | _status_class(product)
+        classification, confidence = _GATE_TABLE[key]
+        return classification, confidence, quality
     
     @staticmethod
-    def _classify_backtest(data: Dict[str, Any], quality_indicators: Dict[str, bool], missing_fields: list[str]) -> tuple[EvidenceClassification, float]:
+    def _classify_backtest(data: Dict[str, Any], missing_fields: list[str]) -> tuple[EvidenceClassification, float, _BacktestQuality]:
         """Classify backtest evidence."""
-        required_fields = ["sharpe_ratio", "max_drawdown", "total_return", "num_trades"]
-        
-        for field in required_fields:
-            has_field = field in data and data[field] is not None
-            quality_indicators[f"has_{field}"] = has_field
-            if not has_field:
+        values = [data.get(field) for field in _REQUIRED_BACKTEST]
+        quality = _BacktestQuality(*(value is not None for value in values))
+        for field, value in zip(_REQUIRED_BACKTEST, values):
+            if value is None:
                 missing_fields.append(field)
         
         if missing_fields:
-            return EvidenceClassification.INCOMPLETE, 0.3
+            return EvidenceClassification.INCOMPLETE, 0.3, quality
         
         # Check quality thresholds
-        sharpe = data.get("sharpe_ratio", 0)
-        drawdown = data.get("max_drawdown", 1.0)
-        num_trades = data.get("num_trades", 0)
+        sharpe, drawdown, _, num_trades = values
         
-        quality_indicators["sharpe_positive"] = sharpe > 0
-        quality_indicators["drawdown_acceptable"] = drawdown < 0.5
-        quality_indicators["sufficient_trades"] = num_trades >= 10
+        quality.sharpe_positive = sharpe > 0
+        quality.drawdown_acceptable = drawdown < 0.5
+        quality.sufficient_trades = num_trades >= 10
         
         if sharpe > 0 and drawdown < 0.5 and num_trades >= 10:
-            return EvidenceClassification.VALID, 1.0
+            return EvidenceClassification.VALID, 1.0, quality
         else:
-            return EvidenceClassification.CONTRACT_VALID_FAILURE, 0.7
+            return EvidenceClassification.CONTRACT_VALID_FAILURE, 0.7, quality
     
     @staticmethod
-    def _classify_validation(data: Dict[str, Any], quality_indicators: Dict[str, bool], missing_fields: list[str]) -> tuple[EvidenceClassification, float]:
+    def _classify_validation(data: Dict[str, Any], missing_fields: list[str]) -> tuple[EvidenceClassification, float, _ValidationQuality]:
         """Classify validation evidence."""
         status = data.get("status")
-        quality_indicators["has_status"] = status is not None
+        quality = _ValidationQuality(has_status=status is not None)
         
         if status is None:
             missing_fields.append("status")
-            return EvidenceClassification.INCOMPLETE, 0.3
+            return EvidenceClassification.INCOMPLETE, 0.3, quality
         
-        quality_indicators["completed"] = status == "completed"
-        quality_indicators["has_metrics"] = "metrics" in data
+        quality.completed = status == "completed"
+        quality.has_metrics = "metrics" in data
         
         if status == "completed":
-            return EvidenceClassification.VALID, 1.0
+            return EvidenceClassification.VALID, 1.0, quality
         elif status == "failed":
-            return EvidenceClassification.CONTRACT_VALID_FAILURE, 0.8
+            return EvidenceClassification.CONTRACT_VALID_FAILURE, 0.8, quality
         else:
-            return EvidenceClassification.INCOMPLETE, 0.5
+            return EvidenceClassification.INCOMPLETE, 0.5, quality
     
     @staticmethod
-    def _classify_acceptance_test(data: Dict[str, Any], quality_indicators: Dict[str, bool], missing_fields: list[str]) -> tuple[EvidenceClassification, float]:
+    def _classify_acceptance_test(data: Dict[str, Any], missing_fields: list[str]) -> tuple[EvidenceClassification, float, _AcceptanceTestQuality]:
         """Classify acceptance test evidence."""
         passed = data.get("passed")
-        quality_indicators["has_result"] = passed is not None
+        quality = _AcceptanceTestQuality(has_result=passed is not None)
         
         if passed is None:
             missing_fields.append("passed")
-            return EvidenceClassification.INCOMPLETE, 0.3
+            return EvidenceClassification.INCOMPLETE, 0.3, quality
         
-        quality_indicators["all_tests_passed"] = passed is True
+        quality.all_tests_passed = passed is True
         
         if passed:
-            return EvidenceClassification.CONTRACT_VALID_SUCCESS, 1.0
+            return EvidenceClassification.CONTRACT_VALID_SUCCESS, 1.0, quality
         else:
-            return EvidenceClassification.CONTRACT_VALID_FAILURE, 0.9
+            return EvidenceClassification.CONTRACT_VALID_FAILURE, 0.9, quality
     
     @staticmethod
-    def _classify_production_metrics(data: Dict[str, Any], quality_indicators: Dict[str, bool], missing_fields: list[str]) -> tuple[EvidenceClassification, float]:
+    def _classify_production_metrics(data: Dict[str, Any], missing_fields: list[str]) -> tuple[EvidenceClassification, float, _ProductionMetricsQuality]:
         """Classify production metrics evidence."""
-        required_fields = ["uptime", "error_rate", "latency_p95"]
-        
-        for field in required_fields:
-            has_field = field in data and data[field] is not None
-            quality_indicators[f"has_{field}"] = has_field
-            if not has_field:
+        values = [data.get(field) for field in _REQUIRED_PRODUCTION]
+        quality = _ProductionMetricsQuality(*(value is not None for value in values))
+        for field, value in zip(_REQUIRED_PRODUCTION, values):
+            if value is None:
                 missing_fields.append(field)
         
         if missing_fields:
-            return EvidenceClassification.INCOMPLETE, 0.3
+            return EvidenceClassification.INCOMPLETE, 0.3, quality
         
-        uptime = data.get("uptime", 0)
-        error_rate = data.get("error_rate", 1.0)
+        uptime, error_rate, _ = values
         
-        quality_indicators["high_uptime"] = uptime >= 0.99
-        quality_indicators["low_error_rate"] = error_rate <= 0.01
+        quality.high_uptime = uptime >= 0.99
+        quality.low_error_rate = error_rate <= 0.01
         
         if uptime >= 0.99 and error_rate <= 0.01:
-            return EvidenceClassification.VALID, 1.0
+            return EvidenceClassification.VALID, 1.0, quality
         else:
-            return EvidenceClassification.CONTRACT_VALID_FAILURE, 0.7
+            return EvidenceClassification.CONTRACT_VALID_FAILURE, 0.7, quality
+
+
+# Evidence type -> classifier dispatch table
+_EVIDENCE_CLASSIFIERS = {
+    EvidenceType.GATE_CHECK: EvidenceClassificationService._classify_gate_check,
+    EvidenceType.BACKTEST: EvidenceClassificationService._classify_backtest,
+    EvidenceType.VALIDATION: EvidenceClassificationService._classify_validation,
+    EvidenceType.ACCEPTANCE_TEST: EvidenceClassificationService._classify_acceptance_test,
+    EvidenceType.PRODUCTION_METRICS: EvidenceClassificationService._classify_production_metrics,
+}
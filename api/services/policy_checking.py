@@ -1,7 +1,16 @@
 """Policy checking service for primitive API."""
 
+import sys
 from typing import Dict, Any, Optional, List
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
+
+
+# Numeric limits for the built-in rules
+_RULE_THRESHOLDS = {
+    "max_drawdown_regulatory": 0.25,  # 25%
+    "max_leverage_regulatory": 2.0,  # 2x
+    "turnover_constraint": 5.0,  # 5x
+}
 
 
 class PolicyRule(BaseModel):
@@ -10,6 +19,12 @@ class PolicyRule(BaseModel):
     rule_type: str = Field(..., description="regulatory, business, governance, compliance")
     description: str
     severity: str = "error"  # error, warning, info
+    
+    @field_validator("rule_id")
+    @classmethod
+    def intern_rule_id(cls, value: str) -> str:
+        """Intern rule IDs parsed from requests so evaluator lookups hit by identity."""
+        return sys.intern(value)
 
 
 class PolicyCheckResult(BaseModel):
@@ -103,7 +118,8 @@ class PolicyCheckingService:
     def check_policies(
         strategy_id: str,
         context: Dict[str, Any],
-        rules: Optional[List[PolicyRule]] = None
+        rules: Optional[List[PolicyRule]] = None,
+        fast_fail: bool = False
     ) -> PolicyCheckResponse:
         """
         Check policy compliance based on context data.
@@ -112,34 +128,43 @@ class PolicyCheckingService:
             strategy_id: Strategy identifier
             context: Context data for policy evaluation
             rules: Custom rules to check (uses defaults if None)
+            fast_fail: Stop at the first error-severity violation. The
+                verdict is unchanged, but ``checks`` and ``compliance_score``
+                only cover the rules evaluated up to that point.
         
         Returns:
             PolicyCheckResponse with compliance results
         """
         # Use default rules if not provided
-        active_rules = rules or PolicyCheckingService.DEFAULT_RULES
+        if rules:
+            plan = PolicyCheckingService._plan_rules(rules)
+        else:
+            plan = _DEFAULT_PLAN
         
         checks = []
         blockers = []
         warnings = []
+        passed_count = 0
         
-        for rule in active_rules:
-            check_result = PolicyCheckingService._evaluate_rule(rule, context)
+        for rule_id, severity, evaluator, rule in plan:
+            check_result = evaluator(rule, context)
             checks.append(check_result)
             
-            if not check_result.passed:
-                if check_result.severity == "error":
-                    blockers.append(f"{rule.rule_id}: {check_result.message}")
-                elif check_result.severity == "warning":
-                    warnings.append(f"{rule.rule_id}: {check_result.message}")
+            if check_result.passed:
+                passed_count += 1
+            else:
+                if severity == "error":
+                    blockers.append(f"{rule_id}: {check_result.message}")
+                    if fast_fail:
+                        break
+                elif severity == "warning":
+                    warnings.append(f"{rule_id}: {check_result.message}")
         
-        # Calculate overall status
-        error_checks = [c for c in checks if c.severity == "error"]
-        passed = all(c.passed for c in error_checks) if error_checks else True
+        # Every failed error-severity rule is a blocker
+        passed = not blockers
         
         # Calculate compliance score
         if checks:
-            passed_count = sum(1 for c in checks if c.passed)
             compliance_score = (passed_count / len(checks)) * 100
         else:
             compliance_score = 100.0
@@ -150,7 +175,7 @@ class PolicyCheckingService:
         else:
             summary = f"{len(blockers)} critical policy violation(s) detected"
         
-        return PolicyCheckResponse(
+        return PolicyCheckResponse.model_construct(
             strategy_id=strategy_id,
             passed=passed,
             compliance_score=round(compliance_score, 1),
@@ -160,11 +185,29 @@ class PolicyCheckingService:
             summary=summary
         )
     
+    @staticmethod
+    def _plan_rules(rules: List[PolicyRule]) -> List[tuple]:
+        """
+        Resolve rules to (rule_id, severity, evaluator, rule) tuples.
+        
+        Evaluators are looked up once per distinct rule_id; rule IDs without
+        a dedicated evaluator go to the generic fallback. Rule order and
+        duplicates are preserved.
+        """
+        rule_ids = {rule.rule_id for rule in rules}
+        by_id = dict.fromkeys(rule_ids, PolicyCheckingService._eval_generic)
+        for rule_id in _RULE_EVALUATORS.keys() & rule_ids:
+            by_id[rule_id] = _RULE_EVALUATORS[rule_id]
+        return [(rule.rule_id, rule.severity, by_id[rule.rule_id], rule) for rule in rules]
+    
     @staticmethod
     def _evaluate_rule(rule: PolicyRule, context: Dict[str, Any]) -> PolicyCheckResult:
         """
         Evaluate a single policy rule against context.
         
+        Known rule IDs dispatch through ``_RULE_EVALUATORS``; anything else
+        falls back to the generic evaluator.
+        
         Args:
             rule: Policy rule to evaluate
             context: Context data
@@ -172,79 +215,94 @@ class PolicyCheckingService:
         Returns:
             PolicyCheckResult
         """
-        # Max drawdown check
-        if rule.rule_id == "max_drawdown_regulatory":
-            max_dd = context.get("max_drawdown", 1.0)
-            threshold = 0.25  # 25%
-            passed = max_dd <= threshold
-            return PolicyCheckResult(
-                rule_id=rule.rule_id,
-                passed=passed,
-                message=f"Max drawdown is {max_dd:.1%} (limit: {threshold:.1%})",
-                severity=rule.severity,
-                recommendation="Reduce position sizes or add stop-losses" if not passed else None
-            )
-        
-        # Max leverage check
-        elif rule.rule_id == "max_leverage_regulatory":
-            max_lev = context.get("max_leverage", 0.0)
-            threshold = 2.0  # 2x
-            passed = max_lev <= threshold
-            return PolicyCheckResult(
-                rule_id=rule.rule_id,
-                passed=passed,
-                message=f"Max leverage is {max_lev:.1f}x (limit: {threshold:.1f}x)",
-                severity=rule.severity,
-                recommendation="Reduce leverage ratio" if not passed else None
-            )
-        
-        # Lineage completeness check
-        elif rule.rule_id == "lineage_completeness":
-            lineage_complete = context.get("lineage_complete", False)
-            passed = bool(lineage_complete)
-            return PolicyCheckResult(
-                rule_id=rule.rule_id,
-                passed=passed,
-                message="Data lineage is complete" if passed else "Data lineage is incomplete",
-                severity=rule.severity,
-                recommendation="Complete run_identity, data_provenance, transformation_lineage fields" if not passed else None
-            )
-        
-        # Governance compliance check
-        elif rule.rule_id == "governance_compliance":
-            gov_compliant = context.get("governance_compliant", False)
-            passed = bool(gov_compliant)
-            return PolicyCheckResult(
-                rule_id=rule.rule_id,
-                passed=passed,
-                message="Governance policies met" if passed else "Governance policies not met",
-                severity=rule.severity,
-                recommendation="Review governance requirements and update strategy" if not passed else None
-            )
-        
-        # Turnover constraint check
-        elif rule.rule_id == "turnover_constraint":
-            turnover = context.get("turnover_rate", 0.0)
-            threshold = 5.0  # 5x
-            passed = turnover <= threshold
-            return PolicyCheckResult(
-                rule_id=rule.rule_id,
-                passed=passed,
-                message=f"Turnover rate is {turnover:.1f}x (recommended: <{threshold:.1f}x)",
-                severity=rule.severity,
-                recommendation="Consider reducing trading frequency to lower costs" if not passed else None
-            )
-        
-        # Generic rule evaluation (fallback)
-        else:
-            # Try to infer from rule description and context
-            passed = True  # Default to pass for unknown rules
-            message = f"{rule.description} - evaluation pending"
-            
-            return PolicyCheckResult(
-                rule_id=rule.rule_id,
-                passed=passed,
-                message=message,
-                severity=rule.severity,
-                recommendation=None
-            )
+        evaluator = _RULE_EVALUATORS.get(rule.rule_id, PolicyCheckingService._eval_generic)
+        return evaluator(rule, context)
+    
+    @staticmethod
+    def _eval_max_drawdown(rule: PolicyRule, context: Dict[str, Any]) -> PolicyCheckResult:
+        """Max drawdown check."""
+        max_dd = context.get("max_drawdown", 1.0)
+        threshold = _RULE_THRESHOLDS["max_drawdown_regulatory"]
+        passed = bool(max_dd <= threshold)
+        return PolicyCheckResult.model_construct(
+            rule_id=rule.rule_id,
+            passed=passed,
+            message=f"Max drawdown is {max_dd:.1%} (limit: {threshold:.1%})",
+            severity=rule.severity,
+            recommendation="Reduce position sizes or add stop-losses" if not passed else None
+        )
+    
+    @staticmethod
+    def _eval_max_leverage(rule: PolicyRule, context: Dict[str, Any]) -> PolicyCheckResult:
+        """Max leverage check."""
+        max_lev = context.get("max_leverage", 0.0)
+        threshold = _RULE_THRESHOLDS["max_leverage_regulatory"]
+        passed = bool(max_lev <= threshold)
+        return PolicyCheckResult.model_construct(
+            rule_id=rule.rule_id,
+            passed=passed,
+            message=f"Max leverage is {max_lev:.1f}x (limit: {threshold:.1f}x)",
+            severity=rule.severity,
+            recommendation="Reduce leverage ratio" if not passed else None
+        )
+    
+    @staticmethod
+    def _eval_lineage(rule: PolicyRule, context: Dict[str, Any]) -> PolicyCheckResult:
+        """Lineage completeness check."""
+        passed = bool(context.get("lineage_complete", False))
+        return PolicyCheckResult.model_construct(
+            rule_id=rule.rule_id,
+            passed=passed,
+            message="Data lineage is complete" if passed else "Data lineage is incomplete",
+            severity=rule.severity,
+            recommendation="Complete run_identity, data_provenance, transformation_lineage fields" if not passed else None
+        )
+    
+    @staticmethod
+    def _eval_governance(rule: PolicyRule, context: Dict[str, Any]) -> PolicyCheckResult:
+        """Governance compliance check."""
+        passed = bool(context.get("governance_compliant", False))
+        return PolicyCheckResult.model_construct(
+            rule_id=rule.rule_id,
+            passed=passed,
+            message="Governance policies met" if passed else "Governance policies not met",
+            severity=rule.severity,
+            recommendation="Review governance requirements and update strategy" if not passed else None
+        )
+    
+    @staticmethod
+    def _eval_turnover(rule: PolicyRule, context: Dict[str, Any]) -> PolicyCheckResult:
+        """Turnover constraint check."""
+        turnover = context.get("turnover_rate", 0.0)
+        threshold = _RULE_THRESHOLDS["turnover_constraint"]
+        passed = bool(turnover <= threshold)
+        return PolicyCheckResult.model_construct(
+            rule_id=rule.rule_id,
+            passed=passed,
+            message=f"Turnover rate is {turnover:.1f}x (recommended: <{threshold:.1f}x)",
+            severity=rule.severity,
+            recommendation="Consider reducing trading frequency to lower costs" if not passed else None
+        )
+    
+    @staticmethod
+    def _eval_generic(rule: PolicyRule, context: Dict[str, Any]) -> PolicyCheckResult:
+        """Generic rule evaluation (fallback); unknown rules default to pass."""
+        return PolicyCheckResult.model_construct(
+            rule_id=rule.rule_id,
+            passed=True,
+            message=f"{rule.description} - evaluation pending",
+            severity=rule.severity,
+            recommendation=None
+        )
+
+
+_RULE_EVALUATORS = {
+    "max_drawdown_regulatory": PolicyCheckingService._eval_max_drawdown,
+    "max_leverage_regulatory": PolicyCheckingService._eval_max_leverage,
+    "lineage_completeness": PolicyCheckingService._eval_lineage,
+    "governance_compliance": PolicyCheckingService._eval_governance,
+    "turnover_constraint": PolicyCheckingService._eval_turnover,
+}
+
+# Default rules pre-resolved to their evaluators
+_DEFAULT_PLAN = tuple(PolicyCheckingService._plan_rules(PolicyCheckingService.DEFAULT_RULES))
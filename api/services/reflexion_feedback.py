@@ -3,8 +3,25 @@ Reflexion feedback service for primitive API.
 """
 from typing import Dict, Any, Optional, List
 from pydantic import BaseModel, Field
-from datetime import datetime
-import hashlib
+from datetime import datetime, timezone
+import heapq
+import re
+import zlib
+
+
+# Feedback keywords, matched as substrings in one pass. The lookahead lets
+# overlapping keywords all report, and "vol" also covers "volatility".
+_FEEDBACK_KEYWORDS = re.compile(r"(?=(vol|drawdown|loss|timing|entry|exit))")
+_FEEDBACK_TOPICS = {
+    "vol": "volatility",
+    "drawdown": "drawdown",
+    "loss": "drawdown",
+    "timing": "timing",
+    "entry": "timing",
+    "exit": "timing",
+}
+
+_PRIORITY_RANK = {"high": 0, "medium": 1, "low": 2}
 
 
 class ReflexionSuggestRequest(BaseModel):
@@ -41,6 +58,35 @@ class Suggestion(BaseModel):
     description: str
     rationale: str
     expected_impact: str
+    
+    class Config:
+        # Template instances are shared across responses
+        frozen = True
+
+
+# Input-independent suggestions, built once. The base suggestion's
+# description is filled in per iteration via model_copy.
+_BASE_SUGGESTION = Suggestion(
+    category="parameter",
+    priority="medium",
+    description="Adjust lookback period bias",
+    rationale="Historical lookback windows may be overfitted to recent market regimes",
+    expected_impact="Reduce regime-specific bias by 15-20%"
+)
+_GENERIC_SUGGESTION = Suggestion(
+    category="logic",
+    priority="low",
+    description="Consider ensemble approach combining multiple signal sources",
+    rationale="Diversified signal generation improves robustness",
+    expected_impact="Reduce strategy-specific risk by 15-20%"
+)
+
+
+def _candidate_rank(item: tuple) -> tuple:
+    """Sort key for (insertion index, candidate) pairs; ties keep insertion order."""
+    index, candidate = item
+    priority = candidate.priority if isinstance(candidate, Suggestion) else candidate["priority"]
+    return _PRIORITY_RANK[priority], index
 
 
 class ReflexionSuggestResponse(BaseModel):
@@ -65,10 +111,12 @@ class ReflexionFeedbackService:
         - Positive: improvement detected
         - Negative: degradation detected
         - Zero: no significant change
+        
+        The seed is hashed with CRC32: the score only needs to be stable
+        across processes, not cryptographically strong.
         """
         seed = f"{strategy_id}:{iteration_num}:{feedback or ''}".encode("utf-8")
-        digest = hashlib.sha256(seed).hexdigest()
-        raw = int(digest[:8], 16) % 401
+        raw = zlib.crc32(seed) % 401
         return round((raw - 200) / 100.0, 2)
     
     @staticmethod
@@ -80,15 +128,14 @@ class ReflexionFeedbackService:
         context: Optional[Dict[str, Any]]
     ) -> List[Suggestion]:
         """Generate improvement suggestions based on strategy state."""
-        suggestions = []
+        # Candidates are prebuilt Suggestions or field dicts; only field
+        # dicts in the top five are turned into models (fields are built
+        # here, so validation is skipped)
+        candidates = []
         
         # Base suggestions for all strategies
-        suggestions.append(Suggestion(
-            category="parameter",
-            priority="medium",
-            description=f"Adjust lookback period bias for iteration {iteration_num}",
-            rationale="Historical lookback windows may be overfitted to recent market regimes",
-            expected_impact="Reduce regime-specific bias by 15-20%"
+        candidates.append(_BASE_SUGGESTION.model_copy(
+            update={"description": f"Adjust lookback period bias for iteration {iteration_num}"}
         ))
         
         # Metric-based suggestions
@@ -98,7 +145,7 @@ class ReflexionFeedbackService:
             win_rate = metrics.get("win_rate", 0)
             
             if sharpe < 1.0:
-                suggestions.append(Suggestion(
+                candidates.append(dict(
                     category="risk_management",
                     priority="high",
                     description="Improve risk-adjusted returns through volatility targeting",
@@ -107,7 +154,7 @@ class ReflexionFeedbackService:
                 ))
             
             if drawdown > 0.20:
-                suggestions.append(Suggestion(
+                candidates.append(dict(
                     category="risk_management",
                     priority="high",
                     description="Implement stricter drawdown control mechanisms",
@@ -116,7 +163,7 @@ class ReflexionFeedbackService:
                 ))
             
             if win_rate and win_rate < 0.45:
-                suggestions.append(Suggestion(
+                candidates.append(dict(
                     category="logic",
                     priority="medium",
                     description="Refine entry signal quality to improve win rate",
@@ -126,10 +173,13 @@ class ReflexionFeedbackService:
         
         # Feedback-based suggestions
         if feedback:
-            feedback_lower = feedback.lower()
+            topics = {
+                _FEEDBACK_TOPICS[keyword]
+                for keyword in _FEEDBACK_KEYWORDS.findall(feedback.lower())
+            }
             
-            if "volatility" in feedback_lower or "vol" in feedback_lower:
-                suggestions.append(Suggestion(
+            if "volatility" in topics:
+                candidates.append(dict(
                     category="parameter",
                     priority="high",
                     description="Update volatility targeting to reduce regime sensitivity",
@@ -137,8 +187,8 @@ class ReflexionFeedbackService:
                     expected_impact="Stabilize returns across volatility regimes"
                 ))
             
-            if "drawdown" in feedback_lower or "loss" in feedback_lower:
-                suggestions.append(Suggestion(
+            if "drawdown" in topics:
+                candidates.append(dict(
                     category="risk_management",
                     priority="high",
                     description="Strengthen parameter guardrails for drawdown control",
@@ -146,8 +196,8 @@ class ReflexionFeedbackService:
                     expected_impact="Reduce tail risk exposure by 20-25%"
                 ))
             
-            if "timing" in feedback_lower or "entry" in feedback_lower or "exit" in feedback_lower:
-                suggestions.append(Suggestion(
+            if "timing" in topics:
+                candidates.append(dict(
                     category="timing",
                     priority="medium",
                     description="Optimize entry/exit timing with adaptive filters",
@@ -160,7 +210,7 @@ class ReflexionFeedbackService:
             strategy_type = context.get("strategy_type", "").lower()
             
             if "momentum" in strategy_type:
-                suggestions.append(Suggestion(
+                candidates.append(dict(
                     category="logic",
                     priority="medium",
                     description="Add mean reversion filter to reduce momentum crashes",
@@ -169,7 +219,7 @@ class ReflexionFeedbackService:
                 ))
             
             if "mean_reversion" in strategy_type or "pairs" in strategy_type:
-                suggestions.append(Suggestion(
+                candidates.append(dict(
                     category="parameter",
                     priority="medium",
                     description="Calibrate z-score thresholds for current volatility regime",
@@ -178,18 +228,14 @@ class ReflexionFeedbackService:
                 ))
         
         # Generic improvement suggestion
-        suggestions.append(Suggestion(
-            category="logic",
-            priority="low",
-            description="Consider ensemble approach combining multiple signal sources",
-            rationale="Diversified signal generation improves robustness",
-            expected_impact="Reduce strategy-specific risk by 15-20%"
-        ))
+        candidates.append(_GENERIC_SUGGESTION)
         
-        # Limit to top 5 suggestions by priority
-        priority_order = {"high": 0, "medium": 1, "low": 2}
-        suggestions.sort(key=lambda s: priority_order[s.priority])
-        return suggestions[:5]
+        # Limit to top 5 suggestions by priority (ties keep insertion order)
+        top = heapq.nsmallest(5, enumerate(candidates), key=_candidate_rank)
+        return [
+            candidate if isinstance(candidate, Suggestion) else Suggestion.model_construct(**candidate)
+            for _, candidate in top
+        ]
     
     @staticmethod
     def suggest_improvements(
@@ -240,5 +286,5 @@ class ReflexionFeedbackService:
             improvement_score=improvement_score,
             suggestions=suggestions,
             summary=summary,
-            timestamp=datetime.utcnow().isoformat()
+            timestamp=datetime.now(timezone.utc).isoformat()
         )
@@ -1,8 +1,20 @@
 """Risk validation service for primitive API."""
 
-from typing import Dict, Any, Optional, List
+import operator
+from dataclasses import dataclass
+from typing import Callable, Dict, Any, Optional, List, NamedTuple, Tuple
+
+import numpy as np
 from pydantic import BaseModel, Field
 
+try:
+    import numba
+    from numba import prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    prange = range
+
 
 class RiskThresholds(BaseModel):
     """Risk metric thresholds for validation."""
@@ -62,6 +74,114 @@ class RiskValidateResponse(BaseModel):
     summary: str
 
 
+@dataclass(slots=True)
+class _RiskCheckResult:
+    """Lightweight check result; converted to RiskCheck for the response."""
+    check_name: str
+    passed: bool
+    description: str
+    actual_value: float
+    threshold_value: float
+    severity: str
+    
+    def to_model(self) -> RiskCheck:
+        return RiskCheck.model_construct(
+            check_name=self.check_name,
+            passed=self.passed,
+            description=self.description,
+            actual_value=self.actual_value,
+            threshold_value=self.threshold_value,
+            severity=self.severity
+        )
+
+
+class _CheckSpec(NamedTuple):
+    """Declarative definition of one risk check."""
+    metric_key: str
+    threshold_attr: str
+    name: str
+    description_fmt: str
+    op: Callable[[float, float], bool]
+    severity_on_fail: str
+    default_actual: float
+
+
+# Risk checks in standard reporting order.
+# VaR is negative, so "less risky" means greater value (closer to 0).
+_CHECK_SPEC = (
+    _CheckSpec("sharpe_ratio", "min_sharpe", "Sharpe Ratio",
+               "Sharpe ratio must be >= {}", operator.ge, "error", 0.0),
+    _CheckSpec("sortino_ratio", "min_sortino", "Sortino Ratio",
+               "Sortino ratio must be >= {}", operator.ge, "error", 0.0),
+    _CheckSpec("max_drawdown", "max_drawdown", "Max Drawdown",
+               "Max drawdown must be <= {:.1%}", operator.le, "error", 1.0),
+    _CheckSpec("var_95", "max_var_95", "Value at Risk (95%)",
+               "VaR 95% must be >= {:.2%}", operator.ge, "warning", 0.0),
+    _CheckSpec("var_99", "max_var_99", "Value at Risk (99%)",
+               "VaR 99% must be >= {:.2%}", operator.ge, "warning", 0.0),
+    _CheckSpec("calmar_ratio", "min_calmar", "Calmar Ratio",
+               "Calmar ratio must be >= {}", operator.ge, "warning", 0.0),
+    _CheckSpec("volatility", "max_volatility", "Volatility",
+               "Annual volatility must be <= {:.1%}", operator.le, "warning", 0.0),
+)
+
+# Column views of _CHECK_SPEC for the vectorized paths. A direction of +1
+# means the check passes when actual <= threshold, -1 when actual >= threshold.
+_METRIC_KEYS = tuple(spec.metric_key for spec in _CHECK_SPEC)
+_METRIC_DEFAULTS = tuple(spec.default_actual for spec in _CHECK_SPEC)
+_THRESHOLD_ATTRS = tuple(spec.threshold_attr for spec in _CHECK_SPEC)
+_CHECK_DIRECTIONS = np.array([1.0 if spec.op is operator.le else -1.0 for spec in _CHECK_SPEC])
+_CHECK_IS_ERROR = np.array([spec.severity_on_fail == "error" for spec in _CHECK_SPEC])
+
+_THOROUGH_ORDER = tuple(range(len(_CHECK_SPEC)))
+# Most failure-prone checks first, for verdict-only validation
+_FIRST_FAILURE_ORDER = (2, 6, 0, 1, 5, 3, 4)
+
+
+def _score_batch(
+    metric_matrix: np.ndarray,
+    threshold_matrix: np.ndarray,
+    directions: np.ndarray,
+    is_error: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Pass/fail and score aggregation over a (strategies x checks) matrix.
+    
+    NaN thresholds mark unset checks, which are skipped. Rows are
+    independent, so the strategy axis runs in parallel under Numba.
+    
+    Returns:
+        (passed_mask, risk_scores, failed_error_counts)
+    """
+    n_rows, n_checks = metric_matrix.shape
+    passed_mask = np.zeros((n_rows, n_checks), dtype=np.bool_)
+    risk_scores = np.empty(n_rows)
+    failed_errors = np.zeros(n_rows, dtype=np.int64)
+    for i in prange(n_rows):
+        evaluated = 0
+        passed_count = 0
+        for j in range(n_checks):
+            threshold = threshold_matrix[i, j]
+            if np.isnan(threshold):
+                continue
+            evaluated += 1
+            if directions[j] * metric_matrix[i, j] <= directions[j] * threshold:
+                passed_mask[i, j] = True
+                passed_count += 1
+            elif is_error[j]:
+                failed_errors[i] += 1
+        risk_scores[i] = (passed_count / evaluated) * 100 if evaluated else 100.0
+    return passed_mask, risk_scores, failed_errors
+
+
+if HAS_NUMBA:
+    _score_batch = numba.njit(parallel=True, cache=True)(_score_batch)
+    # Compile at import rather than on the first request
+    _score_batch(
+        np.zeros((1, len(_CHECK_SPEC))), np.zeros((1, len(_CHECK_SPEC))), _CHECK_DIRECTIONS, _CHECK_IS_ERROR
+    )
+
+
 class RiskValidationService:
     """Service for risk metric validation."""
     
@@ -72,7 +192,8 @@ class RiskValidationService:
     def validate_risk_metrics(
         strategy_id: str,
         metrics: Dict[str, float],
-        thresholds: Optional[RiskThresholds] = None
+        thresholds: Optional[RiskThresholds] = None,
+        mode: str = "thorough"
     ) -> RiskValidateResponse:
         """
         Validate risk metrics against thresholds.
@@ -81,146 +202,184 @@ class RiskValidationService:
             strategy_id: Strategy identifier
             metrics: Risk metrics to validate
             thresholds: Custom thresholds (uses defaults if None)
+            mode: "thorough" runs every check in the standard order;
+                "first_failure" runs the most failure-prone checks first and
+                stops at the first failed error-severity check, so only the
+                verdict is guaranteed to match a thorough run
         
         Returns:
             RiskValidateResponse with validation results
         """
+        order = RiskValidationService._check_order(mode)
+        
         # Use default thresholds if not provided
         thresh = thresholds or RiskValidationService.DEFAULT_THRESHOLDS
+        threshold_values = [getattr(thresh, attr) for attr in _THRESHOLD_ATTRS]
         
-        checks = []
+        # Compare all metrics against their thresholds in one pass
+        actuals = np.array(
+            [metrics.get(key, default) for key, default in zip(_METRIC_KEYS, _METRIC_DEFAULTS)],
+            dtype=np.float64
+        )
+        limits = np.array(
+            [np.nan if t is None else t for t in threshold_values], dtype=np.float64
+        )
+        passed_mask = (_CHECK_DIRECTIONS * actuals <= _CHECK_DIRECTIONS * limits).tolist()
         
-        # Check 1: Sharpe ratio
-        sharpe = metrics.get("sharpe_ratio", 0.0)
-        if thresh.min_sharpe is not None:
-            sharpe_pass = sharpe >= thresh.min_sharpe
-            checks.append(RiskCheck(
-                check_name="Sharpe Ratio",
-                passed=sharpe_pass,
-                description=f"Sharpe ratio must be >= {thresh.min_sharpe}",
-                actual_value=sharpe,
-                threshold_value=thresh.min_sharpe,
-                severity="error" if not sharpe_pass else "info"
-            ))
+        return RiskValidationService._build_response(
+            strategy_id, order, mode, actuals.tolist(), threshold_values, passed_mask
+        )
+    
+    @staticmethod
+    def validate_risk_metrics_batch(
+        requests: list[RiskValidateRequest],
+        mode: str = "thorough"
+    ) -> list[RiskValidateResponse]:
+        """
+        Validate several strategies' risk metrics together.
         
-        # Check 2: Sortino ratio
-        sortino = metrics.get("sortino_ratio", 0.0)
-        if thresh.min_sortino is not None:
-            sortino_pass = sortino >= thresh.min_sortino
-            checks.append(RiskCheck(
-                check_name="Sortino Ratio",
-                passed=sortino_pass,
-                description=f"Sortino ratio must be >= {thresh.min_sortino}",
-                actual_value=sortino,
-                threshold_value=thresh.min_sortino,
-                severity="error" if not sortino_pass else "info"
-            ))
+        Metrics and thresholds are stacked into (N, 7) matrices so every
+        check for every strategy is decided by one vectorized comparison.
+        Each response matches what validate_risk_metrics returns for the
+        same request.
+        """
+        order = RiskValidationService._check_order(mode)
+        if not requests:
+            return []
         
-        # Check 3: Max drawdown
-        max_dd = metrics.get("max_drawdown", 1.0)
-        if thresh.max_drawdown is not None:
-            dd_pass = max_dd <= thresh.max_drawdown
-            checks.append(RiskCheck(
-                check_name="Max Drawdown",
-                passed=dd_pass,
-                description=f"Max drawdown must be <= {thresh.max_drawdown:.1%}",
-                actual_value=max_dd,
-                threshold_value=thresh.max_drawdown,
-                severity="error" if not dd_pass else "info"
-            ))
+        default_thresh = RiskValidationService.DEFAULT_THRESHOLDS
+        threshold_rows = [
+            [getattr(request.thresholds or default_thresh, attr) for attr in _THRESHOLD_ATTRS]
+            for request in requests
+        ]
+        metric_matrix = np.array(
+            [
+                [request.metrics.get(key, default) for key, default in zip(_METRIC_KEYS, _METRIC_DEFAULTS)]
+                for request in requests
+            ],
+            dtype=np.float64
+        )
+        threshold_matrix = np.array(
+            [[np.nan if t is None else t for t in row] for row in threshold_rows],
+            dtype=np.float64
+        )
         
-        # Check 4: VaR 95%
-        var_95 = metrics.get("var_95", 0.0)
-        if thresh.max_var_95 is not None:
-            # VaR is negative, so "less risky" means greater value (closer to 0)
-            var_95_pass = var_95 >= thresh.max_var_95
-            checks.append(RiskCheck(
-                check_name="Value at Risk (95%)",
-                passed=var_95_pass,
-                description=f"VaR 95% must be >= {thresh.max_var_95:.2%}",
-                actual_value=var_95,
-                threshold_value=thresh.max_var_95,
-                severity="warning" if not var_95_pass else "info"
-            ))
+        if HAS_NUMBA:
+            passed_arr, risk_scores, failed_errors = _score_batch(
+                metric_matrix, threshold_matrix, _CHECK_DIRECTIONS, _CHECK_IS_ERROR
+            )
+        else:
+            passed_arr = _CHECK_DIRECTIONS * metric_matrix <= _CHECK_DIRECTIONS * threshold_matrix
+            evaluated = ~np.isnan(threshold_matrix)
+            evaluated_counts = evaluated.sum(axis=1)
+            risk_scores = np.where(
+                evaluated_counts > 0,
+                passed_arr.sum(axis=1) / np.maximum(evaluated_counts, 1) * 100,
+                100.0
+            )
+            failed_errors = (evaluated & ~passed_arr & _CHECK_IS_ERROR).sum(axis=1)
         
-        # Check 5: VaR 99%
-        var_99 = metrics.get("var_99", 0.0)
-        if thresh.max_var_99 is not None:
-            var_99_pass = var_99 >= thresh.max_var_99
-            checks.append(RiskCheck(
-                check_name="Value at Risk (99%)",
-                passed=var_99_pass,
-                description=f"VaR 99% must be >= {thresh.max_var_99:.2%}",
-                actual_value=var_99,
-                threshold_value=thresh.max_var_99,
-                severity="warning" if not var_99_pass else "info"
-            ))
+        passed_matrix = passed_arr.tolist()
+        actual_rows = metric_matrix.tolist()
+        # Whole-row totals only describe a response when every check is run
+        if mode == "thorough":
+            totals = list(zip(risk_scores.tolist(), failed_errors.tolist()))
+        else:
+            totals = [None] * len(requests)
         
-        # Check 6: Calmar ratio
-        calmar = metrics.get("calmar_ratio", 0.0)
-        if thresh.min_calmar is not None:
-            calmar_pass = calmar >= thresh.min_calmar
-            checks.append(RiskCheck(
-                check_name="Calmar Ratio",
-                passed=calmar_pass,
-                description=f"Calmar ratio must be >= {thresh.min_calmar}",
-                actual_value=calmar,
-                threshold_value=thresh.min_calmar,
-                severity="warning" if not calmar_pass else "info"
-            ))
+        return [
+            RiskValidationService._build_response(
+                request.strategy_id, order, mode, actual_rows[n], threshold_rows[n], passed_matrix[n], totals[n]
+            )
+            for n, request in enumerate(requests)
+        ]
+    
+    @staticmethod
+    def _check_order(mode: str) -> tuple:
+        """Check evaluation order for a validation mode."""
+        if mode == "thorough":
+            return _THOROUGH_ORDER
+        if mode == "first_failure":
+            return _FIRST_FAILURE_ORDER
+        raise ValueError(f"Unknown validation mode: {mode}")
+    
+    @staticmethod
+    def _build_response(
+        strategy_id: str,
+        order: tuple,
+        mode: str,
+        actual_values: List[float],
+        threshold_values: List[Optional[float]],
+        passed_mask: List[bool],
+        totals: Optional[Tuple[float, int]] = None
+    ) -> RiskValidateResponse:
+        """
+        Assemble checks, score, recommendations and summary from a pass/fail row.
         
-        # Check 7: Volatility
-        volatility = metrics.get("volatility", 0.0)
-        if thresh.max_volatility is not None:
-            vol_pass = volatility <= thresh.max_volatility
-            checks.append(RiskCheck(
-                check_name="Volatility",
-                passed=vol_pass,
-                description=f"Annual volatility must be <= {thresh.max_volatility:.1%}",
-                actual_value=volatility,
-                threshold_value=thresh.max_volatility,
-                severity="warning" if not vol_pass else "info"
+        ``totals`` carries a precomputed (risk_score, failed_critical) pair
+        from the batch kernel; otherwise both are counted here.
+        """
+        checks = []
+        passed_count = 0
+        failed_critical = 0
+        # Error recommendations take precedence; warning ones are only kept
+        # while no error has failed
+        error_recs = []
+        warning_recs = []
+        
+        for i in order:
+            threshold = threshold_values[i]
+            if threshold is None:
+                continue
+            spec = _CHECK_SPEC[i]
+            check_passed = passed_mask[i]
+            if check_passed:
+                passed_count += 1
+            elif spec.severity_on_fail == "error":
+                failed_critical += 1
+                error_recs.append(
+                    f"Improve {spec.name}: current {actual_values[i]:.2f}, "
+                    f"target {threshold:.2f}"
+                )
+            elif not error_recs:
+                warning_recs.append(
+                    f"Consider improving {spec.name}: current {actual_values[i]:.2f}"
+                )
+            checks.append(_RiskCheckResult(
+                spec.name,
+                check_passed,
+                spec.description_fmt.format(threshold),
+                actual_values[i],
+                float(threshold),
+                spec.severity_on_fail if not check_passed else "info"
             ))
+            if mode == "first_failure" and not check_passed and spec.severity_on_fail == "error":
+                break
         
-        # Calculate overall status
-        error_checks = [c for c in checks if c.severity == "error"]
-        passed = all(c.passed for c in error_checks) if error_checks else all(c.passed for c in checks)
+        # Passing checks carry "info" severity, so any failure fails validation
+        passed = passed_count == len(checks)
         
         # Calculate risk score (0-100)
-        if checks:
-            passed_count = sum(1 for c in checks if c.passed)
+        if totals is not None:
+            risk_score, failed_critical = totals
+        elif checks:
             risk_score = (passed_count / len(checks)) * 100
         else:
             risk_score = 100.0
         
-        # Generate recommendations
-        recommendations = []
-        for check in checks:
-            if not check.passed and check.severity == "error":
-                recommendations.append(
-                    f"Improve {check.check_name}: current {check.actual_value:.2f}, "
-                    f"target {check.threshold_value:.2f}"
-                )
-        
-        if not recommendations:
-            for check in checks:
-                if not check.passed and check.severity == "warning":
-                    recommendations.append(
-                        f"Consider improving {check.check_name}: current {check.actual_value:.2f}"
-                    )
+        recommendations = error_recs or warning_recs
         
         # Generate summary
-        failed_critical = [c for c in checks if not c.passed and c.severity == "error"]
         if passed:
             summary = f"All critical risk checks passed ({len(checks)} checks evaluated)"
         else:
-            summary = f"{len(failed_critical)} critical risk check(s) failed"
+            summary = f"{failed_critical} critical risk check(s) failed"
         
-        return RiskValidateResponse(
+        return RiskValidateResponse.model_construct(
             strategy_id=strategy_id,
             passed=passed,
             risk_score=round(risk_score, 1),
-            checks=checks,
+            checks=[check.to_model() for check in checks],
             recommendations=recommendations,
             summary=summary
         )
@@ -1,9 +1,35 @@
 """
 Strategy verification service for primitive API.
 """
-from typing import Dict, Any, Optional, List
+from dataclasses import dataclass
+from typing import Dict, Any, FrozenSet, Optional, List, Tuple
 from pydantic import BaseModel, Field
 from datetime import datetime
+from enum import IntEnum
+import functools
+import math
+import sys
+import time
+
+import numpy as np
+
+try:
+    import numba
+    from numba import prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    prange = range
+
+
+class StrategyType(IntEnum):
+    """Supported strategy types; values index the per-type rule tables."""
+    MOMENTUM = 0
+    MEAN_REVERSION = 1
+    TREND_FOLLOWING = 2
+    PAIRS_TRADING = 3
+    VOLATILITY_TRADING = 4
+    ML_CLASSIFIER = 5
 
 
 class StrategyVerifyRequest(BaseModel):
@@ -33,7 +59,8 @@ class StrategyVerifyRequest(BaseModel):
         }
 
 
-class ValidationCheck(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ValidationCheck:
     """Individual validation check result."""
     check_name: str
     passed: bool
@@ -41,6 +68,17 @@ class ValidationCheck(BaseModel):
     message: str
     actual_value: Optional[Any] = None
     expected_range: Optional[str] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Response form of this check."""
+        return {
+            "check_name": self.check_name,
+            "passed": self.passed,
+            "severity": self.severity,
+            "message": self.message,
+            "actual_value": self.actual_value,
+            "expected_range": self.expected_range
+        }
 
 
 class StrategyVerifyResponse(BaseModel):
@@ -48,13 +86,128 @@ class StrategyVerifyResponse(BaseModel):
     strategy_id: str
     valid: bool
     validation_score: float  # 0-100
-    checks: List[ValidationCheck]
+    checks: List[Dict[str, Any]]  # ValidationCheck.to_dict() entries
     issues: List[str]
     warnings: List[str]
     summary: str
     timestamp: str
 
 
+@dataclass(slots=True, frozen=True)
+class _CompiledRules:
+    """Parameter rules for one strategy type as parallel arrays."""
+    names: Tuple[str, ...]
+    index: Dict[str, int]
+    required: Tuple[str, ...]
+    required_set: FrozenSet[str]
+    mins: np.ndarray
+    maxs: np.ndarray
+    is_int: np.ndarray
+    optional: np.ndarray
+    type_class: Tuple[int, ...]
+    type_check_names: Tuple[str, ...]
+    range_check_names: Tuple[str, ...]
+
+
+# Type classes are ordered so a value is acceptable when its class is at
+# least the rule's: ints (and bools, as int subclasses) satisfy both rules
+_TYPECLASS_OTHER = 0
+_TYPECLASS_NUMBER = 1
+_TYPECLASS_INT = 2
+_TYPECLASS_BY_TYPE = {int: _TYPECLASS_INT, bool: _TYPECLASS_INT, float: _TYPECLASS_NUMBER}
+
+
+def _type_class(value_type: type) -> int:
+    """Type class for types outside the exact-match table (subclasses, others)."""
+    if issubclass(value_type, int):
+        return _TYPECLASS_INT
+    if issubclass(value_type, float):
+        return _TYPECLASS_NUMBER
+    return _TYPECLASS_OTHER
+
+
+def _compile_rules(rules: Dict[str, Dict[str, Any]]) -> _CompiledRules:
+    """Flatten a strategy type's parameter rules into parallel arrays."""
+    names = tuple(rules)
+    required = tuple(name for name in names if not rules[name].get("optional", False))
+    return _CompiledRules(
+        names=names,
+        index={name: position for position, name in enumerate(names)},
+        required=required,
+        required_set=frozenset(required),
+        mins=np.array([rules[name]["min"] for name in names], dtype=np.float64),
+        maxs=np.array([rules[name]["max"] for name in names], dtype=np.float64),
+        is_int=np.array([rules[name]["type"] == "int" for name in names], dtype=bool),
+        optional=np.array([rules[name].get("optional", False) for name in names], dtype=bool),
+        type_class=tuple(_TYPECLASS_INT if rules[name]["type"] == "int" else _TYPECLASS_NUMBER for name in names),
+        type_check_names=tuple(sys.intern(f"Parameter: {name} (type)") for name in names),
+        range_check_names=tuple(sys.intern(f"Parameter: {name} (range)") for name in names)
+    )
+
+
+def _as_float(value: Any) -> float:
+    """Convert a numeric parameter for range comparison; huge ints become +/-inf."""
+    try:
+        return float(value)
+    except OverflowError:
+        return math.inf if value > 0 else -math.inf
+
+
+def _check_ranges(
+    values: np.ndarray,
+    mins: np.ndarray,
+    maxs: np.ndarray,
+    int_mask: np.ndarray,
+    optional_mask: np.ndarray
+) -> np.ndarray:
+    """
+    Range and integrality failures over a (trials x parameters) matrix.
+    
+    NaN marks an absent parameter, which fails only when required. Trials
+    are independent, so the trial axis runs in parallel under Numba.
+    
+    Returns:
+        Boolean mask, True where a trial has at least one failing parameter
+    """
+    n_trials, n_params = values.shape
+    fail = np.zeros(n_trials, dtype=np.bool_)
+    for i in prange(n_trials):
+        for j in range(n_params):
+            value = values[i, j]
+            if np.isnan(value):
+                bad = not optional_mask[j]
+            else:
+                bad = value < mins[j] or value > maxs[j] or (int_mask[j] and value != np.floor(value))
+            if bad:
+                fail[i] = True
+                break
+    return fail
+
+
+if HAS_NUMBA:
+    _check_ranges = numba.njit(parallel=True, cache=True)(_check_ranges)
+    # Compile at import rather than on the first request
+    _check_ranges(
+        np.zeros((1, 1)), np.zeros(1), np.zeros(1), np.zeros(1, dtype=np.bool_), np.zeros(1, dtype=np.bool_)
+    )
+
+
+# (epoch second, formatted timestamp); replaced as a whole so readers on
+# other threads never see a mismatched pair
+_TS_CACHE: Tuple[int, str] = (0, "")
+
+
+def _now_iso() -> str:
+    """UTC ISO timestamp at second resolution, formatted once per second."""
+    global _TS_CACHE
+    now = int(time.time())
+    cached = _TS_CACHE
+    if cached[0] != now:
+        cached = (now, datetime.utcfromtimestamp(now).isoformat())
+        _TS_CACHE = cached
+    return cached[1]
+
+
 class StrategyVerificationService:
     """Service for strategy configuration verification."""
     
@@ -116,38 +269,135 @@ class StrategyVerificationService:
         3. Parameter values are within valid ranges
         4. Parameter types are correct
         5. Business logic rules (e.g., fast_window < slow_window)
+        
+        Results are memoized on (strategy_type, parameters); context does not
+        affect verification and is not part of the key.
+        """
+        # Interned so lookups against the (interned) table keys and cache
+        # key comparisons can match on identity
+        if type(strategy_type) is str:
+            strategy_type = sys.intern(strategy_type)
+        
+        # Value types are part of the key (1, 1.0 and True hash alike but
+        # verify differently), as is the rendered value (0.0 and -0.0 compare
+        # equal but read differently in messages). Parameter order is kept
+        # since it orders the checks.
+        params_key = tuple(
+            (name, type(value), value, str(value)) for name, value in parameters.items()
+        )
+        try:
+            verified = _verify_cached(strategy_type, params_key)
+        except TypeError:
+            # Unhashable parameter values (lists, dicts) bypass the cache
+            verified = StrategyVerificationService._verify_core(strategy_type, parameters)
+        valid, validation_score, checks, issues, warnings, summary = verified
+        
+        # Fields come from _verify_core, so the response skips re-validation;
+        # only StrategyVerifyRequest is validated, at the API boundary
+        return StrategyVerifyResponse.model_construct(
+            strategy_id=strategy_id,
+            valid=valid,
+            validation_score=validation_score,
+            checks=[check.to_dict() for check in checks],
+            issues=list(issues),
+            warnings=list(warnings),
+            summary=summary,
+            timestamp=_now_iso()
+        )
+    
+    @staticmethod
+    def verify_strategy_batch(strategy_type: str, params_matrix: np.ndarray) -> np.ndarray:
+        """
+        Range-check many parameter sets for one strategy type at once.
+        
+        Columns of params_matrix follow the strategy type's PARAM_RULES
+        order (see parameter_names) and NaN marks an absent parameter.
+        Only required-presence, integrality and range checks are applied;
+        business logic and stop/take consistency need verify_strategy.
+        
+        Returns:
+            Boolean array, True for each row that passes every check
+        """
+        compiled = StrategyVerificationService._compiled_rules(strategy_type)
+        values = np.asarray(params_matrix, dtype=np.float64)
+        if values.ndim != 2 or values.shape[1] != len(compiled.names):
+            raise ValueError(
+                f"params_matrix must have shape (n_trials, {len(compiled.names)}) "
+                f"for strategy type '{strategy_type}'"
+            )
+        
+        if HAS_NUMBA:
+            fail = _check_ranges(values, compiled.mins, compiled.maxs, compiled.is_int, compiled.optional)
+        else:
+            absent = np.isnan(values)
+            bad = (values < compiled.mins) | (values > compiled.maxs)
+            bad |= compiled.is_int & ~absent & (values != np.floor(values))
+            bad |= absent & ~compiled.optional
+            fail = bad.any(axis=1)
+        return ~fail
+    
+    @staticmethod
+    def parameter_names(strategy_type: str) -> Tuple[str, ...]:
+        """Column order expected by verify_strategy_batch."""
+        return StrategyVerificationService._compiled_rules(strategy_type).names
+    
+    @staticmethod
+    def _compiled_rules(strategy_type: str) -> _CompiledRules:
+        """Compiled rules for a strategy type; raises ValueError if unknown."""
+        st = _STRATEGY_TYPE_LOOKUP.get(strategy_type)
+        if st is None:
+            raise ValueError(f"Unknown strategy type '{strategy_type}'")
+        return _RULES_COMPILED[st]
+    
+    @staticmethod
+    def cache_clear() -> None:
+        """Clear memoized verification results."""
+        _verify_cached.cache_clear()
+    
+    @staticmethod
+    def _verify_core(
+        strategy_type: str,
+        parameters: Dict[str, Any]
+    ) -> Tuple[bool, float, Tuple[ValidationCheck, ...], Tuple[str, ...], Tuple[str, ...], str]:
+        """
+        Run all verification checks.
+        
+        Returns:
+            (valid, validation_score, checks, issues, warnings, summary)
         """
         checks = []
         issues = []
         warnings = []
         
-        # Check 1: Strategy type validity
-        if strategy_type not in StrategyVerificationService.PARAM_RULES:
+        # Check 1: Strategy type validity; known types index the rule tables
+        st = _STRATEGY_TYPE_LOOKUP.get(strategy_type)
+        if st is None:
             checks.append(ValidationCheck(
                 check_name="Strategy Type",
                 passed=False,
                 severity="error",
                 message=f"Unknown strategy type '{strategy_type}'",
                 actual_value=strategy_type,
-                expected_range=f"One of: {', '.join(StrategyVerificationService.PARAM_RULES.keys())}"
+                expected_range=f"One of: {_STRATEGY_LIST_STR}"
             ))
             issues.append(f"Unknown strategy type: {strategy_type}")
         else:
-            checks.append(ValidationCheck(
-                check_name="Strategy Type",
-                passed=True,
-                severity="info",
-                message=f"Strategy type '{strategy_type}' is valid"
-            ))
+            checks.append(_PASS_STRATEGY_TYPE[st])
         
         # Get rules for this strategy type
-        rules = StrategyVerificationService.PARAM_RULES.get(strategy_type, {})
-        
-        # Check 2: Required parameters
-        required_params = [k for k, v in rules.items() if not v.get("optional", False)]
-        missing_params = [p for p in required_params if p not in parameters]
+        if st is None:
+            rules = {}
+            compiled = _EMPTY_RULES
+            business_rule = None
+        else:
+            rules = _PARAM_RULES_BY_TYPE[st]
+            compiled = _RULES_COMPILED[st]
+            business_rule = _BUSINESS_RULES[st]
         
-        if missing_params:
+        # Check 2: Required parameters (missing ones are listed in rule order)
+        if compiled.required_set - parameters.keys():
+            required_params = compiled.required
+            missing_params = [p for p in required_params if p not in parameters]
             checks.append(ValidationCheck(
                 check_name="Required Parameters",
                 passed=False,
@@ -155,18 +405,37 @@ class StrategyVerificationService:
                 message=f"Missing required parameters: {', '.join(missing_params)}",
                 expected_range=f"Required: {', '.join(required_params)}"
             ))
-            issues.extend([f"Missing parameter: {p}" for p in missing_params])
+            for p in missing_params:
+                issues.append(f"Missing parameter: {p}")
         else:
-            checks.append(ValidationCheck(
-                check_name="Required Parameters",
-                passed=True,
-                severity="info",
-                message="All required parameters present"
-            ))
+            checks.append(_PASS_REQUIRED_PARAMS)
         
-        # Check 3 & 4: Parameter ranges and types
+        # Check 3 & 4: Parameter types, then ranges for every well-typed
+        # value in one vectorized comparison
+        values = np.full(len(compiled.names), np.nan)
+        entries = []
         for param_name, param_value in parameters.items():
-            if param_name not in rules:
+            position = compiled.index.get(param_name)
+            if position is None:
+                entries.append((param_name, param_value, None, None, False))
+                continue
+            value_type = type(param_value)
+            type_class = _TYPECLASS_BY_TYPE.get(value_type)
+            if type_class is None:
+                type_class = _type_class(value_type)
+            type_ok = type_class >= compiled.type_class[position]
+            if type_ok:
+                values[position] = _as_float(param_value)
+            entries.append((param_name, param_value, position, value_type, type_ok))
+        
+        below = (values < compiled.mins).tolist()
+        above = (values > compiled.maxs).tolist()
+        
+        # Only failures get their own check; in-range parameters are counted
+        # and reported by one aggregated check after the loop
+        n_params_ok = 0
+        for param_name, param_value, position, value_type, type_ok in entries:
+            if position is None:
                 checks.append(ValidationCheck(
                     check_name=f"Parameter: {param_name}",
                     passed=False,
@@ -176,42 +445,37 @@ class StrategyVerificationService:
                 warnings.append(f"Unknown parameter: {param_name}")
                 continue
             
+            # Well-typed, in-range parameters are only counted
+            if type_ok and not below[position] and not above[position]:
+                n_params_ok += 1
+                continue
+            
             rule = rules[param_name]
             expected_type = rule["type"]
             
             # Type check
-            if expected_type == "int" and not isinstance(param_value, int):
-                checks.append(ValidationCheck(
-                    check_name=f"Parameter: {param_name} (type)",
-                    passed=False,
-                    severity="error",
-                    message=f"Parameter '{param_name}' must be an integer",
-                    actual_value=str(type(param_value).__name__),
-                    expected_range="int"
-                ))
-                issues.append(f"Parameter '{param_name}' has wrong type (expected {expected_type})")
-                continue
-            
-            if expected_type == "float" and not isinstance(param_value, (int, float)):
+            if not type_ok:
                 checks.append(ValidationCheck(
-                    check_name=f"Parameter: {param_name} (type)",
+                    check_name=compiled.type_check_names[position],
                     passed=False,
                     severity="error",
-                    message=f"Parameter '{param_name}' must be a number",
-                    actual_value=str(type(param_value).__name__),
-                    expected_range="float"
+                    message=(
+                        f"Parameter '{param_name}' must be an integer" if expected_type == "int"
+                        else f"Parameter '{param_name}' must be a number"
+                    ),
+                    actual_value=value_type.__name__,
+                    expected_range=expected_type
                 ))
                 issues.append(f"Parameter '{param_name}' has wrong type (expected {expected_type})")
                 continue
             
-            # Range check
-            min_val = rule.get("min")
-            max_val = rule.get("max")
-            
+            # Range check; bounds are only formatted for a failure
+            min_val = rule["min"]
+            max_val = rule["max"]
             range_str = f"{min_val} to {max_val}"
-            if min_val is not None and param_value < min_val:
+            if below[position]:
                 checks.append(ValidationCheck(
-                    check_name=f"Parameter: {param_name} (range)",
+                    check_name=compiled.range_check_names[position],
                     passed=False,
                     severity="error",
                     message=f"Parameter '{param_name}' value {param_value} is below minimum {min_val}",
@@ -219,9 +483,9 @@ class StrategyVerificationService:
                     expected_range=range_str
                 ))
                 issues.append(f"Parameter '{param_name}' value {param_value} is out of range ({range_str})")
-            elif max_val is not None and param_value > max_val:
+            else:
                 checks.append(ValidationCheck(
-                    check_name=f"Parameter: {param_name} (range)",
+                    check_name=compiled.range_check_names[position],
                     passed=False,
                     severity="error",
                     message=f"Parameter '{param_name}' value {param_value} exceeds maximum {max_val}",
@@ -229,60 +493,22 @@ class StrategyVerificationService:
                     expected_range=range_str
                 ))
                 issues.append(f"Parameter '{param_name}' value {param_value} is out of range ({range_str})")
-            else:
-                checks.append(ValidationCheck(
-                    check_name=f"Parameter: {param_name} (range)",
-                    passed=True,
-                    severity="info",
-                    message=f"Parameter '{param_name}' value {param_value} is within valid range",
-                    actual_value=param_value,
-                    expected_range=range_str
-                ))
         
-        # Check 5: Business logic rules
-        if strategy_type == "trend_following":
-            fast_window = parameters.get("fast_window")
-            slow_window = parameters.get("slow_window")
-            
-            if fast_window and slow_window:
-                if fast_window >= slow_window:
-                    checks.append(ValidationCheck(
-                        check_name="Business Logic: Window Ordering",
-                        passed=False,
-                        severity="error",
-                        message="fast_window must be less than slow_window",
-                        actual_value=f"fast={fast_window}, slow={slow_window}"
-                    ))
-                    issues.append("fast_window must be less than slow_window")
-                else:
-                    checks.append(ValidationCheck(
-                        check_name="Business Logic: Window Ordering",
-                        passed=True,
-                        severity="info",
-                        message="Window ordering is valid (fast < slow)"
-                    ))
+        if n_params_ok:
+            checks.append(ValidationCheck(
+                check_name="Parameter Ranges",
+                passed=True,
+                severity="info",
+                message=(
+                    f"All {n_params_ok} parameters within valid range" if n_params_ok == len(parameters)
+                    else f"{n_params_ok} of {len(parameters)} parameters within valid range"
+                ),
+                actual_value=n_params_ok
+            ))
         
-        if strategy_type == "mean_reversion":
-            entry_threshold = parameters.get("entry_threshold")
-            exit_threshold = parameters.get("exit_threshold")
-            
-            if entry_threshold and exit_threshold:
-                if exit_threshold >= entry_threshold:
-                    checks.append(ValidationCheck(
-                        check_name="Business Logic: Threshold Ordering",
-                        passed=False,
-                        severity="error",
-                        message="exit_threshold must be less than entry_threshold",
-                        actual_value=f"entry={entry_threshold}, exit={exit_threshold}"
-                    ))
-                    issues.append("exit_threshold must be less than entry_threshold")
-                else:
-                    checks.append(ValidationCheck(
-                        check_name="Business Logic: Threshold Ordering",
-                        passed=True,
-                        severity="info",
-                        message="Threshold ordering is valid (exit < entry)"
-                    ))
+        # Check 5: Business logic rules for the strategy type, if any
+        if business_rule is not None:
+            business_rule(parameters, checks, issues)
         
         # Check 6: Risk management consistency
         stop_loss = parameters.get("stop_loss")
@@ -299,17 +525,14 @@ class StrategyVerificationService:
                 ))
                 warnings.append("stop_loss >= take_profit may indicate poor risk/reward ratio")
             else:
-                checks.append(ValidationCheck(
-                    check_name="Risk Management: Stop/Take Ratio",
-                    passed=True,
-                    severity="info",
-                    message="Stop/take profit ratio is favorable"
-                ))
+                checks.append(_PASS_STOP_TAKE)
         
-        # Calculate validation score
-        total_checks = len(checks)
-        passed_checks = sum(1 for c in checks if c.passed)
-        validation_score = (passed_checks / total_checks * 100) if total_checks > 0 else 0
+        # Calculate validation score; the aggregated range check stands in
+        # for n_params_ok passed checks
+        weight = n_params_ok - 1 if n_params_ok else 0
+        total_checks = len(checks) + weight
+        passed_checks = sum(1 for c in checks if c.passed) + weight
+        validation_score = (passed_checks / total_checks * 100) if total_checks > 0 else 0.0
         
         # Overall validity (no errors)
         valid = len(issues) == 0
@@ -320,13 +543,118 @@ class StrategyVerificationService:
         else:
             summary = f"Strategy configuration has {len(issues)} error(s) and {len(warnings)} warning(s)"
         
-        return StrategyVerifyResponse(
-            strategy_id=strategy_id,
-            valid=valid,
-            validation_score=validation_score,
-            checks=checks,
-            issues=issues,
-            warnings=warnings,
-            summary=summary,
-            timestamp=datetime.utcnow().isoformat()
-        )
+        return valid, validation_score, tuple(checks), tuple(issues), tuple(warnings), summary
+    
+    @staticmethod
+    def _rule_trend_following(
+        parameters: Dict[str, Any],
+        checks: List[ValidationCheck],
+        issues: List[str]
+    ) -> None:
+        """Trend following: fast_window must be below slow_window."""
+        fast_window = parameters.get("fast_window")
+        slow_window = parameters.get("slow_window")
+        
+        if fast_window and slow_window:
+            if fast_window >= slow_window:
+                checks.append(ValidationCheck(
+                    check_name="Business Logic: Window Ordering",
+                    passed=False,
+                    severity="error",
+                    message="fast_window must be less than slow_window",
+                    actual_value=f"fast={fast_window}, slow={slow_window}"
+                ))
+                issues.append("fast_window must be less than slow_window")
+            else:
+                checks.append(_PASS_WINDOW_ORDERING)
+    
+    @staticmethod
+    def _rule_mean_reversion(
+        parameters: Dict[str, Any],
+        checks: List[ValidationCheck],
+        issues: List[str]
+    ) -> None:
+        """Mean reversion: exit_threshold must be below entry_threshold."""
+        entry_threshold = parameters.get("entry_threshold")
+        exit_threshold = parameters.get("exit_threshold")
+        
+        if entry_threshold and exit_threshold:
+            if exit_threshold >= entry_threshold:
+                checks.append(ValidationCheck(
+                    check_name="Business Logic: Threshold Ordering",
+                    passed=False,
+                    severity="error",
+                    message="exit_threshold must be less than entry_threshold",
+                    actual_value=f"entry={entry_threshold}, exit={exit_threshold}"
+                ))
+                issues.append("exit_threshold must be less than entry_threshold")
+            else:
+                checks.append(_PASS_THRESHOLD_ORDERING)
+
+
+# Strategy type names resolve once per request; every per-type table below
+# is a tuple indexed by StrategyType
+_STRATEGY_TYPE_LOOKUP = {st.name.lower(): st for st in StrategyType}
+_PARAM_RULES_BY_TYPE = tuple(
+    StrategyVerificationService.PARAM_RULES[st.name.lower()] for st in StrategyType
+)
+
+# Parameter rules per strategy type, compiled once at import
+_RULES_COMPILED = tuple(_compile_rules(rules) for rules in _PARAM_RULES_BY_TYPE)
+_EMPTY_RULES = _compile_rules({})
+_STRATEGY_LIST_STR = ", ".join(StrategyVerificationService.PARAM_RULES)
+
+# Strategy-specific business logic checks; types without an entry have none
+_BUSINESS_RULES = tuple(
+    {
+        StrategyType.TREND_FOLLOWING: StrategyVerificationService._rule_trend_following,
+        StrategyType.MEAN_REVERSION: StrategyVerificationService._rule_mean_reversion,
+    }.get(st)
+    for st in StrategyType
+)
+
+# Passing checks carry no request-specific data, so one frozen instance of
+# each is shared by every response
+_PASS_STRATEGY_TYPE = tuple(
+    ValidationCheck(
+        check_name="Strategy Type",
+        passed=True,
+        severity="info",
+        message=f"Strategy type '{st.name.lower()}' is valid"
+    )
+    for st in StrategyType
+)
+_PASS_REQUIRED_PARAMS = ValidationCheck(
+    check_name="Required Parameters",
+    passed=True,
+    severity="info",
+    message="All required parameters present"
+)
+_PASS_WINDOW_ORDERING = ValidationCheck(
+    check_name="Business Logic: Window Ordering",
+    passed=True,
+    severity="info",
+    message="Window ordering is valid (fast < slow)"
+)
+_PASS_THRESHOLD_ORDERING = ValidationCheck(
+    check_name="Business Logic: Threshold Ordering",
+    passed=True,
+    severity="info",
+    message="Threshold ordering is valid (exit < entry)"
+)
+_PASS_STOP_TAKE = ValidationCheck(
+    check_name="Risk Management: Stop/Take Ratio",
+    passed=True,
+    severity="info",
+    message="Stop/take profit ratio is favorable"
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _verify_cached(
+    strategy_type: str,
+    params_key: Tuple[Tuple[str, type, Any, str], ...]
+) -> Tuple[bool, float, Tuple[ValidationCheck, ...], Tuple[str, ...], Tuple[str, ...], str]:
+    """Memoized verification keyed on strategy type and typed parameter items."""
+    parameters = {item[0]: item[2] for item in params_key}
+    return StrategyVerificationService._verify_core(strategy_type, parameters)
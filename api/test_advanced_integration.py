@@ -13,12 +13,27 @@ from api.advanced.risk_management import RiskManager, PositionSizeMethod
 
 client = TestClient(app)
 
+# Sample data shared by all tests: built once, each from its own seeded
+# generator (same values as seeding the global RNG with 42 per test), and
+# read-only so no test can alter another's input
+_RETURNS_3x252 = np.random.RandomState(42).randn(3, 252) * 0.01
+_RETURNS_252 = np.random.RandomState(42).randn(252) * 0.01
+_EQUITY_252 = np.cumprod(1 + _RETURNS_252)
+_RETURNS_1000 = np.random.RandomState(42).randn(1000) * 0.01
+for _array in (_RETURNS_3x252, _RETURNS_252, _EQUITY_252, _RETURNS_1000):
+    _array.setflags(write=False)
+
+_RETURNS_3x252_LIST = _RETURNS_3x252.tolist()
+_RETURNS_252_LIST = _RETURNS_252.tolist()
+_EQUITY_252_LIST = _EQUITY_252.tolist()
+
 
 # Mock authentication
-@pytest.fixture
+@pytest.fixture(scope="module")
 def auth_headers():
-    """Get authentication headers for testing"""
-    # Register and login
+    """Get authentication headers once for all tests in this module"""
+    # Register and login; registration is allowed to fail when the user
+    # already exists (400/409) from an earlier module or run
     client.post("/api/auth/register", json={
         "username": "testuser_advanced",
         "email": "advanced@test.com",
@@ -39,14 +54,11 @@ class TestPortfolioOptimization:
     
     def test_optimize_max_sharpe(self, auth_headers):
         """Test maximum Sharpe ratio optimization"""
-        # Generate sample returns (3 assets, 252 days)
-        np.random.seed(42)
-        returns = np.random.randn(3, 252) * 0.01
-        
+        # Sample returns: 3 assets, 252 days
         response = client.post(
             "/api/advanced/portfolio/optimize",
             json={
-                "returns": returns.tolist(),
+                "returns": _RETURNS_3x252_LIST,
                 "method": "max_sharpe",
                 "risk_free_rate": 0.02
             },
@@ -65,13 +77,10 @@ class TestPortfolioOptimization:
     
     def test_optimize_min_variance(self, auth_headers):
         """Test minimum variance optimization"""
-        np.random.seed(42)
-        returns = np.random.randn(3, 252) * 0.01
-        
         response = client.post(
             "/api/advanced/portfolio/optimize",
             json={
-                "returns": returns.tolist(),
+                "returns": _RETURNS_3x252_LIST,
                 "method": "min_variance"
             },
             headers=auth_headers
@@ -84,13 +93,10 @@ class TestPortfolioOptimization:
     
     def test_efficient_frontier(self, auth_headers):
         """Test efficient frontier calculation"""
-        np.random.seed(42)
-        returns = np.random.randn(3, 252) * 0.01
-        
         response = client.post(
             "/api/advanced/portfolio/efficient-frontier?n_points=20",
             json={
-                "returns": returns.tolist()
+                "returns": _RETURNS_3x252_LIST
             },
             headers=auth_headers
         )
@@ -111,15 +117,11 @@ class TestRiskAnalytics:
     
     def test_risk_analysis_complete(self, auth_headers):
         """Test comprehensive risk analysis"""
-        np.random.seed(42)
-        returns = np.random.randn(252) * 0.01
-        equity_curve = np.cumprod(1 + returns)
-        
         response = client.post(
             "/api/advanced/risk/analyze",
             json={
-                "returns": returns.tolist(),
-                "equity_curve": equity_curve.tolist(),
+                "returns": _RETURNS_252_LIST,
+                "equity_curve": _EQUITY_252_LIST,
                 "risk_free_rate": 0.02
             },
             headers=auth_headers
@@ -276,11 +278,8 @@ class TestPortfolioOptimizerUnit:
     
     def test_max_sharpe_optimization(self):
         """Test maximum Sharpe ratio optimization"""
-        np.random.seed(42)
-        returns = np.random.randn(3, 252) * 0.01
-        
         optimizer = PortfolioOptimizer(risk_free_rate=0.02)
-        result = optimizer.optimize(returns, OptimizationMethod.MAX_SHARPE, {})
+        result = optimizer.optimize(_RETURNS_3x252, OptimizationMethod.MAX_SHARPE, {})
         
         assert result.expected_return is not None
         assert result.volatility > 0
@@ -290,11 +289,8 @@ class TestPortfolioOptimizerUnit:
     
     def test_risk_parity(self):
         """Test risk parity optimization"""
-        np.random.seed(42)
-        returns = np.random.randn(3, 252) * 0.01
-        
         optimizer = PortfolioOptimizer()
-        result = optimizer.optimize(returns, OptimizationMethod.RISK_PARITY, {})
+        result = optimizer.optimize(_RETURNS_3x252, OptimizationMethod.RISK_PARITY, {})
         
         assert len(result.weights) == 3
         assert all(w > 0 for w in result.weights)  # All weights positive in risk parity
@@ -305,12 +301,8 @@ class TestRiskAnalyzerUnit:
     
     def test_calculate_all_metrics(self):
         """Test comprehensive risk metrics calculation"""
-        np.random.seed(42)
-        returns = np.random.randn(252) * 0.01
-        equity_curve = np.cumprod(1 + returns)
-        
         analyzer = RiskAnalyzer(risk_free_rate=0.02)
-        metrics = analyzer.calculate_all_metrics(returns, equity_curve)
+        metrics = analyzer.calculate_all_metrics(_RETURNS_252, _EQUITY_252)
         
         assert metrics.volatility > 0
         assert metrics.sharpe_ratio is not None
@@ -322,12 +314,9 @@ class TestRiskAnalyzerUnit:
     
     def test_var_cvar(self):
         """Test VaR and CVaR calculations"""
-        np.random.seed(42)
-        returns = np.random.randn(1000) * 0.01
-        
         analyzer = RiskAnalyzer()
-        var_95 = analyzer.calculate_var(returns, 0.95)
-        cvar_95 = analyzer.calculate_cvar(returns, 0.95)
+        var_95 = analyzer.calculate_var(_RETURNS_1000, 0.95)
+        cvar_95 = analyzer.calculate_cvar(_RETURNS_1000, 0.95)
         
         assert var_95 < 0  # VaR should be negative (loss)
         assert cvar_95 < var_95  # CVaR should be worse than VaR
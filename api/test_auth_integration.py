@@ -2,23 +2,51 @@
 Integration tests for authentication system
 Tests login, registration, token verification, and password change
 """
+import asyncio
+import json
 import sys
 import os
-import requests
+import httpx
 import time
 from datetime import datetime
+from typing import Any
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# orjson encodes/decodes in C when installed; request bodies are sent pre-encoded
+if HAS_ORJSON:
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+else:
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+_JSON_HEADERS = {"content-type": "application/json"}
+
 API_BASE_URL = "http://localhost:8000/api"
 
+# Run as a script against a live server; the test_* steps take a shared
+# client and earlier results, so keep pytest from collecting them
+__test__ = False
+
+# Escape codes only when writing to a terminal; redirected logs get plain text
+_TTY = sys.stdout.isatty()
+
 class Colors:
-    GREEN = '\033[92m'
-    RED = '\033[91m'
-    YELLOW = '\033[93m'
-    BLUE = '\033[94m'
-    END = '\033[0m'
+    GREEN = '\033[92m' if _TTY else ''
+    RED = '\033[91m' if _TTY else ''
+    YELLOW = '\033[93m' if _TTY else ''
+    BLUE = '\033[94m' if _TTY else ''
+    END = '\033[0m' if _TTY else ''
 
 def print_test(name, passed, message=""):
     status = f"{Colors.GREEN}✓ PASS{Colors.END}" if passed else f"{Colors.RED}✗ FAIL{Colors.END}"
@@ -26,10 +54,10 @@ def print_test(name, passed, message=""):
     if message:
         print(f"      {message}")
 
-def test_health_check():
+async def test_health_check(client):
     """Test 1: Health Check"""
     try:
-        response = requests.get(f"{API_BASE_URL}/health")
+        response = await client.get("/health")
         passed = response.status_code == 200
         print_test("Health Check", passed, f"Status: {response.status_code}")
         return passed
@@ -37,7 +65,7 @@ def test_health_check():
         print_test("Health Check", False, f"Error: {str(e)}")
         return False
 
-def test_user_registration():
+async def test_user_registration(client):
     """Test 2: User Registration"""
     try:
         test_email = f"test_auth_{int(time.time())}@example.com"
@@ -46,8 +74,8 @@ def test_user_registration():
             "password": "testpassword123",
             "name": "Test User"
         }
-        response = requests.post(f"{API_BASE_URL}/auth/register", json=payload)
-        data = response.json()
+        response = await client.post("/auth/register", content=_json_dumps(payload), headers=_JSON_HEADERS)
+        data = _json_loads(response.content)
         
         passed = (
             response.status_code == 200 and
@@ -61,7 +89,7 @@ def test_user_registration():
         print_test("User Registration", False, f"Error: {str(e)}")
         return False, None, None, None
 
-def test_duplicate_registration(email):
+async def test_duplicate_registration(client, email):
     """Test 3: Duplicate Registration Prevention"""
     try:
         payload = {
@@ -69,7 +97,7 @@ def test_duplicate_registration(email):
             "password": "differentpassword",
             "name": "Duplicate User"
         }
-        response = requests.post(f"{API_BASE_URL}/auth/register", json=payload)
+        response = await client.post("/auth/register", content=_json_dumps(payload), headers=_JSON_HEADERS)
         
         # Should fail with 400
         passed = response.status_code == 400
@@ -80,15 +108,15 @@ def test_duplicate_registration(email):
         print_test("Duplicate Registration Prevention", False, f"Error: {str(e)}")
         return False
 
-def test_user_login(email, password):
+async def test_user_login(client, email, password):
     """Test 4: User Login"""
     try:
         payload = {
             "email": email,
             "password": password
         }
-        response = requests.post(f"{API_BASE_URL}/auth/login", json=payload)
-        data = response.json()
+        response = await client.post("/auth/login", content=_json_dumps(payload), headers=_JSON_HEADERS)
+        data = _json_loads(response.content)
         
         passed = (
             response.status_code == 200 and
@@ -102,14 +130,14 @@ def test_user_login(email, password):
         print_test("User Login", False, f"Error: {str(e)}")
         return False, None
 
-def test_invalid_login():
+async def test_invalid_login(client):
     """Test 5: Invalid Login Credentials"""
     try:
         payload = {
             "email": "nonexistent@example.com",
             "password": "wrongpassword"
         }
-        response = requests.post(f"{API_BASE_URL}/auth/login", json=payload)
+        response = await client.post("/auth/login", content=_json_dumps(payload), headers=_JSON_HEADERS)
         
         # Should fail with 401
         passed = response.status_code == 401
@@ -120,12 +148,12 @@ def test_invalid_login():
         print_test("Invalid Login Credentials", False, f"Error: {str(e)}")
         return False
 
-def test_token_verification(token):
+async def test_token_verification(client, token):
     """Test 6: Token Verification"""
     try:
         headers = {"Authorization": f"Bearer {token}"}
-        response = requests.get(f"{API_BASE_URL}/auth/verify", headers=headers)
-        data = response.json()
+        response = await client.get("/auth/verify", headers=headers)
+        data = _json_loads(response.content)
         
         passed = (
             response.status_code == 200 and
@@ -138,11 +166,11 @@ def test_token_verification(token):
         print_test("Token Verification", False, f"Error: {str(e)}")
         return False
 
-def test_invalid_token():
+async def test_invalid_token(client):
     """Test 7: Invalid Token Rejection"""
     try:
         headers = {"Authorization": "Bearer invalid_token_here"}
-        response = requests.get(f"{API_BASE_URL}/auth/verify", headers=headers)
+        response = await client.get("/auth/verify", headers=headers)
         
         # Should fail with 401
         passed = response.status_code == 401
@@ -153,11 +181,11 @@ def test_invalid_token():
         print_test("Invalid Token Rejection", False, f"Error: {str(e)}")
         return False
 
-def test_protected_endpoint(token):
+async def test_protected_endpoint(client, token):
     """Test 8: Protected Endpoint Access"""
     try:
         headers = {"Authorization": f"Bearer {token}"}
-        response = requests.get(f"{API_BASE_URL}/strategies/", headers=headers)
+        response = await client.get("/strategies/", headers=headers)
         
         passed = response.status_code in [200, 404]  # 200 with data, 404 if no strategies
         print_test("Protected Endpoint Access", passed, 
@@ -167,10 +195,10 @@ def test_protected_endpoint(token):
         print_test("Protected Endpoint Access", False, f"Error: {str(e)}")
         return False
 
-def test_protected_endpoint_without_token():
+async def test_protected_endpoint_without_token(client):
     """Test 9: Protected Endpoint Without Token"""
     try:
-        response = requests.get(f"{API_BASE_URL}/strategies/")
+        response = await client.get("/strategies/")
         
         # Should fail with 401 or 403
         passed = response.status_code in [401, 403]
@@ -181,16 +209,16 @@ def test_protected_endpoint_without_token():
         print_test("Protected Endpoint Without Token", False, f"Error: {str(e)}")
         return False
 
-def test_change_password(token, old_password):
+async def test_change_password(client, token, old_password):
     """Test 10: Password Change"""
     try:
-        headers = {"Authorization": f"Bearer {token}"}
+        headers = {"Authorization": f"Bearer {token}", **_JSON_HEADERS}
         payload = {
             "current_password": old_password,
             "new_password": "newpassword123"
         }
-        response = requests.post(f"{API_BASE_URL}/auth/change-password", 
-                               json=payload, headers=headers)
+        response = await client.post("/auth/change-password", 
+                                     content=_json_dumps(payload), headers=headers)
         
         passed = response.status_code == 200
         print_test("Password Change", passed, f"Status: {response.status_code}")
@@ -199,14 +227,14 @@ def test_change_password(token, old_password):
         print_test("Password Change", False, f"Error: {str(e)}")
         return False
 
-def test_login_with_new_password(email):
+async def test_login_with_new_password(client, email):
     """Test 11: Login With New Password"""
     try:
         payload = {
             "email": email,
             "password": "newpassword123"
         }
-        response = requests.post(f"{API_BASE_URL}/auth/login", json=payload)
+        response = await client.post("/auth/login", content=_json_dumps(payload), headers=_JSON_HEADERS)
         
         passed = response.status_code == 200
         print_test("Login With New Password", passed, 
@@ -216,11 +244,11 @@ def test_login_with_new_password(email):
         print_test("Login With New Password", False, f"Error: {str(e)}")
         return False
 
-def test_logout(token):
+async def test_logout(client, token):
     """Test 12: User Logout"""
     try:
         headers = {"Authorization": f"Bearer {token}"}
-        response = requests.post(f"{API_BASE_URL}/auth/logout", headers=headers)
+        response = await client.post("/auth/logout", headers=headers)
         
         passed = response.status_code == 200
         print_test("User Logout", passed, f"Status: {response.status_code}")
@@ -229,7 +257,7 @@ def test_logout(token):
         print_test("User Logout", False, f"Error: {str(e)}")
         return False
 
-def main():
+async def main():
     print(f"\n{Colors.BLUE}{'='*60}")
     print("AURELIUS Authentication Integration Tests")
     print(f"{'='*60}{Colors.END}\n")
@@ -238,41 +266,43 @@ def main():
 
     results = []
     
-    # Run all tests
-    results.append(test_health_check())
-    
-    reg_passed, token, email, password = test_user_registration()
-    results.append(reg_passed)
-    
-    if not reg_passed:
-        print(f"\n{Colors.RED}Registration failed - stopping tests{Colors.END}\n")
-        return
-    
-    results.append(test_duplicate_registration(email))
-    
-    login_passed, login_token = test_user_login(email, password)
-    results.append(login_passed)
-    
-    results.append(test_invalid_login())
-    
-    if login_token:
-        results.append(test_token_verification(login_token))
-    
-    results.append(test_invalid_token())
-    
-    if login_token:
-        results.append(test_protected_endpoint(login_token))
-    
-    results.append(test_protected_endpoint_without_token())
-    
-    if login_token:
-        results.append(test_change_password(login_token, password))
-        results.append(test_login_with_new_password(email))
+    # One keep-alive client for the whole run; paths are relative to the API base
+    async with httpx.AsyncClient(base_url=API_BASE_URL, timeout=30.0) as client:
+        # Tests that don't depend on a registered user run concurrently
+        results.extend(await asyncio.gather(
+            test_health_check(client),
+            test_invalid_login(client),
+            test_invalid_token(client),
+            test_protected_endpoint_without_token(client)
+        ))
+        
+        # The registration chain runs in order
+        reg_passed, token, email, password = await test_user_registration(client)
+        results.append(reg_passed)
+        
+        if not reg_passed:
+            print(f"\n{Colors.RED}Registration failed - stopping tests{Colors.END}\n")
+            return
+        
+        results.append(await test_duplicate_registration(client, email))
+        
+        login_passed, login_token = await test_user_login(client, email, password)
+        results.append(login_passed)
         
-        # Get new token after password change
-        _, new_token = test_user_login(email, "newpassword123")
-        if new_token:
-            results.append(test_logout(new_token))
+        if login_token:
+            # Read-only checks on the same token overlap; the password
+            # change below must wait for them
+            results.extend(await asyncio.gather(
+                test_token_verification(client, login_token),
+                test_protected_endpoint(client, login_token)
+            ))
+            results.append(await test_change_password(client, login_token, password))
+            results.append(await test_login_with_new_password(client, email))
+            
+            # Get new token after password change
+            _, new_token = await test_user_login(client, email, "newpassword123")
+            if new_token:
+                results.append(await test_logout(client, new_token))
     
     # Summary
     print(f"\n{Colors.BLUE}{'='*60}")
@@ -298,7 +328,7 @@ def main():
 
 if __name__ == "__main__":
     try:
-        main()
+        asyncio.run(main())
     except KeyboardInterrupt:
         print(f"\n{Colors.YELLOW}Tests interrupted by user{Colors.END}\n")
     except Exception as e:
@@ -2,100 +2,287 @@
 Load testing suite for AURELIUS API
 Tests API performance under load using concurrent requests
 """
+import argparse
 import asyncio
-import aiohttp
+import csv
+import httpx
+import json
+import numpy as np
 import time
-import statistics
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Union
 import sys
 
+try:
+    import uvloop
+    HAS_UVLOOP = True
+except ImportError:
+    HAS_UVLOOP = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# orjson encodes/decodes in C when installed; request bodies are sent pre-encoded
+if HAS_ORJSON:
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+else:
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+_JSON_HEADERS = {"content-type": "application/json"}
+
+# Registration body serialized once; each request only substitutes the email
+_REGISTER_TEMPLATE = _json_dumps({
+    "email": "%s",
+    "password": "testpassword123",
+    "name": "Load Test User"
+})
+
 API_BASE_URL = "http://localhost:8000/api"
 
+# Escape codes only when writing to a terminal; redirected logs get plain text
+_TTY = sys.stdout.isatty()
+
 
 class Colors:
-    GREEN = '\033[92m'
-    RED = '\033[91m'
-    YELLOW = '\033[93m'
-    BLUE = '\033[94m'
-    CYAN = '\033[96m'
-    END = '\033[0m'
+    GREEN = '\033[92m' if _TTY else ''
+    RED = '\033[91m' if _TTY else ''
+    YELLOW = '\033[93m' if _TTY else ''
+    BLUE = '\033[94m' if _TTY else ''
+    CYAN = '\033[96m' if _TTY else ''
+    END = '\033[0m' if _TTY else ''
+
+
+class TokenBucket:
+    """Token bucket admitting requests at a steady rate
+    
+    A refill task adds rate/10 tokens every 100 ms, capped at one second's
+    worth, so bursts never exceed the target rate.
+    """
+    
+    def __init__(self, rate: float, interval: float = 0.1):
+        self.rate = rate
+        self.interval = interval
+        self.cap = max(1, int(rate))
+        self._tokens = asyncio.Semaphore(0)
+        self._available = 0
+    
+    async def acquire(self):
+        """Wait for and take one token"""
+        await self._tokens.acquire()
+        self._available -= 1
+    
+    async def refill(self):
+        """Top the bucket up every interval until cancelled"""
+        loop = asyncio.get_running_loop()
+        last = loop.time()
+        pending = self.rate * self.interval
+        while True:
+            # Credit elapsed time rather than ticks so sleep overshoot does not lower the rate
+            whole = min(int(pending), self.cap - self._available)
+            pending -= int(pending)
+            for _ in range(whole):
+                self._tokens.release()
+            self._available += max(whole, 0)
+            await asyncio.sleep(self.interval)
+            now = loop.time()
+            pending += self.rate * (now - last)
+            last = now
 
 
 class LoadTester:
-    """Load testing utility for API endpoints"""
+    """Load testing utility for API endpoints
+    
+    Results are stored column-wise in preallocated arrays indexed by request
+    id instead of one dict per request.
+    """
     
-    def __init__(self, base_url: str = API_BASE_URL):
+    def __init__(
+        self,
+        base_url: str = API_BASE_URL,
+        capacity: int = 10000,
+        concurrency: int = 32,
+        log_path: Optional[str] = "loadtest_log.csv"
+    ):
         self.base_url = base_url
-        self.results = []
+        # In-flight cap; the default matches the pool size so latencies
+        # exclude time spent queueing for a connection
+        self.concurrency = concurrency
+        self.capacity = capacity
+        self.status_arr = np.zeros(capacity, dtype=np.int32)
+        self.time_ns_arr = np.zeros(capacity, dtype=np.int64)
+        self.success_arr = np.zeros(capacity, dtype=bool)
+        self.endpoint_idx = np.zeros(capacity, dtype=np.int16)
+        # Endpoint intern table; endpoint_idx holds positions in this list
+        self.endpoints: List[str] = []
+        self._endpoint_ids: Dict[str, int] = {}
+        self._next_idx = 0
+        # Raw per-request rows for later analysis; 64 KB buffered, flushed on aclose
+        self._log_file = None
+        self._csv = None
+        if log_path:
+            self._log_file = open(log_path, "w", newline="", buffering=1 << 16)
+            self._csv = csv.writer(self._log_file)
+            self._csv.writerow(("timestamp_ns", "endpoint", "method", "status", "latency_ns", "success"))
+        # One pooled keep-alive client for every request this tester makes;
+        # 32 sockets saturate a local server without file-descriptor pressure,
+        # and idle connections are kept for a minute so every run reuses them.
+        # Endpoints are relative and resolved against base_url, parsed once here
+        self.client = httpx.AsyncClient(
+            base_url=base_url,
+            limits=httpx.Limits(
+                max_connections=32,
+                max_keepalive_connections=32,
+                keepalive_expiry=60
+            ),
+            timeout=30.0
+        )
+    
+    async def aclose(self):
+        """Close the pooled client and the request log"""
+        await self.client.aclose()
+        if self._log_file is not None:
+            self._log_file.close()
+    
+    def reserve(self, n: int = 1) -> slice:
+        """Reserve n consecutive result slots, growing the buffers if they are full"""
+        start = self._next_idx
+        end = start + n
+        if end > self.capacity:
+            capacity = max(end, 2 * self.capacity)
+            for name in ("status_arr", "time_ns_arr", "success_arr", "endpoint_idx"):
+                grown = np.zeros(capacity, dtype=getattr(self, name).dtype)
+                grown[:start] = getattr(self, name)[:start]
+                setattr(self, name, grown)
+            self.capacity = capacity
+        self._next_idx = end
+        return slice(start, end)
+    
+    def _intern_endpoint(self, endpoint: str) -> int:
+        """Return the intern table index for an endpoint"""
+        endpoint_id = self._endpoint_ids.get(endpoint)
+        if endpoint_id is None:
+            endpoint_id = self._endpoint_ids[endpoint] = len(self.endpoints)
+            self.endpoints.append(endpoint)
+        return endpoint_id
     
     async def make_request(
         self,
-        session: aiohttp.ClientSession,
         method: str,
         endpoint: str,
+        idx: int,
+        read_body: bool = False,
         **kwargs
-    ) -> Dict[str, Any]:
-        """Make a single HTTP request and measure time"""
-        start_time = time.time()
-        url = f"{self.base_url}{endpoint}"
+    ) -> Optional[Any]:
+        """
+        Make a single HTTP request and record its result in slot idx
+        
+        The body is drained without being buffered or decoded unless
+        read_body is set, in which case a JSON body is returned.
+        """
+        self.endpoint_idx[idx] = self._intern_endpoint(endpoint)
+        timestamp_ns = time.time_ns()
+        start_ns = time.perf_counter_ns()
+        body = None
         
         try:
-            async with session.request(method, url, **kwargs) as response:
-                await response.text()
-                elapsed = time.time() - start_time
-                
-                return {
-                    "success": True,
-                    "status": response.status,
-                    "time": elapsed,
-                    "endpoint": endpoint,
-                }
-        except Exception as e:
-            elapsed = time.time() - start_time
-            return {
-                "success": False,
-                "error": str(e),
-                "time": elapsed,
-                "endpoint": endpoint,
-            }
+            async with self.client.stream(method, endpoint, **kwargs) as response:
+                if read_body:
+                    await response.aread()
+                else:
+                    # Drained (not just closed) so the connection returns to the pool
+                    async for _ in response.aiter_raw():
+                        pass
+            self.time_ns_arr[idx] = time.perf_counter_ns() - start_ns
+            self.status_arr[idx] = response.status_code
+            self.success_arr[idx] = True
+            if read_body and response.headers.get("content-type", "").startswith("application/json"):
+                body = _json_loads(response.content)
+        except Exception:
+            self.time_ns_arr[idx] = time.perf_counter_ns() - start_ns
+            self.status_arr[idx] = 0
+            self.success_arr[idx] = False
+        if self._csv is not None:
+            self._csv.writerow((
+                timestamp_ns, endpoint, method, self.status_arr[idx],
+                self.time_ns_arr[idx], int(self.success_arr[idx])
+            ))
+        return body
+    
+    async def _rate_limited_worker(
+        self,
+        sem: asyncio.Semaphore,
+        rate_bucket: Optional[TokenBucket],
+        method: str,
+        endpoint: str,
+        idx: int,
+        **kwargs
+    ):
+        """Wait for a token when rate limited, then make the request within the in-flight cap"""
+        if rate_bucket is not None:
+            await rate_bucket.acquire()
+        async with sem:
+            await self.make_request(method, endpoint, idx, **kwargs)
     
     async def concurrent_requests(
         self,
         method: str,
         endpoint: str,
         num_requests: int,
+        rps: Optional[float] = None,
         **kwargs
-    ) -> List[Dict[str, Any]]:
-        """Make multiple concurrent requests to an endpoint"""
-        async with aiohttp.ClientSession() as session:
-            tasks = [
-                self.make_request(session, method, endpoint, **kwargs)
-                for _ in range(num_requests)
-            ]
-            return await asyncio.gather(*tasks)
-    
-    def calculate_stats(self, results: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Calculate statistics from request results"""
-        times = [r["time"] for r in results]
-        successes = [r for r in results if r.get("success")]
-        failures = [r for r in results if not r.get("success")]
+    ) -> slice:
+        """
+        Make multiple concurrent requests to an endpoint; returns their result slots
         
-        if not times:
+        At most self.concurrency requests are in flight at once. With rps set,
+        requests are also admitted at rps per second, so the run takes about
+        num_requests/rps. An unexpected error cancels the remaining requests.
+        """
+        slots = self.reserve(num_requests)
+        sem = asyncio.Semaphore(self.concurrency)
+        rate_bucket = TokenBucket(rps) if rps is not None else None
+        refill = asyncio.create_task(rate_bucket.refill()) if rate_bucket is not None else None
+        try:
+            async with asyncio.TaskGroup() as tg:
+                for idx in range(slots.start, slots.stop):
+                    tg.create_task(self._rate_limited_worker(
+                        sem, rate_bucket, method, endpoint, idx, **kwargs
+                    ))
+        finally:
+            if refill is not None:
+                refill.cancel()
+        return slots
+    
+    def calculate_stats(self, slots: Union[slice, np.ndarray]) -> Dict[str, Any]:
+        """Calculate statistics for the result slots selected by a slice or index array"""
+        # Latencies are monotonic integer nanoseconds; converted to seconds once
+        times = self.time_ns_arr[slots] * 1e-9
+        if times.size == 0:
             return {}
         
+        successful = int(np.count_nonzero(self.success_arr[slots]))
+        # One partition pass for all three percentiles
+        p50, p95, p99 = np.percentile(times, [50, 95, 99])
+        
         return {
-            "total_requests": len(results),
-            "successful": len(successes),
-            "failed": len(failures),
-            "success_rate": (len(successes) / len(results)) * 100,
-            "total_time": sum(times),
-            "avg_time": statistics.mean(times),
-            "median_time": statistics.median(times),
-            "min_time": min(times),
-            "max_time": max(times),
-            "p95_time": statistics.quantiles(times, n=20)[18] if len(times) > 1 else max(times),
-            "p99_time": statistics.quantiles(times, n=100)[98] if len(times) > 1 else max(times),
+            "total_requests": int(times.size),
+            "successful": successful,
+            "failed": int(times.size) - successful,
+            "success_rate": (successful / times.size) * 100,
+            "total_time": float(times.sum()),
+            "avg_time": float(times.mean()),
+            "median_time": float(p50),
+            "min_time": float(times.min()),
+            "max_time": float(times.max()),
+            "p95_time": float(p95),
+            "p99_time": float(p99),
         }
     
     def print_stats(self, endpoint: str, stats: Dict[str, Any]):
@@ -119,74 +306,108 @@ class LoadTester:
         print(f"  Requests/sec:    {stats['total_requests']/stats['total_time']:.2f}")
 
 
-async def test_health_endpoint(tester: LoadTester, num_requests: int = 100):
+async def test_health_endpoint(tester: LoadTester, num_requests: int = 100, rps: Optional[float] = None):
     """Test /health endpoint"""
     print(f"\n{Colors.BLUE}Testing /health endpoint with {num_requests} requests...{Colors.END}")
-    results = await tester.concurrent_requests("GET", "/health", num_requests)
-    stats = tester.calculate_stats(results)
+    slots = await tester.concurrent_requests("GET", "/health", num_requests, rps=rps)
+    stats = tester.calculate_stats(slots)
     tester.print_stats("/health", stats)
     return stats
 
 
-async def test_metrics_endpoint(tester: LoadTester, num_requests: int = 50):
+async def test_metrics_endpoint(tester: LoadTester, num_requests: int = 50, rps: Optional[float] = None):
     """Test /metrics endpoint"""
     print(f"\n{Colors.BLUE}Testing /metrics endpoint with {num_requests} requests...{Colors.END}")
-    results = await tester.concurrent_requests("GET", "/metrics", num_requests)
-    stats = tester.calculate_stats(results)
+    slots = await tester.concurrent_requests("GET", "/metrics", num_requests, rps=rps)
+    stats = tester.calculate_stats(slots)
     tester.print_stats("/metrics", stats)
     return stats
 
 
-async def test_strategies_list(tester: LoadTester, token: str, num_requests: int = 50):
-    """Test /strategies/ list endpoint"""
-    print(f"\n{Colors.BLUE}Testing /strategies/ endpoint with {num_requests} requests...{Colors.END}")
-    headers = {"Authorization": f"Bearer {token}"}
-    results = await tester.concurrent_requests(
-        "GET", "/strategies/", num_requests, headers=headers
+async def test_strategies_list(
+    tester: LoadTester,
+    token: Optional[str],
+    num_requests: int = 50,
+    rps: Optional[float] = None
+):
+    """Test /strategies/ list endpoint; without a token this is the no-auth baseline"""
+    label = "/strategies/" if token else "/strategies/ (no auth)"
+    print(f"\n{Colors.BLUE}Testing {label} endpoint with {num_requests} requests...{Colors.END}")
+    headers = {"Authorization": f"Bearer {token}"} if token else {}
+    slots = await tester.concurrent_requests(
+        "GET", "/strategies/", num_requests, rps=rps, headers=headers
     )
-    stats = tester.calculate_stats(results)
-    tester.print_stats("/strategies/", stats)
+    stats = tester.calculate_stats(slots)
+    tester.print_stats(label, stats)
     return stats
 
 
-async def test_backtests_list(tester: LoadTester, token: str, num_requests: int = 50):
+async def test_backtests_list(tester: LoadTester, token: str, num_requests: int = 50, rps: Optional[float] = None):
     """Test /backtests/ list endpoint"""
     print(f"\n{Colors.BLUE}Testing /backtests/ endpoint with {num_requests} requests...{Colors.END}")
     headers = {"Authorization": f"Bearer {token}"}
-    results = await tester.concurrent_requests(
-        "GET", "/backtests/", num_requests, headers=headers
+    slots = await tester.concurrent_requests(
+        "GET", "/backtests/", num_requests, rps=rps, headers=headers
     )
-    stats = tester.calculate_stats(results)
+    stats = tester.calculate_stats(slots)
     tester.print_stats("/backtests/", stats)
     return stats
 
 
+async def simulate_user(tester: LoadTester, i: int) -> Dict[str, int]:
+    """Run one virtual user's register -> verify -> list journey; returns each step's result slot"""
+    payload = _REGISTER_TEMPLATE % f"load_{i}_{time.time_ns()}@example.com".encode()
+    slots = tester.reserve(3)
+    steps = {"register": slots.start}
+    body = await tester.make_request(
+        "POST", "/auth/register", slots.start, read_body=True,
+        content=payload, headers=_JSON_HEADERS
+    )
+    token = (body or {}).get("access_token")
+    if not token:
+        # Without a token the journey stops; count the registration as failed
+        tester.success_arr[slots.start] = False
+        return steps
+    
+    headers = {"Authorization": f"Bearer {token}"}
+    steps["verify"] = slots.start + 1
+    await tester.make_request("GET", "/auth/verify", steps["verify"], headers=headers)
+    steps["strategies"] = slots.start + 2
+    await tester.make_request("GET", "/strategies/", steps["strategies"], headers=headers)
+    return steps
+
+
+async def test_user_journeys(tester: LoadTester, num_users: int = 20):
+    """Test concurrent end-to-end user journeys"""
+    print(f"\n{Colors.BLUE}Testing {num_users} concurrent user journeys...{Colors.END}")
+    journeys = await asyncio.gather(*(simulate_user(tester, i) for i in range(num_users)))
+    
+    stats = {}
+    for step in ("register", "verify", "strategies"):
+        slots = np.array([journey[step] for journey in journeys if step in journey], dtype=np.intp)
+        stats[step] = tester.calculate_stats(slots)
+        if stats[step]:
+            tester.print_stats(f"user journey: {step}", stats[step])
+    return stats
+
+
 async def register_test_user(tester: LoadTester) -> str:
     """Register a test user and return token"""
-    test_email = f"loadtest_{int(time.time())}@example.com"
-    payload = {
-        "email": test_email,
-        "password": "testpassword123",
-        "name": "Load Test User"
-    }
-    
-    async with aiohttp.ClientSession() as session:
-        result = await tester.make_request(
-            session, "POST", "/auth/register", json=payload
-        )
-        
-        if result.get("success"):
-            # Get token from response
-            async with session.post(
-                f"{tester.base_url}/auth/register",
-                json=payload
-            ) as response:
-                data = await response.json()
-                return data.get("access_token", "")
-        return ""
-
-
-async def main():
+    payload = _REGISTER_TEMPLATE % f"loadtest_{int(time.time())}@example.com".encode()
+    
+    # A single registration; the token comes from the same response
+    idx = tester.reserve().start
+    body = await tester.make_request(
+        "POST", "/auth/register", idx, read_body=True,
+        content=payload, headers=_JSON_HEADERS
+    )
+    
+    if tester.success_arr[idx] and body:
+        return body.get("access_token", "")
+    return ""
+
+
+async def main(no_auth_baseline: bool = False, rps: Optional[float] = None):
     """Run load tests"""
     print(f"\n{Colors.CYAN}{'='*70}")
     print("AURELIUS API Load Testing Suite")
@@ -195,10 +416,21 @@ async def main():
     print(f"Test started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
     
     tester = LoadTester()
-    
+    try:
+        await run_load_tests(tester, no_auth_baseline, rps)
+    finally:
+        await tester.aclose()
+
+
+async def run_load_tests(
+    tester: LoadTester,
+    no_auth_baseline: bool = False,
+    rps: Optional[float] = None
+):
+    """Run every endpoint load test and print the summary"""
     # Test public endpoints
-    health_stats = await test_health_endpoint(tester, num_requests=100)
-    metrics_stats = await test_metrics_endpoint(tester, num_requests=50)
+    health_stats = await test_health_endpoint(tester, num_requests=100, rps=rps)
+    metrics_stats = await test_metrics_endpoint(tester, num_requests=50, rps=rps)
     
     # Register user for authenticated endpoints
     print(f"\n{Colors.BLUE}Registering test user...{Colors.END}")
@@ -207,12 +439,29 @@ async def main():
     if token:
         print(f"{Colors.GREEN}✓ Test user registered{Colors.END}")
         
+        # Verify the token once so the timed runs below measure steady-state
+        # requests, not first-use setup
+        await tester.make_request(
+            "GET", "/auth/verify", tester.reserve().start,
+            headers={"Authorization": f"Bearer {token}"}
+        )
+        
         # Test authenticated endpoints
-        await test_strategies_list(tester, token, num_requests=50)
-        await test_backtests_list(tester, token, num_requests=50)
+        auth_stats = await test_strategies_list(tester, token, num_requests=50, rps=rps)
+        await test_backtests_list(tester, token, num_requests=50, rps=rps)
+        
+        if no_auth_baseline:
+            # Same endpoint without a token; the difference approximates the
+            # per-request cost of token verification
+            baseline_stats = await test_strategies_list(tester, None, num_requests=50, rps=rps)
+            auth_cost = auth_stats["avg_time"] - baseline_stats["avg_time"]
+            print(f"\n{Colors.YELLOW}Auth overhead (/strategies/ avg):{Colors.END} {auth_cost*1000:.2f} ms")
     else:
         print(f"{Colors.RED}✗ Failed to register test user{Colors.END}")
     
+    # Concurrent registration -> verify -> list chains, one per virtual user
+    await test_user_journeys(tester, num_users=20)
+    
     # Summary
     print(f"\n{Colors.CYAN}{'='*70}")
     print("Load Testing Summary")
@@ -221,8 +470,8 @@ async def main():
     all_stats = [health_stats, metrics_stats]
     total_requests = sum(s.get("total_requests", 0) for s in all_stats)
     total_successful = sum(s.get("successful", 0) for s in all_stats)
-    avg_success_rate = statistics.mean([s.get("success_rate", 0) for s in all_stats])
-    avg_response_time = statistics.mean([s.get("avg_time", 0) for s in all_stats])
+    avg_success_rate = float(np.mean([s.get("success_rate", 0) for s in all_stats]))
+    avg_response_time = float(np.mean([s.get("avg_time", 0) for s in all_stats]))
     
     print(f"Total Requests:        {total_requests}")
     print(f"Total Successful:      {Colors.GREEN}{total_successful}{Colors.END}")
@@ -240,8 +489,27 @@ async def main():
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--no-auth-baseline",
+        action="store_true",
+        help="also load /strategies/ without a token and report the auth overhead"
+    )
+    parser.add_argument(
+        "--rps",
+        type=float,
+        default=None,
+        help="admit endpoint load requests at this rate instead of all at once"
+    )
+    args = parser.parse_args()
+    
+    # libuv-backed event loop when available; the client's own work then
+    # costs less CPU at high concurrency
+    if HAS_UVLOOP:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    
     try:
-        asyncio.run(main())
+        asyncio.run(main(no_auth_baseline=args.no_auth_baseline, rps=args.rps))
     except KeyboardInterrupt:
         print(f"\n{Colors.YELLOW}Load testing interrupted{Colors.END}\n")
     except Exception as e:
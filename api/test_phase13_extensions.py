@@ -4,6 +4,7 @@ Custom indicators and multi-asset support
 """
 import pytest
 import numpy as np
+import api.advanced.indicators as indicators_module
 from api.advanced.indicators import (
     calculate_indicator,
     calculate_multiple_indicators,
@@ -12,7 +13,12 @@ from api.advanced.indicators import (
     RSI,
     MACD,
     BollingerBands,
-    ATR
+    ATR,
+    calculate_sma,
+    calculate_rsi,
+    calculate_bbands,
+    calculate_atr,
+    HAS_CUPY
 )
 from api.advanced.multi_asset import (
     AssetClass,
@@ -25,6 +31,45 @@ from api.advanced.multi_asset import (
 from datetime import datetime
 
 
+@pytest.fixture(scope="module")
+def market_data():
+    """Random series shared by this module, generated once from one PCG64 stream"""
+    rng = np.random.default_rng(42)
+    n = 50
+    
+    close_50 = rng.standard_normal(n)
+    close_50 *= 5
+    close_50 += 100
+    
+    # Random walk built in place: cumsum writes back into the draw buffer
+    walk = rng.standard_normal(n)
+    walk *= 2
+    np.cumsum(walk, out=walk)
+    walk += 100
+    high = walk + np.abs(rng.standard_normal(n))
+    low = walk - np.abs(rng.standard_normal(n))
+    
+    returns_252x3 = rng.standard_normal((3, 252))
+    returns_252x3 *= np.array([[0.02], [0.018], [0.019]])
+    market_252 = rng.standard_normal(252) * 0.01
+    asset_252 = 1.2 * market_252 + rng.standard_normal(252) * 0.005
+    returns_1000 = rng.standard_normal(1000) * 0.01
+    
+    data = {
+        "close_50": close_50,
+        "hlc_50": {"high": high, "low": low, "close": walk},
+        "returns_252x3": returns_252x3,
+        "market_252": market_252,
+        "asset_252": asset_252,
+        "returns_1000": returns_1000,
+    }
+    # Shared across tests, so guard against in-place modification
+    for value in data.values():
+        for array in (value.values() if isinstance(value, dict) else (value,)):
+            array.setflags(write=False)
+    return data
+
+
 class TestCustomIndicators:
     """Test custom indicators framework"""
     
@@ -66,6 +111,25 @@ class TestCustomIndicators:
         assert np.all(valid_rsi >= 0)
         assert np.all(valid_rsi <= 100)
     
+    @pytest.mark.parametrize("bad_value", [np.nan, np.inf])
+    def test_rsi_bad_close_only_affects_its_windows(self, market_data, bad_value):
+        """Test a NaN/inf close affects only the RSI windows around it"""
+        close = market_data["close_50"].copy()
+        close[20] = bad_value
+        period = 5
+        
+        rsi = calculate_indicator('rsi', {'close': close}, period=period)['rsi']
+        
+        deltas = np.diff(close)
+        with np.errstate(invalid='ignore'):
+            gains = np.convolve(np.where(deltas > 0, deltas, 0), np.ones(period) / period, mode='valid')
+            losses = np.convolve(np.where(deltas < 0, -deltas, 0), np.ones(period) / period, mode='valid')
+            expected = np.full(len(close), np.nan)
+            expected[period:] = 100 - 100 / (1 + gains / np.where(losses == 0, 1e-10, losses))
+        
+        np.testing.assert_allclose(rsi, expected, rtol=1e-9, equal_nan=True)
+        assert np.isfinite(rsi[20 + period + 1:]).all()
+    
     def test_macd_calculation(self):
         """Test MACD indicator"""
         close = np.linspace(100, 120, 50)  # Trending upward
@@ -78,10 +142,9 @@ class TestCustomIndicators:
         assert 'histogram' in result
         assert len(result['macd']) == len(close)
     
-    def test_bollinger_bands(self):
+    def test_bollinger_bands(self, market_data):
         """Test Bollinger Bands"""
-        close = np.random.randn(50) * 5 + 100
-        data = {'close': close}
+        data = {'close': market_data["close_50"]}
         
         result = calculate_indicator('bbands', data, period=20, std_dev=2)
         
@@ -93,15 +156,10 @@ class TestCustomIndicators:
         assert result['upper'][valid_idx] > result['middle'][valid_idx]
         assert result['middle'][valid_idx] > result['lower'][valid_idx]
     
-    def test_atr_calculation(self):
+    def test_atr_calculation(self, market_data):
         """Test Average True Range"""
-        np.random.seed(42)
-        n = 50
-        close = np.cumsum(np.random.randn(n) * 2) + 100
-        high = close + np.abs(np.random.randn(n))
-        low = close - np.abs(np.random.randn(n))
-        
-        data = {'high': high, 'low': low, 'close': close}
+        data = market_data["hlc_50"]
+        close = data['close']
         
         result = calculate_indicator('atr', data, period=14)
         
@@ -111,10 +169,104 @@ class TestCustomIndicators:
         valid_atr = result['atr'][~np.isnan(result['atr'])]
         assert np.all(valid_atr > 0)
     
-    def test_multiple_indicators(self):
+    def test_kernels_match_numpy_reference(self, market_data):
+        """Test loop kernels against direct NumPy formulas"""
+        close = market_data["hlc_50"]["close"]
+        period = 10
+        
+        sma = calculate_indicator('sma', {'close': close}, period=period)['sma']
+        bands = calculate_indicator('bbands', {'close': close}, period=period, std_dev=2)
+        rsi = calculate_indicator('rsi', {'close': close}, period=period)['rsi']
+        
+        windows = np.lib.stride_tricks.sliding_window_view(close, period)
+        assert np.allclose(sma[period - 1:], windows.mean(axis=1))
+        assert np.allclose(bands['upper'][period - 1:], windows.mean(axis=1) + 2 * windows.std(axis=1))
+        
+        deltas = np.diff(close)
+        gains = np.lib.stride_tricks.sliding_window_view(np.clip(deltas, 0, None), period).mean(axis=1)
+        losses = np.lib.stride_tricks.sliding_window_view(np.clip(-deltas, 0, None), period).mean(axis=1)
+        assert np.isnan(rsi[:period]).all()
+        assert np.allclose(rsi[period:], 100 - 100 / (1 + gains / losses))
+    
+    def test_typed_functions_match_registry(self, market_data):
+        """Test the array-level functions return the registry's outputs"""
+        data = market_data["hlc_50"]
+        close = data['close']
+        
+        np.testing.assert_array_equal(calculate_sma(close, 10), calculate_indicator('sma', data, period=10)['sma'])
+        np.testing.assert_array_equal(calculate_rsi(close, 10), calculate_indicator('rsi', data, period=10)['rsi'])
+        np.testing.assert_array_equal(calculate_atr(data['high'], data['low'], close, 10), calculate_indicator('atr', data, period=10)['atr'])
+        upper, middle, lower = calculate_bbands(close, 10, 2.0)
+        bands = BollingerBands(period=10, std_dev=2.0).calculate(data)
+        np.testing.assert_array_equal(upper, bands['upper'])
+        np.testing.assert_array_equal(lower, bands['lower'])
+        
+        with pytest.raises(ValueError):
+            calculate_indicator('sma', {'open': close}, period=10)
+        with pytest.raises(ValueError):
+            calculate_indicator('unknown', data)
+    
+    def test_backend_selection(self, market_data):
+        """Test backend='numpy' matches the default and bad backends are rejected"""
+        close = market_data["close_50"]
+        returns = {str(i): r for i, r in enumerate(market_data["returns_252x3"])}
+        analyzer = CrossAssetAnalyzer([])
+        
+        np.testing.assert_array_equal(calculate_sma(close, 10, backend="numpy"), calculate_sma(close, 10))
+        np.testing.assert_array_equal(
+            analyzer.calculate_correlation_matrix(returns, backend="numpy"),
+            analyzer.calculate_correlation_matrix(returns)
+        )
+        with pytest.raises(ValueError):
+            calculate_indicator('bbands', {'close': close}, backend="tpu")
+        with pytest.raises(ValueError):
+            analyzer.calculate_correlation_matrix(returns, backend="tpu")
+        if not HAS_CUPY:
+            with pytest.raises(ValueError):
+                calculate_sma(close, 10, backend="cupy")
+    
+    def test_short_series_is_all_nan(self):
+        """Test series shorter than the period yield NaN instead of failing"""
+        result = calculate_indicator('sma', {'close': np.array([100, 101, 102])}, period=5)
+        
+        assert np.isnan(result['sma']).all()
+    
+    @pytest.mark.parametrize("bad_value", [np.nan, np.inf])
+    @pytest.mark.parametrize("use_bottleneck", [False, True])
+    def test_sma_nan_only_blanks_its_windows(self, market_data, monkeypatch, use_bottleneck, bad_value):
+        """Test a NaN/inf affects only the SMA windows that contain it"""
+        if use_bottleneck and not indicators_module.HAS_BOTTLENECK:
+            pytest.skip("bottleneck not installed")
+        monkeypatch.setattr(indicators_module, "HAS_BOTTLENECK", use_bottleneck)
+        close = market_data["close_50"].copy()
+        close[20] = bad_value
+        
+        sma = calculate_sma(close, 5)
+        expected = np.full(len(close), np.nan)
+        expected[4:] = np.convolve(close, np.ones(5) / 5, mode='valid')
+        
+        assert np.isfinite(sma).sum() == len(close) - 4 - 5
+        np.testing.assert_allclose(sma, expected, rtol=1e-12, equal_nan=True)
+    
+    def test_float32_opt_in(self):
+        """Test indicators can run in float32 and reject non-float dtypes"""
+        data = {'close': np.array([100, 102, 101, 103, 105, 104, 106, 108, 107, 109])}
+        
+        result = calculate_indicator('sma', data, period=5, dtype=np.float32)
+        
+        assert result['sma'].dtype == np.float32
+        assert abs(result['sma'][4] - 102.2) < 0.1
+        with pytest.raises(ValueError):
+            calculate_indicator('sma', data, period=5, dtype=np.int32)
+        
+        # Long series: float32 output, but the window sum must not drift
+        walk = np.cumsum(np.random.default_rng(0).standard_normal(200_000)) * 0.1 + 1000
+        sma32 = calculate_sma(walk, 20, dtype=np.float32)
+        assert np.nanmax(np.abs(sma32 - calculate_sma(walk, 20))) < 1e-3
+    
+    def test_multiple_indicators(self, market_data):
         """Test calculating multiple indicators at once"""
-        close = np.random.randn(50) * 5 + 100
-        data = {'close': close}
+        data = {'close': market_data["close_50"]}
         
         indicators = [
             {"name": "sma", "params": {"period": 20}},
@@ -128,6 +280,83 @@ class TestCustomIndicators:
         assert 'ema' in results
         assert 'rsi' in results
     
+    def test_fused_indicators_match_individual(self, market_data):
+        """Test the single-pass SMA/EMA/RSI path agrees with separate calls"""
+        with_nan = market_data["close_50"].copy()
+        with_nan[25] = np.nan
+        with_inf = market_data["close_50"].copy()
+        with_inf[25] = np.inf
+        specs = [
+            {"name": "rsi", "params": {"period": 14}},
+            {"name": "sma", "params": {"period": 20}},
+            {"name": "ema", "params": {"period": 10}}
+        ]
+        
+        for close in (market_data["close_50"], with_nan, with_inf):
+            data = {'close': close}
+            results = calculate_multiple_indicators(specs, data)
+            
+            assert list(results) == ['rsi', 'sma', 'ema']
+            for spec in specs:
+                expected = calculate_indicator(spec["name"], data, **spec["params"])
+                for key, values in expected.items():
+                    np.testing.assert_allclose(results[spec["name"]][key], values, rtol=1e-12, equal_nan=True)
+            if close is with_nan:
+                assert np.isnan(results['sma']['sma']).sum() == 19 + 20
+        # The inf delta only touches the RSI windows that contain it
+        assert np.isfinite(results['rsi']['rsi'][41:]).all()
+    
+    def test_streaming_matches_bulk(self, market_data):
+        """Test per-tick indicators reproduce the bulk values at every index"""
+        data = market_data["hlc_50"]
+        close = data['close']
+        
+        for key, params, output in [
+            ('sma', {'period': 10}, 'sma'),
+            ('ema', {'period': 10}, 'ema'),
+            ('rsi', {'period': 14}, 'rsi'),
+        ]:
+            stream = indicator_registry.get(key, mode="stream", **params)
+            ticks = np.array([stream.update(x) for x in close])
+            assert np.allclose(ticks, calculate_indicator(key, data, **params)[output], equal_nan=True)
+        
+        # An inf close only blanks the RSI windows whose deltas include it
+        with_inf = close.copy()
+        with_inf[25] = np.inf
+        stream = indicator_registry.get('rsi', mode="stream", period=14)
+        ticks = np.array([stream.update(x) for x in with_inf])
+        expected = calculate_indicator('rsi', {'close': with_inf}, period=14)['rsi']
+        np.testing.assert_allclose(ticks, expected, equal_nan=True)
+        assert np.isfinite(ticks[41:]).all()
+        
+        bands = calculate_indicator('bbands', data, period=20, std_dev=2)
+        stream = indicator_registry.get('bbands', mode="stream", period=20, std_dev=2)
+        ticks = np.array([stream.update(x) for x in close])
+        assert np.allclose(ticks[:, 0], bands['upper'], equal_nan=True)
+        assert np.allclose(ticks[:, 2], bands['lower'], equal_nan=True)
+        
+        stream = indicator_registry.get('atr', mode="stream", period=14)
+        ticks = np.array([stream.update(h, l, c) for h, l, c in zip(data['high'], data['low'], close)])
+        assert np.allclose(ticks, calculate_indicator('atr', data, period=14)['atr'], equal_nan=True)
+    
+    def test_streaming_recovers_after_nan(self, market_data):
+        """Test a NaN tick only affects the streaming windows that contain it"""
+        close = market_data["close_50"].copy()
+        close[15] = np.nan
+        data = {'close': close}
+        
+        stream = indicator_registry.get('sma', mode="stream", period=10)
+        ticks = np.array([stream.update(x) for x in close])
+        np.testing.assert_allclose(ticks, calculate_indicator('sma', data, period=10)['sma'], equal_nan=True)
+        assert np.isfinite(ticks[25:]).all()
+        
+        bands = calculate_indicator('bbands', data, period=10, std_dev=2)
+        stream = indicator_registry.get('bbands', mode="stream", period=10, std_dev=2)
+        ticks = np.array([stream.update(x) for x in close])
+        for column, key in enumerate(('upper', 'middle', 'lower')):
+            np.testing.assert_allclose(ticks[:, column], bands[key], equal_nan=True)
+        assert np.isfinite(ticks[25:]).all()
+    
     def test_indicator_registry(self):
         """Test indicator registry"""
         indicators = indicator_registry.list_indicators()
@@ -212,15 +441,25 @@ class TestMultiAsset:
         # Put should have positive gamma
         assert result['gamma'] > 0
     
-    def test_correlation_matrix(self):
-        """Test correlation matrix calculation"""
-        np.random.seed(42)
+    def test_option_pricing_batch(self):
+        """Test batch pricing matches the scalar path contract by contract"""
+        asset = AssetMetadata("TEST", AssetClass.OPTION, "TEST", "USD")
+        pricer = OptionPricer(asset)
+        strikes = np.linspace(50.0, 150.0, 1000)
+        is_call = np.arange(1000) % 2 == 0
         
-        returns = {
-            'AAPL': np.random.randn(252) * 0.02,
-            'MSFT': np.random.randn(252) * 0.018,
-            'GOOGL': np.random.randn(252) * 0.019
-        }
+        batch = pricer.black_scholes_batch(100.0, strikes, 0.25, 0.20, 0.05, is_call)
+        
+        for i in range(0, 1000, 37):
+            single = pricer.black_scholes(
+                100.0, strikes[i], 0.25, 0.20, 0.05, 'call' if is_call[i] else 'put'
+            )
+            for key, value in single.items():
+                assert batch[key][i] == pytest.approx(value, rel=1e-12, abs=1e-15)
+    
+    def test_correlation_matrix(self, market_data):
+        """Test correlation matrix calculation"""
+        returns = dict(zip(['AAPL', 'MSFT', 'GOOGL'], market_data["returns_252x3"]))
         
         analyzer = CrossAssetAnalyzer([])
         corr_matrix = analyzer.calculate_correlation_matrix(returns)
@@ -234,12 +473,10 @@ class TestMultiAsset:
         assert np.all(corr_matrix >= -1)
         assert np.all(corr_matrix <= 1)
     
-    def test_beta_calculation(self):
+    def test_beta_calculation(self, market_data):
         """Test beta calculation"""
-        np.random.seed(42)
-        
-        market_returns = np.random.randn(252) * 0.01
-        asset_returns = 1.2 * market_returns + np.random.randn(252) * 0.005
+        market_returns = market_data["market_252"]
+        asset_returns = market_data["asset_252"]
         
         analyzer = CrossAssetAnalyzer([])
         beta = analyzer.calculate_beta_to_market(asset_returns, market_returns)
@@ -258,9 +495,10 @@ class TestMultiAsset:
         portfolio = MultiAssetPortfolio(assets)
         
         # Add positions
-        portfolio.add_position("AAPL", 100, 150.0, datetime.now())
-        portfolio.add_position("ESZ23", 5, 4500.0, datetime.now())
-        portfolio.add_position("BTC-USD", 0.5, 45000.0, datetime.now())
+        ts = datetime.now()
+        portfolio.add_position("AAPL", 100, 150.0, ts)
+        portfolio.add_position("ESZ23", 5, 4500.0, ts)
+        portfolio.add_position("BTC-USD", 0.5, 45000.0, ts)
         
         assert len(portfolio.positions) == 3
         
@@ -270,7 +508,7 @@ class TestMultiAsset:
         
         # Expected: 100*155 + 5*4550*50 + 0.5*46000
         expected = 15500 + 1137500 + 23000
-        assert abs(total_value - expected) < 1.0
+        assert abs(total_value - expected) < 1e-9
         
         # Calculate P&L
         pnl = portfolio.calculate_portfolio_pnl(current_prices)
@@ -281,7 +519,99 @@ class TestMultiAsset:
         
         # Expected P&L: (155-150)*100 + (4550-4500)*5*50 + (46000-45000)*0.5
         expected_pnl = 500 + 12500 + 500
-        assert abs(pnl['total_pnl'] - expected_pnl) < 1.0
+        assert abs(pnl['total_pnl'] - expected_pnl) < 1e-9
+    
+    def test_position_replaced_not_duplicated(self):
+        """Test re-adding a symbol replaces its position"""
+        portfolio = MultiAssetPortfolio([AssetMetadata("AAPL", AssetClass.STOCK, "NASDAQ", "USD")])
+        portfolio.add_position("AAPL", 100, 150.0, datetime.now())
+        portfolio.add_position("AAPL", 40, 160.0, datetime.now())
+        
+        assert len(portfolio.positions) == 1
+        assert portfolio.positions["AAPL"]["size"] == 40
+        assert portfolio.calculate_portfolio_value({"AAPL": 170.0}) == 40 * 170.0
+        with pytest.raises(ValueError):
+            portfolio.add_position("MSFT", 1, 1.0, datetime.now())
+    
+    def test_update_and_remove_position(self):
+        """Test positions change through methods, not the read-only snapshot"""
+        assets = [
+            AssetMetadata("AAPL", AssetClass.STOCK, "NASDAQ", "USD"),
+            AssetMetadata("ESZ23", AssetClass.FUTURE, "CME", "USD", contract_size=50),
+            AssetMetadata("BTC-USD", AssetClass.CRYPTO, "COINBASE", "USD")
+        ]
+        portfolio = MultiAssetPortfolio(assets)
+        portfolio.add_position("AAPL", 100, 150.0, datetime.now())
+        portfolio.add_position("ESZ23", 5, 4500.0, datetime.now())
+        portfolio.add_position("BTC-USD", 0.5, 45000.0, datetime.now())
+        prices = {"AAPL": 160.0, "ESZ23": 4600.0, "BTC-USD": 46000.0}
+        portfolio.calculate_portfolio_value(prices)
+        
+        with pytest.raises(TypeError):
+            portfolio.positions["AAPL"] = {"size": 1}
+        with pytest.raises(TypeError):
+            portfolio.positions["AAPL"]["size"] = 1
+        
+        portfolio.update_position("AAPL", size=40)
+        portfolio.remove_position("ESZ23")
+        assert list(portfolio.positions) == ["AAPL", "BTC-USD"]
+        assert portfolio.positions["AAPL"]["size"] == 40
+        assert portfolio.positions["AAPL"]["entry_price"] == 150.0
+        assert portfolio.calculate_portfolio_value(prices) == 40 * 160.0 + 0.5 * 46000.0
+        assert portfolio.get_exposure_by_class(prices) == {"stock": 40 * 160.0, "crypto": 0.5 * 46000.0}
+        
+        portfolio.add_position("ESZ23", 1, 4400.0, datetime.now())
+        assert list(portfolio.positions) == ["AAPL", "BTC-USD", "ESZ23"]
+        assert portfolio.calculate_portfolio_pnl(prices)["pnl_by_asset"]["ESZ23"] == 200.0 * 50
+        portfolio.remove_position("ESZ23")
+        with pytest.raises(ValueError):
+            portfolio.remove_position("ESZ23")
+        with pytest.raises(ValueError):
+            portfolio.update_position("ESZ23", size=1)
+    
+    def test_positions_batch_matches_single_adds(self):
+        """Test a batch add matches sequential add_position calls"""
+        assets = [
+            AssetMetadata("AAPL", AssetClass.STOCK, "NASDAQ", "USD"),
+            AssetMetadata("ESZ23", AssetClass.FUTURE, "CME", "USD", contract_size=50),
+            AssetMetadata("BTC-USD", AssetClass.CRYPTO, "COINBASE", "USD")
+        ]
+        items = [("AAPL", 100, 150.0), ("ESZ23", 5, 4500.0), ("AAPL", 40, 160.0), ("BTC-USD", 0.5, 45000.0)]
+        ts = datetime.now()
+        
+        single = MultiAssetPortfolio(assets)
+        single.add_position("ESZ23", 1, 4400.0, ts)
+        for symbol, size, entry_price in items:
+            single.add_position(symbol, size, entry_price, ts)
+        batch = MultiAssetPortfolio(assets)
+        batch.add_position("ESZ23", 1, 4400.0, ts)
+        batch.add_positions_batch(items, ts)
+        
+        assert batch.positions == single.positions
+        assert all(p["entry_time"] is ts for p in batch.positions.values())
+        with pytest.raises(ValueError):
+            batch.add_positions_batch([("AAPL", 1, 1.0), ("MSFT", 1, 1.0)])
+        assert batch.positions == single.positions
+    
+    def test_price_lookup_tracks_quotes(self):
+        """Test reused prices follow dict mutation, new symbols and missing quotes"""
+        assets = [
+            AssetMetadata("AAPL", AssetClass.STOCK, "NASDAQ", "USD"),
+            AssetMetadata("BTC", AssetClass.CRYPTO, "COINBASE", "USD")
+        ]
+        portfolio = MultiAssetPortfolio(assets)
+        portfolio.add_position("AAPL", 10, 100.0, datetime.now())
+        
+        prices = {"AAPL": 110.0, "BTC": 50000.0}
+        assert portfolio.calculate_portfolio_value(prices) == 1100.0
+        prices["AAPL"] = 120.0
+        assert portfolio.calculate_portfolio_value(prices) == 1200.0
+        
+        portfolio.add_position("BTC", 1, 45000.0, datetime.now())
+        assert portfolio.calculate_portfolio_value(prices) == 51200.0
+        # Unquoted symbols are valued at their entry price
+        assert portfolio.calculate_portfolio_value({"AAPL": 120.0}) == 46200.0
+        assert portfolio.calculate_portfolio_pnl(prices)["total_pnl"] == 5200.0
     
     def test_exposure_by_class(self):
         """Test exposure breakdown by asset class"""
@@ -292,9 +622,10 @@ class TestMultiAsset:
         ]
         
         portfolio = MultiAssetPortfolio(assets)
-        portfolio.add_position("AAPL", 100, 150.0, datetime.now())
-        portfolio.add_position("MSFT", 50, 300.0, datetime.now())
-        portfolio.add_position("BTC", 1, 45000.0, datetime.now())
+        portfolio.add_positions_batch(
+            [("AAPL", 100, 150.0), ("MSFT", 50, 300.0), ("BTC", 1, 45000.0)],
+            datetime.now()
+        )
         
         current_prices = {"AAPL": 150.0, "MSFT": 300.0, "BTC": 45000.0}
         exposure = portfolio.get_exposure_by_class(current_prices)
@@ -302,14 +633,13 @@ class TestMultiAsset:
         assert 'stock' in exposure
         assert 'crypto' in exposure
         # Stock exposure: 100*150 + 50*300 = 30000
-        assert abs(exposure['stock'] - 30000) < 1.0
+        assert abs(exposure['stock'] - 30000) < 1e-9
         # Crypto exposure: 1*45000 = 45000
-        assert abs(exposure['crypto'] - 45000) < 1.0
+        assert abs(exposure['crypto'] - 45000) < 1e-9
     
-    def test_var_by_asset_class(self):
+    def test_var_by_asset_class(self, market_data):
         """Test VaR calculation with asset class multipliers"""
-        np.random.seed(42)
-        returns = np.random.randn(1000) * 0.01
+        returns = market_data["returns_1000"]
         
         stock_var = AssetRiskModel.calculate_var_by_asset_class(
             AssetClass.STOCK, returns, 0.95
@@ -321,6 +651,33 @@ class TestMultiAsset:
         
         # Crypto VaR should be more conservative (larger negative)
         assert crypto_var < stock_var
+        assert abs(stock_var - np.percentile(returns, 5)) < 1e-12
+    
+    def test_var_batch_matches_single(self, market_data):
+        """Test batched VaR matches per-asset VaR row by row"""
+        returns = market_data["returns_252x3"]
+        classes = [AssetClass.STOCK, AssetClass.FUTURE, AssetClass.CRYPTO]
+        
+        for confidence in (0.90, 0.95, 0.99):
+            batch = AssetRiskModel.calculate_var_batch(classes, returns, confidence)
+            single = [
+                AssetRiskModel.calculate_var_by_asset_class(c, r, confidence)
+                for c, r in zip(classes, returns)
+            ]
+            np.testing.assert_allclose(batch, single, rtol=0, atol=1e-15)
+        
+        with pytest.raises(ValueError):
+            AssetRiskModel.calculate_var_batch(classes[:2], returns)
+    
+    def test_var_with_missing_return_is_nan(self, market_data):
+        """Test a NaN return gives NaN VaR instead of being dropped"""
+        returns = market_data["returns_252x3"].copy()
+        returns[1, 100] = np.nan
+        classes = [AssetClass.STOCK, AssetClass.FUTURE, AssetClass.CRYPTO]
+        
+        assert np.isnan(AssetRiskModel.calculate_var_by_asset_class(AssetClass.STOCK, returns[1]))
+        batch = AssetRiskModel.calculate_var_batch(classes, returns)
+        assert np.isnan(batch).tolist() == [False, True, False]
     
     def test_margin_requirements(self):
         """Test margin requirement calculation"""
@@ -8,6 +8,9 @@ Tests cover:
 - Edge cases (2 runs, many runs, extreme values)
 - Validation errors (single run, negative values, invalid threshold)
 """
+import statistics
+
+import numpy as np
 import pytest
 from datetime import datetime
 from fastapi.testclient import TestClient
@@ -15,7 +18,12 @@ from main import app
 from services.determinism_scoring import (
     DeterminismScoringService,
     DeterminismScoreRequest,
-    BacktestRun
+    BacktestRun,
+    _METRIC_ORDER,
+    _THRESH_ARR,
+    _TRADE_COUNT_INDEX,
+    _WEIGHTS_ARR,
+    _score_core
 )
 
 
@@ -151,6 +159,22 @@ class TestDeterminismScoringService:
         assert result.variance_metrics["total_return"] < 1e-10
         assert result.variance_metrics["trade_count"] == 0.0
     
+    def test_identical_runs_fast_path_returns_fresh_response(self, perfect_deterministic_runs):
+        """Test identical runs short-circuit without sharing the canonical response."""
+        request = DeterminismScoreRequest(
+            strategy_id="test-strat",
+            runs=perfect_deterministic_runs,
+            threshold=95.0
+        )
+        
+        first = DeterminismScoringService.score_determinism(request)
+        first.variance_metrics["total_return"] = 1.0
+        second = DeterminismScoringService.score_determinism(request)
+        
+        assert second.score == 100.0
+        assert second.p_value == 0.0
+        assert second.variance_metrics["total_return"] == 0.0
+    
     def test_slight_variance(self, slight_variance_runs):
         """Test slight variance returns score between 95-99."""
         request = DeterminismScoreRequest(
@@ -305,6 +329,102 @@ class TestDeterminismScoringService:
         assert result.passed is False
         assert len(result.issues) > 2  # Should detect multiple issues
     
+    def test_repeated_scoring_uses_cache(self, slight_variance_runs):
+        """Test identical run-sets reuse the memoized score without sharing state."""
+        DeterminismScoringService.cache_clear()
+        request = DeterminismScoreRequest(
+            strategy_id="test-strat",
+            runs=slight_variance_runs,
+            threshold=95.0
+        )
+        
+        first = DeterminismScoringService.score_determinism(request)
+        first.issues.append("mutated by caller")
+        second = DeterminismScoringService.score_determinism(
+            DeterminismScoreRequest(
+                strategy_id="other-strat",
+                runs=list(reversed(slight_variance_runs)),
+                threshold=95.0
+            )
+        )
+        
+        assert second.score == first.score
+        assert "mutated by caller" not in second.issues
+    
+    def test_vectorized_metric_scores_match_scalar(self):
+        """Test vectorized metric scoring agrees with the per-metric formula."""
+        variances = np.array([0.0, 5e-9, 2e-3, 1.5, 1e-7])
+        
+        scores = DeterminismScoringService.calculate_metric_scores(variances)
+        
+        for index, metric in enumerate(_METRIC_ORDER):
+            expected = DeterminismScoringService.calculate_metric_score(
+                variances[index],
+                DeterminismScoringService.PERFECT_VARIANCE_THRESHOLDS[metric],
+                is_count=metric == "trade_count"
+            )
+            assert scores[index] == pytest.approx(expected)
+    
+    def test_pair_variances_match_general_path(self, high_variance_runs):
+        """Test the two-run closed form agrees with the N-run variance pipeline."""
+        first, second = (
+            (r.total_return, r.sharpe_ratio, r.max_drawdown, r.trade_count, r.final_portfolio_value)
+            for r in high_variance_runs
+        )
+        
+        variances = DeterminismScoringService._pair_variances(first, second)
+        
+        for index, column in enumerate(zip(first, second)):
+            if index == _TRADE_COUNT_INDEX:
+                expected = statistics.stdev(column)
+            else:
+                expected = DeterminismScoringService.calculate_coefficient_of_variation(list(column))
+            assert variances[index] == pytest.approx(expected)
+    
+    def test_from_payload_matches_model_request(self, slight_variance_runs):
+        """Test raw payload scoring matches scoring a constructed request."""
+        payload = {
+            "strategy_id": "test-strat",
+            "runs": [run.model_dump() for run in slight_variance_runs],
+            "threshold": 95.0
+        }
+        
+        from_payload = DeterminismScoringService.from_payload(payload)
+        from_request = DeterminismScoringService.score_determinism(
+            DeterminismScoreRequest(**payload)
+        )
+        
+        assert from_payload == from_request
+    
+    def test_from_payload_validates_input(self):
+        """Test raw payload scoring still enforces request validation."""
+        with pytest.raises(ValueError):
+            DeterminismScoringService.from_payload({
+                "strategy_id": "test-strat",
+                "runs": [],
+                "threshold": 150.0
+            })
+    
+    def test_score_core_matches_reference_pipeline(self):
+        """Test the fused scoring kernel agrees with the per-metric pipeline."""
+        metrics = np.array([
+            [0.150, 1.80, 0.120, 42, 115000.0],
+            [0.151, 1.81, 0.121, 42, 115050.0],
+            [0.149, 1.79, 0.119, 44, 114950.0],
+            [0.150, 1.80, 0.120, 42, 115000.0],
+        ])
+        
+        overall, variances, _ = _score_core(metrics, _WEIGHTS_ARR, _THRESH_ARR, _TRADE_COUNT_INDEX)
+        
+        for index, column in enumerate(metrics.T.tolist()):
+            if index == _TRADE_COUNT_INDEX:
+                expected = statistics.stdev(column)
+            else:
+                expected = DeterminismScoringService.calculate_coefficient_of_variation(column)
+            assert variances[index] == pytest.approx(expected)
+        expected_scores = DeterminismScoringService.calculate_metric_scores(variances)
+        assert overall == pytest.approx(float(expected_scores @ _WEIGHTS_ARR))
+    
     def test_validation_min_runs(self):
         """Test validation requires at least 2 runs."""
         with pytest.raises(ValueError):
@@ -13,6 +13,10 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../.
 
 from main import app
 from security.auth import create_access_token, hash_api_key
+from services.evidence_classification import (
+    EvidenceClassificationService,
+    EvidenceClassifyRequest,
+)
 
 client = TestClient(app)
 
@@ -471,5 +475,64 @@ class TestEvidenceProductionMetrics:
                 assert data["classification"] == "contract-valid-failure"
 
 
+class TestEvidenceClassificationBatch:
+    """Test batch classification at the service layer."""
+
+    def test_batch_matches_single_classification(self, fresh_timestamp, stale_timestamp):
+        """Test batch results match classifying each item individually."""
+        requests = [
+            EvidenceClassifyRequest(
+                evidence_id="batch_001",
+                evidence_type="gate_check",
+                data={"dev_status": 200, "crv_status": 200, "product_status": 200},
+                timestamp=fresh_timestamp
+            ),
+            EvidenceClassifyRequest(
+                evidence_id="batch_002",
+                evidence_type="backtest",
+                data={"sharpe_ratio": 1.5, "max_drawdown": 0.2},
+                timestamp=stale_timestamp
+            ),
+        ]
+
+        results = EvidenceClassificationService.classify_evidence_batch(requests)
+
+        assert [r.evidence_id for r in results] == ["batch_001", "batch_002"]
+        for request, result in zip(requests, results):
+            single = EvidenceClassificationService.classify_evidence(
+                evidence_id=request.evidence_id,
+                evidence_type=request.evidence_type,
+                data=request.data,
+                timestamp=request.timestamp,
+                max_age_hours=request.max_age_hours
+            )
+            assert result.classification == single.classification
+            assert result.details.is_fresh == single.details.is_fresh
+            assert result.details.missing_fields == single.details.missing_fields
+
+    def test_batch_gate_checks_vectorized(self, fresh_timestamp):
+        """Test vectorized gate-check batch covers every status-code outcome."""
+        statuses = [
+            ((200, 200, 200), "contract-valid-success"),
+            ((200, 404, 422), "contract-valid-failure"),
+            ((200, 500, 200), "contract-invalid-failure"),
+            ((0, 200, 200), "contract-invalid-failure"),
+            ((200, 200, 404), "mixed"),
+        ]
+        requests = [
+            EvidenceClassifyRequest(
+                evidence_id=f"gate_{index}",
+                evidence_type="gate_check",
+                data={"dev_status": dev, "crv_status": crv, "product_status": product},
+                timestamp=fresh_timestamp
+            )
+            for index, ((dev, crv, product), _) in enumerate(statuses)
+        ]
+
+        results = EvidenceClassificationService.classify_evidence_batch(requests)
+
+        assert [r.classification.value for r in results] == [expected for _, expected in statuses]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
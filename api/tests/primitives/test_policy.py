@@ -12,6 +12,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../.
 
 from main import app
 from security.auth import create_access_token, hash_api_key
+from services.policy_checking import PolicyCheckingService, PolicyRule
 
 client = TestClient(app)
 
@@ -440,5 +441,73 @@ class TestPolicyPrimitiveValidation:
             assert response.status_code in [422, 500]
 
 
+class TestPolicyCheckingServiceFastFail:
+    """Test the fast-fail path at the service layer."""
+
+    def test_fast_fail_stops_at_first_blocker(self):
+        """Test fast_fail stops after the first error-severity violation."""
+        context = {
+            "max_drawdown": 0.40,
+            "max_leverage": 3.0,
+            "lineage_complete": False,
+            "governance_compliant": False,
+            "turnover_rate": 8.0
+        }
+
+        full = PolicyCheckingService.check_policies("fast_fail_v1", context)
+        fast = PolicyCheckingService.check_policies("fast_fail_v1", context, fast_fail=True)
+
+        assert full.passed is False
+        assert fast.passed is False
+        assert len(full.checks) == 5
+        assert [c.rule_id for c in fast.checks] == ["max_drawdown_regulatory"]
+        assert fast.blockers == full.blockers[:1]
+        assert fast.compliance_score == 0.0
+
+    def test_fast_fail_matches_full_run_when_compliant(self):
+        """Test fast_fail evaluates every rule when nothing blocks."""
+        context = {
+            "max_drawdown": 0.10,
+            "max_leverage": 1.0,
+            "lineage_complete": True,
+            "governance_compliant": True,
+            "turnover_rate": 8.0
+        }
+
+        full = PolicyCheckingService.check_policies("fast_fail_v2", context)
+        fast = PolicyCheckingService.check_policies("fast_fail_v2", context, fast_fail=True)
+
+        assert fast == full
+        assert fast.passed is True
+        assert len(fast.warnings) == 1
+
+
+class TestPolicyCheckingServiceCustomRules:
+    """Test custom rule dispatch at the service layer."""
+
+    def test_custom_rules_keep_order_and_duplicates(self):
+        """Test mixed known and unknown rules are reported in request order."""
+        rules = [
+            PolicyRule(rule_id="custom_sector_cap", rule_type="business",
+                       description="Sector exposure capped", severity="warning"),
+            PolicyRule(rule_id="max_leverage_regulatory", rule_type="regulatory",
+                       description="Max leverage must not exceed 2x", severity="error"),
+            PolicyRule(rule_id="custom_sector_cap", rule_type="business",
+                       description="Sector exposure capped again", severity="info"),
+        ]
+
+        result = PolicyCheckingService.check_policies(
+            "custom_rules_v1", {"max_leverage": 3.0}, rules
+        )
+
+        assert [c.rule_id for c in result.checks] == [
+            "custom_sector_cap", "max_leverage_regulatory", "custom_sector_cap"
+        ]
+        assert result.checks[0].passed is True
+        assert result.checks[0].message == "Sector exposure capped - evaluation pending"
+        assert result.checks[1].passed is False
+        assert result.blockers == ["max_leverage_regulatory: Max leverage is 3.0x (limit: 2.0x)"]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
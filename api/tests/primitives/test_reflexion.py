@@ -12,6 +12,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../.
 
 from main import app
 from security.auth import create_access_token, hash_api_key
+from services.reflexion_feedback import ReflexionFeedbackService
 
 client = TestClient(app)
 
@@ -461,5 +462,21 @@ class TestReflexionMultipleStrategies:
                 assert len(data["suggestions"]) > 0
 
 
+class TestReflexionFeedbackService:
+    """Test reflexion feedback at the service layer."""
+
+    def test_improvement_score_deterministic_and_bounded(self):
+        """Test the derived score is stable and stays within [-2.0, 2.0]."""
+        for iteration in range(1, 50):
+            first = ReflexionFeedbackService._derive_improvement_score(
+                "score_check", iteration, "volatility feedback"
+            )
+            second = ReflexionFeedbackService._derive_improvement_score(
+                "score_check", iteration, "volatility feedback"
+            )
+            assert first == second
+            assert -2.0 <= first <= 2.0
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
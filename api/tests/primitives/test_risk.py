@@ -12,6 +12,14 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../.
 
 from main import app
 from security.auth import create_access_token, hash_api_key
+import numpy as np
+from services.risk_validation import (
+    RiskValidateRequest,
+    RiskValidationService,
+    _CHECK_DIRECTIONS,
+    _CHECK_IS_ERROR,
+    _score_batch
+)
 
 client = TestClient(app)
 
@@ -334,5 +342,96 @@ class TestRiskPrimitiveValidation:
             assert response.status_code in [200, 422]
 
 
+class TestRiskValidationServiceModes:
+    """Test validation modes at the service layer."""
+
+    def test_first_failure_stops_at_first_error(self):
+        """Test first_failure mode exits on the first failed error check."""
+        metrics = {
+            "sharpe_ratio": 0.2,
+            "sortino_ratio": 0.3,
+            "max_drawdown": 0.45,
+            "volatility": 0.50
+        }
+
+        result = RiskValidationService.validate_risk_metrics(
+            "first_failure_v1", metrics, mode="first_failure"
+        )
+
+        assert result.passed is False
+        assert [c.check_name for c in result.checks] == ["Max Drawdown"]
+        assert len(result.recommendations) == 1
+
+    def test_first_failure_verdict_matches_thorough(self, risk_request_payload):
+        """Test both modes agree on the verdict."""
+        passing = risk_request_payload["metrics"]
+        failing_warning = {**passing, "volatility": 0.45}
+        failing_error = {**passing, "sharpe_ratio": 0.5}
+
+        for metrics in (passing, failing_warning, failing_error):
+            thorough = RiskValidationService.validate_risk_metrics("modes_v1", metrics)
+            fast = RiskValidationService.validate_risk_metrics(
+                "modes_v1", metrics, mode="first_failure"
+            )
+            assert fast.passed == thorough.passed
+
+    def test_unknown_mode_rejected(self):
+        """Test unknown validation modes raise ValueError."""
+        with pytest.raises(ValueError):
+            RiskValidationService.validate_risk_metrics("modes_v2", {}, mode="sampled")
+
+
+class TestRiskValidationServiceBatch:
+    """Test batch validation at the service layer."""
+
+    def test_batch_matches_single_validation(self, risk_request_payload):
+        """Test batch results match validating each strategy individually."""
+        requests = [
+            RiskValidateRequest(strategy_id="batch_pass", metrics=risk_request_payload["metrics"]),
+            RiskValidateRequest(
+                strategy_id="batch_fail",
+                metrics={"sharpe_ratio": 0.4, "max_drawdown": 0.35, "volatility": 0.40}
+            ),
+            RiskValidateRequest(
+                strategy_id="batch_custom",
+                metrics={"sharpe_ratio": 0.8},
+                thresholds={"min_sharpe": 0.5, "min_sortino": None, "max_drawdown": None}
+            ),
+        ]
+
+        results = RiskValidationService.validate_risk_metrics_batch(requests)
+
+        assert [r.strategy_id for r in results] == ["batch_pass", "batch_fail", "batch_custom"]
+        for request, result in zip(requests, results):
+            single = RiskValidationService.validate_risk_metrics(
+                request.strategy_id, request.metrics, request.thresholds
+            )
+            assert result == single
+
+    def test_score_batch_kernel(self):
+        """Test the batch kernel's mask, scores and error counts."""
+        metric_matrix = np.array([
+            [1.5, 1.8, 0.15, -0.03, -0.07, 0.8, 0.25],
+            [0.5, 1.8, 0.35, -0.03, -0.07, 0.8, 0.45],
+        ])
+        threshold_matrix = np.array([
+            [1.0, 1.2, 0.20, -0.05, -0.10, 0.5, 0.30],
+            [1.0, np.nan, 0.20, -0.05, -0.10, 0.5, 0.30],
+        ])
+
+        passed_mask, risk_scores, failed_errors = _score_batch(
+            metric_matrix, threshold_matrix, _CHECK_DIRECTIONS, _CHECK_IS_ERROR
+        )
+
+        assert passed_mask[0].all()
+        assert passed_mask[1].tolist() == [False, False, False, True, True, True, False]
+        assert risk_scores.tolist() == [100.0, pytest.approx(50.0)]
+        assert failed_errors.tolist() == [0, 2]
+
+    def test_empty_batch(self):
+        """Test an empty batch returns no results."""
+        assert RiskValidationService.validate_risk_metrics_batch([]) == []
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
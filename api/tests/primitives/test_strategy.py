@@ -0,0 +1,226 @@
+"""
+Strategy primitive tests covering verification checks and result memoization.
+"""
+import pytest
+import sys
+import os
+import warnings
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from datetime import datetime
+from types import SimpleNamespace
+
+import numpy as np
+
+from services import strategy_verification
+from services.strategy_verification import (
+    StrategyType,
+    StrategyVerificationService,
+    _check_ranges,
+    _now_iso
+)
+
+
+@pytest.fixture
+def momentum_parameters():
+    """Valid momentum strategy parameters."""
+    return {
+        "lookback": 20,
+        "vol_target": 0.15,
+        "position_size": 0.25,
+        "stop_loss": 0.02,
+        "take_profit": 0.05
+    }
+
+
+class TestStrategyVerificationMemoization:
+    """Test memoized verification at the service layer."""
+
+    def setup_method(self):
+        StrategyVerificationService.cache_clear()
+
+    def test_repeat_verification_matches(self, momentum_parameters):
+        """Test a repeated verification returns the same result with a fresh strategy_id."""
+        first = StrategyVerificationService.verify_strategy("memo_a", "momentum", momentum_parameters)
+        second = StrategyVerificationService.verify_strategy("memo_b", "momentum", momentum_parameters)
+
+        assert first.valid is True
+        assert second.strategy_id == "memo_b"
+        assert first.model_dump(exclude={"strategy_id", "timestamp"}) == \
+            second.model_dump(exclude={"strategy_id", "timestamp"})
+
+    def test_value_type_is_part_of_key(self, momentum_parameters):
+        """Test equal values of different types are not conflated."""
+        as_int = StrategyVerificationService.verify_strategy("memo_c", "momentum", momentum_parameters)
+        as_float = StrategyVerificationService.verify_strategy(
+            "memo_c", "momentum", {**momentum_parameters, "lookback": 20.0}
+        )
+
+        assert as_int.valid is True
+        assert as_float.valid is False
+        assert "Parameter 'lookback' has wrong type (expected int)" in as_float.issues
+
+    def test_signed_zero_rendered_separately(self, momentum_parameters):
+        """Test 0.0 and -0.0 keep their own messages."""
+        positive = StrategyVerificationService.verify_strategy(
+            "memo_d", "momentum", {**momentum_parameters, "vol_target": 0.0}
+        )
+        negative = StrategyVerificationService.verify_strategy(
+            "memo_d", "momentum", {**momentum_parameters, "vol_target": -0.0}
+        )
+
+        assert any("value 0.0 " in c["message"] for c in positive.checks)
+        assert any("value -0.0 " in c["message"] for c in negative.checks)
+
+    def test_unhashable_parameters_bypass_cache(self, momentum_parameters):
+        """Test unhashable parameter values are still verified."""
+        result = StrategyVerificationService.verify_strategy(
+            "memo_e", "momentum", {**momentum_parameters, "lookback": [20]}
+        )
+
+        assert result.valid is False
+        assert "Parameter 'lookback' has wrong type (expected int)" in result.issues
+
+    def test_cached_response_serializes_cleanly(self):
+        """Test responses built from memoized issues dump without serializer warnings."""
+        StrategyVerificationService.verify_strategy("memo_f", "momentum", {"lookback": 20})
+        result = StrategyVerificationService.verify_strategy("memo_f", "momentum", {"lookback": 20})
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            dumped = result.model_dump()
+            result.model_dump_json()
+
+        assert dumped["issues"] == ["Missing parameter: vol_target", "Missing parameter: position_size"]
+        assert dumped["warnings"] == []
+
+
+class TestStrategyVerificationRanges:
+    """Test compiled parameter range checks."""
+
+    def setup_method(self):
+        StrategyVerificationService.cache_clear()
+
+    def test_bounds_are_inclusive(self, momentum_parameters):
+        """Test values equal to min or max pass."""
+        result = StrategyVerificationService.verify_strategy(
+            "range_a", "momentum", {**momentum_parameters, "lookback": 1, "vol_target": 1.0}
+        )
+
+        assert result.valid is True
+
+    def test_huge_integer_exceeds_maximum(self, momentum_parameters):
+        """Test integers too large for a float are still reported as out of range."""
+        result = StrategyVerificationService.verify_strategy(
+            "range_b", "momentum", {**momentum_parameters, "lookback": 10 ** 400}
+        )
+
+        assert result.valid is False
+        assert any("exceeds maximum 252" in c["message"] for c in result.checks)
+
+    def test_in_range_parameters_aggregated(self, momentum_parameters):
+        """Test passing parameters share one check but still count toward the score."""
+        result = StrategyVerificationService.verify_strategy("range_c", "momentum", momentum_parameters)
+
+        range_checks = [c for c in result.checks if c["check_name"] == "Parameter Ranges"]
+        assert len(range_checks) == 1
+        assert range_checks[0]["actual_value"] == 5
+        assert range_checks[0]["message"] == "All 5 parameters within valid range"
+        assert result.validation_score == 100.0
+        assert "(8/8 checks passed)" in result.summary
+
+    def test_partial_range_score(self, momentum_parameters):
+        """Test one out-of-range parameter weighs against the aggregated passes."""
+        result = StrategyVerificationService.verify_strategy(
+            "range_d", "momentum", {**momentum_parameters, "lookback": 0}
+        )
+
+        range_checks = [c for c in result.checks if c["check_name"] == "Parameter Ranges"]
+        assert range_checks[0]["message"] == "4 of 5 parameters within valid range"
+        assert result.validation_score == pytest.approx(7 / 8 * 100)
+
+    def test_strategy_type_enum_covers_rules(self):
+        """Test every rule set has a StrategyType and vice versa."""
+        assert {st.name.lower() for st in StrategyType} == set(StrategyVerificationService.PARAM_RULES)
+
+
+class TestStrategyVerificationTimestamp:
+    """Test the cached response timestamp."""
+
+    def test_timestamp_second_resolution(self, momentum_parameters):
+        """Test the timestamp is a UTC ISO string truncated to the second."""
+        result = StrategyVerificationService.verify_strategy("ts_a", "momentum", momentum_parameters)
+
+        parsed = datetime.fromisoformat(result.timestamp)
+        assert parsed.microsecond == 0
+        assert abs((datetime.utcnow() - parsed).total_seconds()) < 5
+
+    def test_timestamp_reused_within_second(self, monkeypatch):
+        """Test the same second returns the cached string and a new second a new one."""
+        clock = [1_700_000_000.25]
+        monkeypatch.setattr(strategy_verification, "time", SimpleNamespace(time=lambda: clock[0]))
+
+        first = _now_iso()
+        clock[0] = 1_700_000_000.75
+        second = _now_iso()
+        clock[0] = 1_700_000_001.0
+        third = _now_iso()
+
+        assert first == "2023-11-14T22:13:20"
+        assert second is first
+        assert third == "2023-11-14T22:13:21"
+
+
+class TestStrategyVerificationBatch:
+    """Test batch range checks for parameter sweeps."""
+
+    def test_batch_matches_single(self, momentum_parameters):
+        """Test each row agrees with verify_strategy's parameter checks."""
+        names = StrategyVerificationService.parameter_names("momentum")
+        rows = [
+            [momentum_parameters[n] for n in names],
+            [{**momentum_parameters, "lookback": 300}[n] for n in names],
+            [{**momentum_parameters, "lookback": 20.5}[n] for n in names],
+        ]
+
+        result = StrategyVerificationService.verify_strategy_batch("momentum", np.array(rows))
+
+        assert result.tolist() == [True, False, False]
+
+    def test_nan_marks_absent_parameter(self, momentum_parameters):
+        """Test NaN fails for required parameters and is allowed for optional ones."""
+        names = StrategyVerificationService.parameter_names("momentum")
+        base = [momentum_parameters[n] for n in names]
+        no_stop = list(base)
+        no_stop[names.index("stop_loss")] = np.nan
+        no_lookback = list(base)
+        no_lookback[names.index("lookback")] = np.nan
+
+        result = StrategyVerificationService.verify_strategy_batch("momentum", np.array([no_stop, no_lookback]))
+
+        assert result.tolist() == [True, False]
+
+    def test_rejects_unknown_type_and_bad_shape(self):
+        """Test unknown strategy types and wrong column counts raise."""
+        with pytest.raises(ValueError):
+            StrategyVerificationService.verify_strategy_batch("unknown", np.zeros((1, 5)))
+        with pytest.raises(ValueError):
+            StrategyVerificationService.verify_strategy_batch("momentum", np.zeros((1, 2)))
+
+    def test_kernel_flags_failures(self):
+        """Test the range kernel directly."""
+        values = np.array([[1.0, 0.5], [0.0, 0.5], [1.5, 0.5], [1.0, np.nan]])
+        mins = np.array([1.0, 0.0])
+        maxs = np.array([10.0, 1.0])
+        int_mask = np.array([True, False])
+        optional_mask = np.array([False, True])
+
+        fail = _check_ranges(values, mins, maxs, int_mask, optional_mask)
+
+        assert fail.tolist() == [False, True, True, False]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])